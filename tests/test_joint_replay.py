@@ -0,0 +1,82 @@
+"""JointRig.bake / clear 회귀 테스트 (python -m pytest tests)"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'usd_viewer'))
+
+pxr = pytest.importorskip('pxr')
+from pxr import Usd, UsdGeom, UsdPhysics, Gf
+
+from joint_replay import JointRig, JointTrajectory
+
+
+def make_two_link_rig():
+    """base(0,0,1) ─Z 회전→ link(1,0,1) ─Z 회전→ link2(2,0,1), 링크는 모두 /robot 바로 아래"""
+    stage = Usd.Stage.CreateInMemory()
+    UsdGeom.Xform.Define(stage, '/robot')
+    for name, x in (('base', 0.0), ('link', 1.0), ('link2', 2.0)):
+        UsdGeom.Xform.Define(stage, f'/robot/{name}').AddTranslateOp().Set(Gf.Vec3d(x, 0, 1))
+    for parent, child in (('base', 'link'), ('link', 'link2')):
+        joint = UsdPhysics.RevoluteJoint.Define(stage, f'/robot/{child}_joint')
+        joint.GetAxisAttr().Set('Z')
+        joint.GetBody0Rel().SetTargets([f'/robot/{parent}'])
+        joint.GetBody1Rel().SetTargets([f'/robot/{child}'])
+        joint.GetLocalPos0Attr().Set(Gf.Vec3f(1, 0, 0))
+        joint.GetLocalPos1Attr().Set(Gf.Vec3f(0, 0, 0))
+    return stage
+
+
+def world_position(stage, path, time):
+    prim = stage.GetPrimAtPath(path)
+    matrix = UsdGeom.Xformable(prim).ComputeLocalToWorldTransform(Usd.TimeCode(time))
+    return np.array(matrix.ExtractTranslation())
+
+
+def expected_position(rig, positions, link):
+    """solve() 결과로 계산한 링크 월드 위치 (부모는 모두 /robot, 항등 변환)"""
+    return rig.solve(positions)[link][:, 3, :3]
+
+
+@pytest.mark.parametrize('positions', [
+    [[np.pi / 2, 0.0], [np.pi / 2, np.pi / 2]],     # link는 로그 내내 같은 비영 각도
+    [[np.pi / 2, np.pi / 2]],                        # 한 프레임 로그
+])
+def test_bake_writes_links_held_away_from_rest(positions):
+    stage = make_two_link_rig()
+    rig = JointRig(stage)
+    result = rig.bake(JointTrajectory(positions, names=rig.names))
+    assert result['links'] == 2
+    
+    for frame in range(len(positions)):
+        for link in rig.links:
+            expected = expected_position(rig, positions, link)[frame]
+            np.testing.assert_allclose(world_position(stage, link, frame), expected, atol=1e-6)
+    
+    # 회전된 link 끝에 붙은 link2는 (1, 1, 1)로 이동
+    np.testing.assert_allclose(world_position(stage, '/robot/link2', 0), (1, 1, 1), atol=1e-6)
+
+
+def test_bake_skips_links_at_rest_pose():
+    stage = make_two_link_rig()
+    rig = JointRig(stage)
+    result = rig.bake(JointTrajectory([[0.0, 0.0], [0.0, 0.3]], names=rig.names))
+    assert result['links'] == 1
+    assert stage.GetSessionLayer().GetPrimAtPath('/robot/link') is None
+
+
+def test_clear_restores_session_layer():
+    stage = make_two_link_rig()
+    session = stage.GetSessionLayer()
+    before = session.ExportToString()
+    
+    rig = JointRig(stage)
+    rig.bake(JointTrajectory([[np.pi / 2, 0.0], [np.pi / 2, np.pi / 2]], names=rig.names))
+    rig.write_pose([0.1, 0.2])
+    rig.clear()
+    
+    assert session.ExportToString() == before
+    np.testing.assert_allclose(world_position(stage, '/robot/link2', 0), (2, 0, 1), atol=1e-6)
@@ -0,0 +1,25 @@
+"""parse_address 회귀 테스트 (python -m pytest tests)"""
+
+import socket
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'usd_viewer'))
+
+pytest.importorskip('pxr')
+from joint_stream import DEFAULT_PORT, parse_address
+
+
+@pytest.mark.parametrize('text, address', [
+    ('udp://127.0.0.1:9871', ('127.0.0.1', 9871)),
+    ('udp://:9871', ('127.0.0.1', 9871)),
+    (':9871', ('127.0.0.1', 9871)),
+    ('9871', ('127.0.0.1', 9871)),
+    ('udp://localhost', ('localhost', DEFAULT_PORT)),
+    ('udp://localhost:', ('localhost', DEFAULT_PORT)),
+    ('udp://', ('127.0.0.1', DEFAULT_PORT)),
+])
+def test_parse_udp_address(text, address):
+    assert parse_address(text) == (socket.AF_INET, address)
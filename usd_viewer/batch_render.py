@@ -0,0 +1,226 @@
+"""
+USD 에셋 일괄 썸네일/턴테이블 렌더링
+=====================================
+
+디렉터리 아래의 USD 파일을 모두 찾아 Qt 뷰어의 뷰포트(HydraViewport/GLViewport)로
+창 없이 렌더링해 PNG로 저장합니다. benchmark.py와 같이 grabFramebuffer()로
+위젯의 오프스크린 FBO에 그리며, 카메라는 뷰어와 같은 Camera.frame_bounds로 맞춥니다.
+
+GL 컨텍스트는 프로세스마다 하나이므로 파일들을 프로세스 풀에 나눠
+병렬로 렌더링합니다 (워커마다 뷰포트 하나 = 컨텍스트 + FBO 하나).
+
+사용법:
+    python batch_render.py unitree_model/ -o thumbnails/
+    python batch_render.py unitree_model/ -o turntables/ --turntable 36 --size 512
+    python batch_render.py ../go2.usd -o out/ --workers 1 --load-none
+    python batch_render.py unitree_model/ --binding pyqt6 --renderer fallback
+
+출력은 입력 디렉터리 구조를 그대로 따릅니다.
+    썸네일:   <출력>/<상대 경로>/<이름>.png
+    턴테이블: <출력>/<상대 경로>/<이름>_000.png ... (방위각 360/N도 간격)
+
+화면이 없는 환경에서는 QT_QPA_PLATFORM=offscreen(기본값)으로 실행합니다.
+"""
+
+import os
+import sys
+import time
+import argparse
+import multiprocessing
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+
+USD_EXTENSIONS = ('.usd', '.usda', '.usdc', '.usdz')
+
+# 컨텍스트/FBO를 만든 워커 프로세스의 렌더러 (워커 초기화 시 생성)
+_renderer = None
+
+
+def find_assets(root, exclude=()):
+    """root 아래 USD 파일 목록 (root가 파일이면 그 파일만)"""
+    root = Path(root)
+    if root.is_file():
+        return [root]
+    assets = []
+    for directory, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d not in exclude)
+        for name in sorted(filenames):
+            if name.lower().endswith(USD_EXTENSIONS):
+                assets.append(Path(directory) / name)
+    return assets
+
+
+def output_paths(asset, root, out_dir, turntable=0):
+    """에셋의 출력 PNG 경로 목록 (입력 디렉터리 구조 유지)"""
+    root = Path(root)
+    relative = asset.relative_to(root).parent if root.is_dir() else Path()
+    base = Path(out_dir) / relative / asset.stem
+    if turntable <= 1:
+        return [base.with_suffix('.png')]
+    return [base.parent / f"{base.name}_{i:03d}.png" for i in range(turntable)]
+
+
+class OffscreenRenderer:
+    """창을 띄우지 않은 뷰포트 위젯으로 에셋을 렌더링해 PNG로 저장"""
+    
+    def __init__(self, width, height, samples=4, show_grid=False,
+                 binding='pyside6', renderer='hydra'):
+        if binding == 'pyqt6':
+            import usd_hydra_viewer_pyqt6 as viewer_module
+            from PyQt6.QtWidgets import QApplication
+            viewport_class = viewer_module.GLViewport
+        else:
+            import usd_hydra_viewer as viewer_module
+            from PySide6.QtWidgets import QApplication
+            viewport_class = viewer_module.HydraViewport
+        
+        self.app = QApplication.instance() or QApplication(sys.argv[:1])
+        
+        viewport = viewport_class()
+        surface_format = viewport.format()
+        surface_format.setSamples(samples)
+        viewport.setFormat(surface_format)
+        viewport.resize(width, height)
+        viewport.show_grid = show_grid
+        viewport.show_axes = False
+        
+        # 창을 띄우지 않고 GL 컨텍스트/FBO 초기화
+        viewport.grabFramebuffer()
+        if renderer == 'fallback':
+            viewport.renderer = None
+        elif viewport.renderer is None:
+            raise RuntimeError("Hydra 렌더러를 사용할 수 없습니다 (UsdImagingGL 필요)")
+        self.viewport = viewport
+    
+    def render(self, filepath, outputs, options=None):
+        """에셋 하나를 outputs 수만큼의 방위각으로 렌더링해 저장
+        
+        Returns:
+            저장한 파일 수 (빈 씬이면 0)
+        """
+        from stage_loader import load_stage_data
+        
+        viewport = self.viewport
+        result = load_stage_data(str(filepath), options=options)
+        if result.bbox_min is None:
+            return 0
+        # set_stage가 Hydra 엔진도 새로 만들어 이전 에셋이 남지 않음
+        viewport.apply_load_result(result)
+        start_azimuth = viewport.camera.azimuth
+        
+        for i, output in enumerate(outputs):
+            viewport.camera.azimuth = start_azimuth + 360.0 * i / len(outputs)
+            image = viewport.grabFramebuffer()
+            output.parent.mkdir(parents=True, exist_ok=True)
+            if not image.save(str(output)):
+                raise RuntimeError(f"이미지를 저장할 수 없습니다: {output}")
+        
+        # frame_bounds는 방위각을 바꾸지 않으므로 다음 에셋을 위해 되돌리고 스테이지 해제
+        viewport.camera.azimuth = start_azimuth
+        viewport.set_stage(None)
+        return len(outputs)
+
+
+def _init_worker(*args):
+    global _renderer
+    _renderer = OffscreenRenderer(*args)
+
+
+def _render_task(filepath, outputs, options):
+    """워커 프로세스에서 에셋 하나 렌더링 → (파일, 저장 수, 소요 시간, 오류)"""
+    start = time.perf_counter()
+    try:
+        count = _renderer.render(filepath, outputs, options)
+    except Exception as e:
+        return filepath, 0, time.perf_counter() - start, str(e)
+    return filepath, count, time.perf_counter() - start, None
+
+
+def parse_args(argv=None):
+    from stage_loader import add_open_arguments
+    
+    parser = argparse.ArgumentParser(description="USD 에셋 일괄 썸네일/턴테이블 렌더링")
+    parser.add_argument("input", help="USD 파일 또는 디렉터리")
+    parser.add_argument("-o", "--output", default="thumbnails", help="출력 디렉터리")
+    parser.add_argument("--size", type=int, nargs="+", default=[512], metavar="PX",
+                        help="이미지 크기 (한 값이면 정사각형, 두 값이면 너비 높이)")
+    parser.add_argument("--turntable", type=int, default=0, metavar="N",
+                        help="방위각 N개로 턴테이블 렌더링 (0이면 썸네일 한 장)")
+    parser.add_argument("--samples", type=int, default=4, help="MSAA 샘플 수")
+    parser.add_argument("--grid", action="store_true", help="바닥 그리드 표시")
+    parser.add_argument("--binding", choices=('pyside6', 'pyqt6'), default='pyside6',
+                        help="사용할 Qt 뷰어 (pyside6: HydraViewport, pyqt6: GLViewport)")
+    parser.add_argument("--renderer", choices=('hydra', 'fallback'), default='hydra',
+                        help="hydra: UsdImagingGL, fallback: 드로우 캐시 경로")
+    parser.add_argument("--workers", type=int, default=min(os.cpu_count() or 1, 8),
+                        help="렌더링 프로세스 수")
+    parser.add_argument("--exclude-dir", nargs="*", default=[], metavar="NAME",
+                        help="건너뛸 하위 디렉터리 이름 (예: configuration)")
+    parser.add_argument("--skip-existing", action="store_true", help="출력이 이미 있으면 건너뜀")
+    add_open_arguments(parser)
+    return parser.parse_args(argv)
+
+
+def main():
+    args = parse_args()
+    from stage_loader import StageOpenOptions
+    
+    width, height = (args.size * 2)[:2]
+    options = StageOpenOptions.from_args(args)
+    
+    tasks = []
+    for asset in find_assets(args.input, args.exclude_dir):
+        outputs = output_paths(asset, args.input, args.output, args.turntable)
+        if args.skip_existing and all(p.exists() for p in outputs):
+            continue
+        tasks.append((asset, outputs))
+    if not tasks:
+        print("렌더링할 USD 파일이 없습니다.")
+        return
+    
+    # 화면이 없으면 오프스크린 플랫폼 사용 (워커 프로세스도 환경 변수를 상속)
+    if not os.environ.get('DISPLAY') and not os.environ.get('WAYLAND_DISPLAY'):
+        os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    
+    workers = max(1, min(args.workers, len(tasks)))
+    renderer_args = (width, height, args.samples, args.grid, args.binding, args.renderer)
+    print(f"{len(tasks)}개 에셋, {width}x{height}, "
+          f"{'턴테이블 %d장' % args.turntable if args.turntable > 1 else '썸네일'}, 워커 {workers}개")
+    
+    start = time.perf_counter()
+    images = failures = 0
+    
+    def report(done, filepath, count, seconds, error):
+        nonlocal images, failures
+        images += count
+        if error:
+            failures += 1
+            status = f"실패: {error}"
+        elif count == 0:
+            status = "빈 씬 - 건너뜀"
+        else:
+            status = f"{count}장, {seconds:.2f}s"
+        print(f"  [{done}/{len(tasks)}] {filepath}: {status}")
+    
+    if workers == 1:
+        _init_worker(*renderer_args)
+        for done, (asset, outputs) in enumerate(tasks, 1):
+            report(done, *_render_task(asset, outputs, options))
+    else:
+        # Qt/GL 상태는 fork로 복제할 수 없으므로 spawn으로 새 프로세스 시작
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(workers, mp_context=context, initializer=_init_worker,
+                                 initargs=renderer_args) as pool:
+            futures = [pool.submit(_render_task, asset, outputs, options)
+                       for asset, outputs in tasks]
+            for done, future in enumerate(as_completed(futures), 1):
+                report(done, *future.result())
+    
+    elapsed = time.perf_counter() - start
+    print(f"\n완료: 이미지 {images}장, 실패 {failures}개, {elapsed:.1f}s "
+          f"({images / elapsed:.1f} 장/s)")
+
+
+if __name__ == "__main__":
+    main()
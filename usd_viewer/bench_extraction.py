@@ -0,0 +1,96 @@
+"""
+병렬 메시 추출 벤치마크
+========================
+
+load_usd_file의 2단계(build_mesh: 삼각형 분할, 노멀, 바운드)를
+워커 수별로 실행해 확장성을 비교합니다.
+속성 읽기(read_mesh_prim)는 한 번만 수행하고 측정에서 제외합니다.
+
+사용법:
+    python bench_extraction.py                          # 합성 그리드 64개
+    python bench_extraction.py --meshes 32 --size 300   # 300x300 그리드 32개
+    python bench_extraction.py ../go2.usd --workers 1 2 4 8
+"""
+
+import os
+import time
+import argparse
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from bench_triangulation import make_grid
+from usd_basic_viewer import MeshSource, read_mesh_prim, build_mesh
+
+
+def load_sources(filepath):
+    """USD 파일의 모든 메시에서 MeshSource 수집"""
+    from pxr import Usd, UsdGeom
+    from xform_cache import TransformCache
+    
+    stage = Usd.Stage.Open(filepath)
+    if not stage:
+        raise SystemExit(f"USD 파일을 열 수 없습니다: {filepath}")
+    
+    xform_cache = TransformCache(Usd.TimeCode.Default())
+    return [read_mesh_prim(prim, xform_cache)
+            for prim in stage.Traverse() if prim.IsA(UsdGeom.Mesh)]
+
+
+def synthetic_sources(count, size):
+    points, indices, counts = make_grid(size)
+    return [MeshSource(f"/grid_{i}", points, counts, indices, None, None, np.eye(4), None)
+            for i in range(count)]
+
+
+def run(sources, workers, smooth, repeat):
+    """최소 실행 시간(초) 반환"""
+    build = partial(build_mesh, smooth=smooth)
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                list(pool.map(build, sources))
+        else:
+            [build(source) for source in sources]
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="병렬 메시 추출 벤치마크")
+    parser.add_argument("usd_file", nargs="?", help="벤치마크할 USD 파일")
+    parser.add_argument("--meshes", type=int, default=64, help="합성 메시 수")
+    parser.add_argument("--size", type=int, default=100, help="합성 그리드 크기")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8], help="워커 수 목록")
+    parser.add_argument("--smooth", action="store_true", help="스무스 버텍스 노멀 계산")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수")
+    args = parser.parse_args()
+    
+    if args.usd_file:
+        sources = load_sources(args.usd_file)
+        label = args.usd_file
+    else:
+        sources = synthetic_sources(args.meshes, args.size)
+        label = f"grid {args.size}x{args.size} x {args.meshes}"
+    
+    if not sources:
+        print("메시를 찾을 수 없습니다.")
+        return
+    
+    num_points = sum(len(source.points or []) for source in sources)
+    
+    print(f"=== 병렬 메시 추출 벤치마크: {label} ===")
+    print(f"  메시: {len(sources)}, 포인트: {num_points}, CPU: {os.cpu_count()}")
+    
+    baseline = None
+    for workers in args.workers:
+        elapsed = run(sources, workers, args.smooth, args.repeat)
+        baseline = baseline or elapsed
+        print(f"  워커 {workers:2d} : {elapsed * 1000:10.2f} ms  ({baseline / elapsed:5.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Mesh 메모리 벤치마크
+====================
+
+기존 리스트 기반 Mesh(버텍스/페이스는 Python 리스트의 리스트,
+노멀은 삼각형마다 NumPy 배열)와 usd_basic_viewer.Mesh(__slots__ +
+타입 고정 NumPy 배열)의 메모리 사용량을 비교합니다.
+
+사용법:
+    python bench_mesh_memory.py                 # 합성 그리드 메시 (쿼드)
+    python bench_mesh_memory.py --size 1000     # 1000x1000 그리드
+    python bench_mesh_memory.py ../go2.usd      # USD 파일의 모든 메시
+"""
+
+import sys
+import time
+import argparse
+import tracemalloc
+
+import numpy as np
+
+from bench_triangulation import legacy_triangulate, make_grid, load_usd_meshes
+from mesh_utils import points_to_array, triangulate, face_normals
+from usd_basic_viewer import Mesh
+
+
+class LegacyMesh:
+    """기존 Mesh의 데이터 표현 (비교용)"""
+    
+    def __init__(self, name="mesh"):
+        self.name = name
+        self.vertices = []
+        self.normals = []
+        self.faces = []
+        self.color = [0.7, 0.7, 0.8]
+        self.transform = np.eye(4)
+        self.buffers = None
+
+
+def build_legacy(points, indices, counts):
+    mesh = LegacyMesh()
+    mesh.vertices, mesh.faces = legacy_triangulate(points, indices, counts)
+    # 기존 compute_normals는 삼각형마다 float64 배열 하나를 만들었음
+    positions = np.asarray(mesh.vertices, dtype=np.float64).reshape(-1, 3)
+    triangles = np.asarray(mesh.faces, dtype=np.int64).reshape(-1, 3)
+    normals = face_normals(positions, triangles).astype(np.float64)
+    mesh.normals = [row.copy() for row in normals]
+    return mesh
+
+
+def build_array(points, indices, counts):
+    mesh = Mesh()
+    mesh.vertices = points_to_array(points)
+    mesh.faces = triangulate(counts, indices, num_points=len(mesh.vertices))
+    mesh.compute_normals()
+    return mesh
+
+
+def shared_bytes(array):
+    """Vt 배열을 공유하는 뷰면 그 크기 (USD 할당 메모리는 tracemalloc에 잡히지 않음)"""
+    base = array
+    while isinstance(base, np.ndarray) and base.base is not None:
+        base = base.base
+    return array.nbytes if isinstance(base, memoryview) else 0
+
+
+def measure(build, meshes):
+    """(유지되는 바이트, 생성 시간)"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    built = [build(*arrays) for arrays in meshes]
+    elapsed = time.perf_counter() - start
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    for mesh in built:
+        if isinstance(mesh, Mesh):
+            retained += shared_bytes(mesh.vertices) + shared_bytes(mesh.faces)
+    return retained, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mesh 메모리 벤치마크")
+    parser.add_argument("usd_file", nargs="?", help="벤치마크할 USD 파일")
+    parser.add_argument("--size", type=int, default=300, help="합성 그리드 크기")
+    args = parser.parse_args()
+    
+    if args.usd_file:
+        meshes = load_usd_meshes(args.usd_file)
+        label = args.usd_file
+    else:
+        meshes = [make_grid(args.size)]
+        label = f"grid {args.size}x{args.size}"
+    
+    if not meshes:
+        print("메시를 찾을 수 없습니다.")
+        return
+    
+    num_points = sum(len(points) for points, _, _ in meshes)
+    num_triangles = sum(len(build_array(*arrays).faces) for arrays in meshes)
+    
+    legacy_bytes, legacy_time = measure(build_legacy, meshes)
+    array_bytes, array_time = measure(build_array, meshes)
+    
+    print(f"=== Mesh 메모리 벤치마크: {label} ===")
+    print(f"  메시: {len(meshes)}, 포인트: {num_points}, 삼각형: {num_triangles}")
+    print(f"  리스트 Mesh : {legacy_bytes / 2**20:10.2f} MB  ({legacy_time * 1000:8.1f} ms)")
+    print(f"  배열 Mesh   : {array_bytes / 2**20:10.2f} MB  ({array_time * 1000:8.1f} ms)")
+    if array_bytes > 0:
+        print(f"  감소율      : {legacy_bytes / array_bytes:10.1f}x")
+    
+    legacy = LegacyMesh()
+    legacy_size = sys.getsizeof(legacy) + sys.getsizeof(legacy.__dict__)
+    print(f"  객체 크기   : LegacyMesh {legacy_size} B / Mesh {sys.getsizeof(Mesh())} B (__slots__)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""
+삼각형 분할 벤치마크
+====================
+
+기존 Python 루프 방식(리스트 컴프리헨션 + 중첩 루프)과
+mesh_utils의 NumPy 벡터 방식을 비교합니다.
+
+사용법:
+    python bench_triangulation.py                 # 합성 그리드 메시 (쿼드)
+    python bench_triangulation.py --size 1000     # 1000x1000 그리드
+    python bench_triangulation.py ../go2.usd      # USD 파일의 모든 메시
+"""
+
+import sys
+import time
+import argparse
+
+import numpy as np
+
+from mesh_utils import points_to_array, triangulate
+
+
+def legacy_triangulate(points, indices, counts):
+    """기존 extract_mesh_from_prim 방식 (비교용)"""
+    vertices = [[p[0], p[1], p[2]] for p in points]
+    faces = []
+    idx = 0
+    for count in counts:
+        face = []
+        for _ in range(count):
+            if idx < len(indices):
+                face.append(indices[idx])
+                idx += 1
+        if len(face) >= 3:
+            for i in range(1, len(face) - 1):
+                faces.append([face[0], face[i], face[i + 1]])
+    return vertices, faces
+
+
+def numpy_triangulate(points, indices, counts):
+    """mesh_utils 방식"""
+    positions = points_to_array(points)
+    triangles = triangulate(counts, indices, num_points=len(positions))
+    return positions, triangles
+
+
+def make_grid(size):
+    """size x size 쿼드 그리드 생성 (Vt 배열 사용 가능 시 Vt로 반환)"""
+    n = size + 1
+    xs, zs = np.meshgrid(np.arange(n, dtype=np.float32), np.arange(n, dtype=np.float32))
+    points = np.stack([xs.ravel(), np.zeros(n * n, dtype=np.float32), zs.ravel()], axis=1)
+
+    row = np.arange(size)
+    v0 = (row[:, None] * n + row[None, :]).ravel()
+    indices = np.stack([v0, v0 + 1, v0 + n + 1, v0 + n], axis=1).ravel().astype(np.int32)
+    counts = np.full(size * size, 4, dtype=np.int32)
+
+    try:
+        from pxr import Vt
+        return (Vt.Vec3fArray.FromNumpy(points),
+                Vt.IntArray.FromNumpy(indices),
+                Vt.IntArray.FromNumpy(counts))
+    except ImportError:
+        return points, indices, counts
+
+
+def load_usd_meshes(filepath):
+    """USD 파일의 모든 메시에서 (points, indices, counts) 수집"""
+    from pxr import Usd, UsdGeom
+
+    stage = Usd.Stage.Open(filepath)
+    if not stage:
+        print(f"USD 파일을 열 수 없습니다: {filepath}")
+        sys.exit(1)
+
+    meshes = []
+    for prim in stage.Traverse():
+        if prim.IsA(UsdGeom.Mesh):
+            mesh = UsdGeom.Mesh(prim)
+            points = mesh.GetPointsAttr().Get()
+            indices = mesh.GetFaceVertexIndicesAttr().Get()
+            counts = mesh.GetFaceVertexCountsAttr().Get()
+            if points and indices and counts:
+                meshes.append((points, indices, counts))
+    return meshes
+
+
+def run(func, meshes, repeat):
+    """최소 실행 시간(초) 반환"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for points, indices, counts in meshes:
+            func(points, indices, counts)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="삼각형 분할 벤치마크")
+    parser.add_argument("usd_file", nargs="?", help="벤치마크할 USD 파일")
+    parser.add_argument("--size", type=int, default=300, help="합성 그리드 크기")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수")
+    args = parser.parse_args()
+
+    if args.usd_file:
+        meshes = load_usd_meshes(args.usd_file)
+        label = args.usd_file
+    else:
+        meshes = [make_grid(args.size)]
+        label = f"grid {args.size}x{args.size}"
+
+    if not meshes:
+        print("메시를 찾을 수 없습니다.")
+        return
+
+    num_faces = sum(len(counts) for _, _, counts in meshes)
+    num_points = sum(len(points) for points, _, _ in meshes)
+
+    # 결과 검증
+    for points, indices, counts in meshes:
+        _, legacy_faces = legacy_triangulate(points, indices, counts)
+        _, triangles = numpy_triangulate(points, indices, counts)
+        assert np.array_equal(np.asarray(legacy_faces, dtype=np.uint32).reshape(-1, 3), triangles)
+
+    legacy_time = run(legacy_triangulate, meshes, args.repeat)
+    numpy_time = run(numpy_triangulate, meshes, args.repeat)
+
+    print(f"=== 삼각형 분할 벤치마크: {label} ===")
+    print(f"  메시: {len(meshes)}, 포인트: {num_points}, 페이스: {num_faces}")
+    print(f"  Python 루프 : {legacy_time * 1000:10.2f} ms")
+    print(f"  NumPy       : {numpy_time * 1000:10.2f} ms")
+    if numpy_time > 0:
+        print(f"  속도 향상   : {legacy_time / numpy_time:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,246 @@
+"""
+렌더링 벤치마크 (헤드리스)
+==========================
+
+USD 파일을 뷰어와 같은 방식으로 연 뒤, 정해진 궤도(Camera.rotate/zoom)를 따라
+N 프레임을 오프스크린으로 렌더링하고 결과를 JSON으로 출력합니다.
+
+렌더러:
+    hydra     - Qt 뷰포트 + UsdImagingGL.Engine
+    fallback  - Qt 뷰포트의 Fallback 렌더러 (DrawCache)
+    basic     - 기본 뷰어의 Mesh 경로 (숨긴 GLFW 창)
+
+측정 항목:
+    load_time_s, first_frame_s, frame_time_mean_ms, frame_time_p99_ms,
+    peak_rss_mb, 단계별 평균 시간 (frame_profiler.PHASES)
+
+사용법:
+    python benchmark.py ../go2.usd --renderer fallback --frames 300
+    python benchmark.py ../samples/mesh_scene.usda --renderer basic --output basic.json
+    QT_QPA_PLATFORM=offscreen python benchmark.py ../go2.usd --renderer hydra
+    python benchmark.py ../go2.usd --record /tmp/frames     # 녹화(PBO 리드백) 중 프레임 시간
+    python benchmark.py prims.usdc --binding pyqt6          # create_samples.py --primitive-ratio 씬
+"""
+
+import sys
+import json
+import time
+import argparse
+import contextlib
+from pathlib import Path
+
+import numpy as np
+
+
+RENDERERS = ('hydra', 'fallback', 'basic')
+
+
+def peak_rss_mb():
+    """프로세스 최대 RSS (MB, 측정 불가 시 None)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위
+    if sys.platform == 'darwin':
+        return peak / (1024 * 1024)
+    return peak / 1024
+
+
+def rotate_degrees_per_unit(camera):
+    """Camera.rotate(1, 0)이 바꾸는 방위각 (뷰어마다 마우스 감도가 다름)"""
+    azimuth = camera.azimuth
+    camera.rotate(1, 0)
+    per_unit = abs(camera.azimuth - azimuth)
+    camera.azimuth = azimuth
+    return per_unit
+
+
+def orbit_step(camera, frame, frames, degrees=360.0, zoom=0.02):
+    """결정적 궤도: 프레임마다 방위각 회전, 전반부 줌 인 / 후반부 줌 아웃"""
+    camera.rotate(degrees / frames / rotate_degrees_per_unit(camera), 0)
+    camera.zoom(zoom if frame < frames // 2 else -zoom)
+
+
+def summarize(frame_times, profiler):
+    """프레임 시간 목록 + 프로파일러 단계 누적 → 통계 딕셔너리"""
+    times_ms = np.asarray(frame_times) * 1000
+    stats = {
+        'frames': len(times_ms),
+        'frame_time_mean_ms': float(times_ms.mean()) if len(times_ms) else 0.0,
+        'frame_time_p50_ms': float(np.percentile(times_ms, 50)) if len(times_ms) else 0.0,
+        'frame_time_p99_ms': float(np.percentile(times_ms, 99)) if len(times_ms) else 0.0,
+        'frame_time_max_ms': float(times_ms.max()) if len(times_ms) else 0.0,
+    }
+    stats['phases_mean_ms'] = {
+        name: total * 1000 / max(len(times_ms), 1)
+        for name, total in profiler.phase_totals.items()
+    }
+    return stats
+
+
+# === Qt 뷰포트 (hydra / fallback) ===
+
+def run_qt(args):
+    if args.binding == 'pyqt6':
+        import usd_hydra_viewer_pyqt6 as viewer_module
+        from PyQt6.QtWidgets import QApplication
+        viewport_class = viewer_module.GLViewport
+    else:
+        import usd_hydra_viewer as viewer_module
+        from PySide6.QtWidgets import QApplication
+        viewport_class = viewer_module.HydraViewport
+    from OpenGL.GL import glFinish
+    
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    
+    viewport = viewport_class()
+    viewport.resize(args.width, args.height)
+    viewport.show_grid = False
+    viewport.show_axes = False
+    
+    # 창을 띄우지 않고 GL 컨텍스트/FBO 초기화
+    viewport.grabFramebuffer()
+    if args.renderer == 'fallback':
+        viewport.renderer = None
+    elif viewport.renderer is None:
+        raise RuntimeError("Hydra 렌더러를 사용할 수 없습니다 (UsdImagingGL 필요)")
+    
+    start = time.perf_counter()
+    if not viewport.load_stage(args.usd_file):
+        raise RuntimeError(f"스테이지를 열 수 없습니다: {args.usd_file}")
+    load_time = time.perf_counter() - start
+    app.processEvents()
+    
+    def render_frame():
+        viewport.makeCurrent()
+        start = time.perf_counter()
+        viewport.paintGL()
+        glFinish()
+        elapsed = time.perf_counter() - start
+        viewport.doneCurrent()
+        return elapsed
+    
+    first_frame = render_frame()
+    viewport.profiler.reset()
+    if args.record:
+        viewport.start_recording(args.record)
+    
+    frame_times = []
+    for frame in range(args.frames):
+        orbit_step(viewport.camera, frame, args.frames, args.degrees)
+        frame_times.append(render_frame())
+    
+    if args.record:
+        print(viewport.stop_recording())
+    
+    return load_time, first_frame, frame_times, viewport.profiler
+
+
+# === 기본 뷰어 Mesh 경로 ===
+
+def run_basic(args):
+    import glfw
+    from OpenGL.GL import glFinish
+    from usd_basic_viewer import USDBasicViewer, load_usd_file
+    
+    viewer = USDBasicViewer(args.width, args.height)
+    viewer.show_grid = False
+    viewer.show_axes = False
+    
+    # init_glfw의 glfw.init()은 중복 호출해도 무해하므로 먼저 초기화 후 창 숨김
+    if not glfw.init():
+        raise RuntimeError("GLFW 초기화 실패")
+    glfw.window_hint(glfw.VISIBLE, glfw.FALSE)
+    viewer.init_glfw()
+    glfw.swap_interval(0)
+    viewer.init_opengl()
+    
+    start = time.perf_counter()
+    viewer.meshes = load_usd_file(args.usd_file)
+    load_time = time.perf_counter() - start
+    if not viewer.meshes:
+        raise RuntimeError(f"메시를 찾을 수 없습니다: {args.usd_file}")
+    
+    def render_frame():
+        start = time.perf_counter()
+        viewer.profiler.begin_frame()
+        viewer.render()
+        viewer.profiler.end_frame()
+        glFinish()
+        return time.perf_counter() - start
+    
+    # 첫 프레임: GPU 업로드 포함
+    start = time.perf_counter()
+    viewer.upload_meshes()
+    viewer.fit_camera_to_scene()
+    render_frame()
+    first_frame = time.perf_counter() - start
+    viewer.profiler.reset()
+    
+    frame_times = []
+    try:
+        for frame in range(args.frames):
+            orbit_step(viewer.camera, frame, args.frames, args.degrees)
+            frame_times.append(render_frame())
+    finally:
+        viewer.release_meshes()
+        glfw.terminate()
+    
+    return load_time, first_frame, frame_times, viewer.profiler
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="USD 뷰어 헤드리스 렌더링 벤치마크")
+    parser.add_argument("usd_file", help="벤치마크할 USD 파일")
+    parser.add_argument("--renderer", choices=RENDERERS, default='fallback', help="렌더링 경로")
+    parser.add_argument("--binding", choices=('pyside6', 'pyqt6'), default='pyside6',
+                        help="hydra/fallback에서 사용할 Qt 뷰어")
+    parser.add_argument("--frames", type=int, default=300, help="측정 프레임 수")
+    parser.add_argument("--degrees", type=float, default=360.0, help="궤도 회전 각도")
+    parser.add_argument("--width", type=int, default=1280)
+    parser.add_argument("--height", type=int, default=720)
+    parser.add_argument("--output", help="결과 JSON 파일 (생략 시 표준 출력)")
+    parser.add_argument("--record", metavar="PATH",
+                        help="측정 중 프레임 녹화 (hydra/fallback, 디렉터리 또는 영상 파일)")
+    return parser.parse_args(argv)
+
+
+def main():
+    args = parse_args()
+    if not Path(args.usd_file).exists():
+        print(f"파일을 찾을 수 없습니다: {args.usd_file}")
+        sys.exit(1)
+    if args.record and args.renderer == 'basic':
+        print("--record는 Qt 렌더러(hydra/fallback)에서만 사용할 수 있습니다")
+        sys.exit(1)
+    
+    # 뷰어 로그는 stderr로 보내 표준 출력에는 JSON만 남김
+    with contextlib.redirect_stdout(sys.stderr):
+        if args.renderer == 'basic':
+            load_time, first_frame, frame_times, profiler = run_basic(args)
+        else:
+            load_time, first_frame, frame_times, profiler = run_qt(args)
+    
+    result = {
+        'file': str(args.usd_file),
+        'renderer': args.renderer,
+        'binding': args.binding if args.renderer != 'basic' else None,
+        'resolution': [args.width, args.height],
+        'load_time_s': load_time,
+        'first_frame_s': first_frame,
+        'peak_rss_mb': peak_rss_mb(),
+    }
+    result.update(summarize(frame_times, profiler))
+    
+    text = json.dumps(result, indent=2, ensure_ascii=False)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding='utf-8')
+        print(f"결과 저장: {args.output}")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
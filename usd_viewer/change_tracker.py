@@ -0,0 +1,122 @@
+"""
+Change Tracker - Usd.Notice.ObjectsChanged 기반 증분 갱신
+=========================================================
+
+스테이지 하나에 Tf.Notice 리스너를 한 번만 등록하고, 변경된 경로를
+분류해 구독자(드로우 캐시, 계층 패널 등)에게 전달합니다.
+구독자는 전체 리로드 대신 영향받은 경로만 갱신합니다.
+
+분류:
+    resynced  - 프림 추가/삭제/합성 변경 (서브트리 재구성 필요)
+    xforms    - xformOp 값 변경 (서브트리의 월드 행렬만 갱신)
+    xform_order_changed - xformOpOrder 변경 (변환 쿼리 캐시까지 비워야 함)
+    info      - 그 외 속성/메타데이터 값 변경 (해당 프림만 갱신)
+
+알림은 스테이지를 편집한 스레드에서 동기적으로 전달됩니다.
+"""
+
+from pxr import Usd, Sdf, Tf
+
+
+class StageChanges:
+    """한 번의 ObjectsChanged 알림에서 분류된 프림 경로 집합"""
+    
+    __slots__ = ('resynced', 'xforms', 'info', 'xform_order_changed')
+    
+    def __init__(self):
+        self.resynced = set()       # Sdf.Path (프림 경로)
+        self.xforms = set()
+        self.info = set()
+        self.xform_order_changed = False
+    
+    @classmethod
+    def from_notice(cls, notice):
+        changes = cls()
+        for path in notice.GetResyncedPaths():
+            changes.resynced.add(_prim_path(path))
+        
+        for path in notice.GetChangedInfoOnlyPaths():
+            prim_path = _prim_path(path)
+            if path.IsPropertyPath() and path.name.startswith('xformOp'):
+                changes.xforms.add(prim_path)
+                if path.name == 'xformOpOrder':
+                    changes.xform_order_changed = True
+            else:
+                changes.info.add(prim_path)
+        return changes
+    
+    def update(self, other):
+        """다른 변경을 합침 (다음 sync까지 누적할 때)"""
+        self.resynced |= other.resynced
+        self.xforms |= other.xforms
+        self.info |= other.info
+        self.xform_order_changed |= other.xform_order_changed
+    
+    def clear(self):
+        self.resynced.clear()
+        self.xforms.clear()
+        self.info.clear()
+        self.xform_order_changed = False
+    
+    def __bool__(self):
+        return bool(self.resynced or self.xforms or self.info)
+    
+    def affects(self, path):
+        """path 프림이 이번 변경의 영향을 받는지"""
+        path = Sdf.Path(path)
+        if path in self.info or path in self.xforms:
+            return True
+        return any(path.HasPrefix(root) for root in self.resynced)
+    
+    def resync_roots(self):
+        """다른 resync 경로의 하위 경로를 제거한 최소 루트 목록"""
+        return minimal_roots(self.resynced)
+
+
+def _prim_path(path):
+    """속성 경로면 소유 프림 경로 (레이어 메타데이터 변경은 '/'로 옴)"""
+    return path if path == Sdf.Path.absoluteRootPath else path.GetPrimPath()
+
+
+def minimal_roots(paths):
+    """다른 경로의 하위 경로를 제거한 최소 루트 집합"""
+    roots = []
+    for path in sorted(paths, key=lambda p: p.pathElementCount):
+        if not any(path.HasPrefix(root) for root in roots):
+            roots.append(path)
+    return roots
+
+
+class ChangeTracker:
+    """스테이지의 ObjectsChanged 알림을 StageChanges로 분류해 구독자에게 전달"""
+    
+    def __init__(self, stage=None):
+        self.stage = None
+        self.listeners = []         # callback(StageChanges)
+        self._listener = None
+        self.set_stage(stage)
+    
+    def set_stage(self, stage):
+        """감시할 스테이지 교체 (None이면 해제)"""
+        if self._listener:
+            self._listener.Revoke()
+            self._listener = None
+        self.stage = stage
+        if stage:
+            self._listener = Tf.Notice.Register(
+                Usd.Notice.ObjectsChanged, self._on_objects_changed, stage
+            )
+    
+    def add_listener(self, callback):
+        self.listeners.append(callback)
+    
+    def remove_listener(self, callback):
+        if callback in self.listeners:
+            self.listeners.remove(callback)
+    
+    def _on_objects_changed(self, notice, sender):
+        changes = StageChanges.from_notice(notice)
+        if not changes:
+            return
+        for callback in list(self.listeners):
+            callback(changes)
@@ -3,13 +3,22 @@
 ===========================
 
 뷰어 테스트를 위한 다양한 샘플 USD 파일을 생성합니다.
+
+스케일링 테스트용 스트레스 씬 (.usdc):
+    python create_samples.py --stress --prims 10 100 1000 10000 100000
+    python create_samples.py --stress --prims 5000 --mesh-res 64 --depth 4 \
+        --instance-ratio 0.5 --time-samples 120
+    python create_samples.py --stress --prims 2000 --primitive-ratio 1.0   # Cylinder/Capsule 위주
 """
 
 import sys
 import math
+import argparse
+
+import numpy as np
 
 try:
-    from pxr import Usd, UsdGeom, UsdLux, UsdShade, Sdf, Gf
+    from pxr import Usd, UsdGeom, UsdLux, UsdShade, Sdf, Gf, Vt
 except ImportError:
     print("USD 라이브러리가 필요합니다:")
     print("  pip install usd-core")
@@ -319,7 +328,173 @@ def create_animated_scene(filepath="animated_scene.usda"):
     return filepath
 
 
-def main():
+def make_tile_mesh(resolution):
+    """resolution x resolution 쿼드로 된 1x1 높이맵 타일 (삼각형 2 * resolution^2개)
+    
+    Returns:
+        (points Vt.Vec3fArray, counts Vt.IntArray, indices Vt.IntArray, extent Vt.Vec3fArray)
+    """
+    n = resolution + 1
+    u = np.linspace(-0.5, 0.5, n, dtype=np.float32)
+    xs, zs = np.meshgrid(u, u)
+    ys = 0.1 * np.sin(xs * 2 * np.pi) * np.cos(zs * 2 * np.pi)
+    points = np.stack([xs.ravel(), ys.ravel(), zs.ravel()], axis=1).astype(np.float32)
+    
+    row = np.arange(resolution)
+    v0 = (row[:, None] * n + row[None, :]).ravel()
+    indices = np.stack([v0, v0 + n, v0 + n + 1, v0 + 1], axis=1).ravel().astype(np.int32)
+    counts = np.full(resolution * resolution, 4, dtype=np.int32)
+    
+    extent = np.array([points.min(axis=0), points.max(axis=0)], dtype=np.float32)
+    return (Vt.Vec3fArray.FromNumpy(points), Vt.IntArray.FromNumpy(counts),
+            Vt.IntArray.FromNumpy(indices), Vt.Vec3fArray.FromNumpy(extent))
+
+
+def _define_spec(layer, path, type_name, specifier=Sdf.SpecifierDef):
+    spec = Sdf.CreatePrimInLayer(layer, path)
+    spec.specifier = specifier
+    if type_name:
+        spec.typeName = type_name
+    return spec
+
+
+def _attr_spec(prim_spec, name, value_type, value=None, uniform=False):
+    variability = Sdf.VariabilityUniform if uniform else Sdf.VariabilityVarying
+    attr = Sdf.AttributeSpec(prim_spec, name, value_type, variability)
+    if value is not None:
+        attr.default = value
+    return attr
+
+
+def _mesh_specs(prim_spec, points, counts, indices, extent, color):
+    names = Sdf.ValueTypeNames
+    _attr_spec(prim_spec, 'points', names.Point3fArray, points)
+    _attr_spec(prim_spec, 'faceVertexCounts', names.IntArray, counts)
+    _attr_spec(prim_spec, 'faceVertexIndices', names.IntArray, indices)
+    _attr_spec(prim_spec, 'extent', names.Float3Array, extent)
+    _attr_spec(prim_spec, 'primvars:displayColor', names.Color3fArray, Vt.Vec3fArray([color]))
+
+
+def _primitive_specs(prim_spec, radius, height, color):
+    """Cylinder/Capsule 리프 속성 (Y-up 씬이므로 축도 Y)"""
+    names = Sdf.ValueTypeNames
+    half = height / 2 + (radius if prim_spec.typeName == 'Capsule' else 0.0)
+    _attr_spec(prim_spec, 'radius', names.Double, radius)
+    _attr_spec(prim_spec, 'height', names.Double, height)
+    _attr_spec(prim_spec, 'axis', names.Token, 'Y', uniform=True)
+    _attr_spec(prim_spec, 'extent', names.Float3Array,
+               Vt.Vec3fArray([Gf.Vec3f(-radius, -half, -radius), Gf.Vec3f(radius, half, radius)]))
+    _attr_spec(prim_spec, 'primvars:displayColor', names.Color3fArray, Vt.Vec3fArray([color]))
+
+
+def create_stress_scene(filepath="stress_scene.usdc", prim_count=1000, mesh_resolution=16,
+                        depth=3, instance_ratio=0.0, time_samples=0, animated_ratio=0.1, seed=0,
+                        primitive_ratio=0.0):
+    """스케일링 테스트용 합성 씬 (.usdc 바이너리)
+    
+    프림 수가 10만 개 이상이어도 빠르게 쓰도록 Sdf 레이어 API로
+    Sdf.ChangeBlock 안에서 한 번에 작성합니다.
+    
+    Args:
+        prim_count: 메시 프림(리프) 수
+        mesh_resolution: 메시당 쿼드 격자 해상도 (삼각형 2 * res^2개)
+        depth: 리프 위 Xform 그룹 계층 깊이
+        instance_ratio: 공유 프로토타입을 참조하는 instanceable 리프 비율 (0~1)
+        time_samples: 애니메이션 시간 샘플 수 (0이면 정적)
+        animated_ratio: time_samples > 0일 때 애니메이션되는 리프 비율
+        seed: 색상/인스턴스/애니메이션 대상 선택용 난수 시드
+        primitive_ratio: 메시 대신 Cylinder/Capsule(번갈아)로 만드는 리프 비율 (0~1, 인스턴스 제외)
+    """
+    rng = np.random.default_rng(seed)
+    stage = Usd.Stage.CreateNew(filepath)
+    layer = stage.GetRootLayer()
+    UsdGeom.SetStageUpAxis(stage, UsdGeom.Tokens.y)
+    
+    if time_samples > 0:
+        stage.SetStartTimeCode(1)
+        stage.SetEndTimeCode(time_samples)
+        stage.SetTimeCodesPerSecond(24)
+    
+    points, counts, indices, extent = make_tile_mesh(mesh_resolution)
+    
+    # 그룹 분기 수: branching^depth >= prim_count
+    depth = max(depth, 0)
+    branching = max(2, math.ceil(prim_count ** (1.0 / depth))) if depth > 0 else 1
+    grid = math.ceil(math.sqrt(prim_count))
+    spacing = 1.5
+    
+    instanced = rng.random(prim_count) < instance_ratio
+    if time_samples > 0:
+        animated = rng.random(prim_count) < animated_ratio
+    else:
+        animated = np.zeros(prim_count, dtype=bool)
+    colors = rng.uniform(0.2, 0.9, size=(prim_count, 3))
+    # 기존 시드의 씬이 바뀌지 않도록 마지막에 추출
+    primitive = (rng.random(prim_count) < primitive_ratio) & ~instanced
+    frames = np.arange(1, time_samples + 1, dtype=np.float64)
+    
+    names = Sdf.ValueTypeNames
+    translate_order = Vt.TokenArray(['xformOp:translate'])
+    
+    with Sdf.ChangeBlock():
+        _define_spec(layer, '/World', 'Xform')
+        layer.defaultPrim = 'World'
+        
+        # 인스턴스용 프로토타입 (class 프림 하위라 직접 렌더링되지 않음)
+        _define_spec(layer, '/Prototypes', '', Sdf.SpecifierClass)
+        _define_spec(layer, '/Prototypes/Tile', 'Xform')
+        proto = _define_spec(layer, '/Prototypes/Tile/Geom', 'Mesh')
+        _mesh_specs(proto, points, counts, indices, extent, Gf.Vec3f(0.6, 0.6, 0.7))
+        
+        groups = set()
+        for i in range(prim_count):
+            # 리프 인덱스를 branching 진법으로 나눠 그룹 경로 생성
+            digits = []
+            index = i
+            for _ in range(depth):
+                digits.append(index % branching)
+                index //= branching
+            group_path = '/World'
+            for level, digit in enumerate(reversed(digits)):
+                group_path += f'/G{level}_{digit}'
+                if group_path not in groups:
+                    groups.add(group_path)
+                    _define_spec(layer, group_path, 'Xform')
+            
+            path = f'{group_path}/Tile{i}'
+            if instanced[i]:
+                spec = _define_spec(layer, path, 'Xform')
+                spec.referenceList.Prepend(Sdf.Reference(primPath='/Prototypes/Tile'))
+                spec.instanceable = True
+            elif primitive[i]:
+                spec = _define_spec(layer, path, 'Cylinder' if i % 2 else 'Capsule')
+                _primitive_specs(spec, 0.4, 0.6, Gf.Vec3f(*colors[i]))
+            else:
+                spec = _define_spec(layer, path, 'Mesh')
+                _mesh_specs(spec, points, counts, indices, extent, Gf.Vec3f(*colors[i]))
+            
+            x = (i % grid - grid / 2) * spacing
+            z = (i // grid - grid / 2) * spacing
+            translate = _attr_spec(spec, 'xformOp:translate', names.Double3)
+            _attr_spec(spec, 'xformOpOrder', names.TokenArray, translate_order, uniform=True)
+            if animated[i]:
+                heights = 0.5 * np.sin(frames / 24.0 * 2 * np.pi + i)
+                for frame, y in zip(frames, heights):
+                    layer.SetTimeSample(translate.path, frame, Gf.Vec3d(x, float(y), z))
+            else:
+                translate.default = Gf.Vec3d(x, 0, z)
+    
+    layer.Save()
+    
+    triangles = int(prim_count - primitive.sum()) * 2 * mesh_resolution * mesh_resolution
+    print(f"생성됨: {filepath}")
+    print(f"  - 프림 {prim_count} (인스턴스 {int(instanced.sum())}, 프리미티브 {int(primitive.sum())}, "
+          f"애니메이션 {int(animated.sum())}), "
+          f"삼각형 {triangles:,}, 깊이 {depth}, 시간 샘플 {time_samples}")
+    return filepath
+
+
+def create_all_samples():
     """모든 샘플 파일 생성"""
     print("=== USD 샘플 파일 생성 ===\n")
     
@@ -338,5 +513,42 @@ def main():
     return files
 
 
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="샘플 USD 파일 생성")
+    parser.add_argument("--stress", action="store_true", help="스케일링 테스트용 스트레스 씬 생성")
+    parser.add_argument("--prims", type=int, nargs="+", default=[1000],
+                        help="프림 수 (여러 개 지정 시 각각 생성)")
+    parser.add_argument("--mesh-res", type=int, default=16, help="메시당 쿼드 격자 해상도")
+    parser.add_argument("--depth", type=int, default=3, help="그룹 계층 깊이")
+    parser.add_argument("--instance-ratio", type=float, default=0.0, help="instanceable 리프 비율 (0~1)")
+    parser.add_argument("--primitive-ratio", type=float, default=0.0,
+                        help="Cylinder/Capsule 리프 비율 (0~1)")
+    parser.add_argument("--time-samples", type=int, default=0, help="애니메이션 시간 샘플 수")
+    parser.add_argument("--animated-ratio", type=float, default=0.1, help="애니메이션되는 리프 비율 (0~1)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", help="출력 파일 (.usdc, 프림 수가 하나일 때만)")
+    return parser.parse_args(argv)
+
+
+def main():
+    args = parse_args()
+    if not args.stress:
+        return create_all_samples()
+    
+    files = []
+    for prim_count in args.prims:
+        if args.output and len(args.prims) == 1:
+            filepath = args.output
+        else:
+            filepath = f"stress_p{prim_count}_r{args.mesh_res}.usdc"
+        files.append(create_stress_scene(
+            filepath, prim_count=prim_count, mesh_resolution=args.mesh_res,
+            depth=args.depth, instance_ratio=args.instance_ratio,
+            time_samples=args.time_samples, animated_ratio=args.animated_ratio, seed=args.seed,
+            primitive_ratio=args.primitive_ratio,
+        ))
+    return files
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,41 @@
+"""
+Culling - 뷰 프러스텀 컬링
+==========================
+
+캐시된 프림별 월드 AABB를 카메라 프러스텀 6개 평면과 한 번에 비교합니다.
+행렬은 Gf 규약(행 벡터, clip = p * view * proj)을 따릅니다.
+"""
+
+import numpy as np
+
+
+def frustum_planes(view_proj):
+    """뷰-투영 행렬에서 프러스텀 평면 (6, 4) 추출 (a, b, c, d: a*x + b*y + c*z + d >= 0 이면 안쪽)"""
+    m = np.asarray(view_proj, dtype=np.float64).reshape(4, 4)
+    w = m[:, 3]
+    planes = np.array([
+        w + m[:, 0],   # left
+        w - m[:, 0],   # right
+        w + m[:, 1],   # bottom
+        w - m[:, 1],   # top
+        w + m[:, 2],   # near
+        w - m[:, 2],   # far
+    ])
+    norms = np.linalg.norm(planes[:, :3], axis=1)
+    norms[norms == 0] = 1.0
+    return planes / norms[:, None]
+
+
+def aabbs_visible(planes, mins, maxs):
+    """AABB (N, 3) 배열이 프러스텀과 겹치는지 여부 (N,) bool 배열
+    
+    각 평면에 대해 법선 방향으로 가장 먼 꼭짓점(positive vertex)이
+    평면 바깥이면 해당 박스는 완전히 프러스텀 밖입니다.
+    """
+    if len(mins) == 0:
+        return np.zeros(0, dtype=bool)
+    normals = planes[:, :3]
+    # (N, 6, 3): 평면별 positive vertex
+    corners = np.where(normals[None, :, :] >= 0, maxs[:, None, :], mins[:, None, :])
+    distances = np.einsum('npk,pk->np', corners, normals) + planes[None, :, 3]
+    return np.all(distances >= 0, axis=1)
@@ -0,0 +1,530 @@
+"""
+Draw Cache - Qt 뷰어 Fallback 렌더러용 프림별 드로우 캐시
+=========================================================
+
+매 프레임 stage.Traverse()와 속성 읽기를 반복하지 않도록,
+프림 경로를 키로 월드 행렬/색상/GPU 버퍼를 보관합니다.
+
+무효화 규칙 (ChangeTracker가 분류한 Usd.Notice.ObjectsChanged):
+- resync 경로: 해당 서브트리 항목을 다시 수집
+- xformOp 변경: 서브트리 항목의 월드 행렬만 갱신 (서브트리 크기에 비례)
+- 그 외 속성 변경: 해당 프림의 지오메트리/색상 갱신
+- 시간 변경: 시간 샘플이 있는 항목만 갱신
+  (재생 중에는 prefetch()로 다음 프레임의 행렬/메시를 백그라운드에서 미리 계산)
+- 변형 메시의 시간별 버텍스 배열은 GeometryCache(LRU, 메모리 상한)에 보관해
+  반복 재생/스크러빙 시 다시 읽지 않고, GPU 버퍼는 크기가 같으면 제자리 갱신
+
+sync는 더티 항목만 재구성하고, 항목 구성이 그대로면 컬링용 AABB 배열도
+해당 행만 고칩니다. 로컬 바운드는 항목마다 extent로 계산하고, resync된 서브트리의
+항목은 경로 색인(SubtreeIndex)으로 찾으므로 편집 비용은 스테이지 크기와 무관합니다.
+
+각 항목은 월드 AABB를 함께 보관하므로 cull()로 화면 밖 프림을
+USD 속성 읽기나 GL 호출 없이 건너뛸 수 있습니다.
+
+모든 GL 작업(버퍼 생성/해제)은 sync() 안에서 이루어지므로
+GL 컨텍스트가 활성화된 paintGL에서 호출해야 합니다.
+"""
+
+import time
+import threading
+from collections import OrderedDict
+
+import numpy as np
+from pxr import Usd, UsdGeom, Gf
+
+from change_tracker import ChangeTracker, StageChanges
+from culling import aabbs_visible, frustum_planes
+from geometry_cache import DEFAULT_MAX_BYTES, GeometryCache
+from gl_utils import MeshBuffers, buffers_supported, draw_triangle_arrays
+from mesh_utils import flat_mesh_arrays
+from time_prefetch import TimeSamplePrefetcher
+from xform_cache import TransformCache
+
+
+# (종류, 스키마) - IsA 검사 순서
+PRIM_KINDS = (
+    ('mesh', UsdGeom.Mesh),
+    ('cube', UsdGeom.Cube),
+    ('sphere', UsdGeom.Sphere),
+    ('cylinder', UsdGeom.Cylinder),
+    ('cone', UsdGeom.Cone),
+    ('capsule', UsdGeom.Capsule),
+)
+
+# 프리미티브별 파라미터 속성 이름
+PRIM_PARAMS = {
+    'mesh': (),
+    'cube': ('size',),
+    'sphere': ('radius',),
+    'cylinder': ('radius', 'height', 'axis'),
+    'cone': ('radius', 'height', 'axis'),
+    'capsule': ('radius', 'height', 'axis'),
+}
+
+# 수집 순회 조건 (instanceable 프림 아래의 프로토타입 메시도 인스턴스 프록시로 포함)
+TRAVERSAL = Usd.TraverseInstanceProxies(Usd.PrimDefaultPredicate)
+# 변환 무효화 순회 조건 (비활성 등 모든 프림의 캐시된 행렬 포함)
+XFORM_TRAVERSAL = Usd.TraverseInstanceProxies(Usd.PrimAllPrimsPredicate)
+
+# sync/cull 단계별 시간 측정 키 (frame_profiler.PHASES와 동일한 이름)
+SYNC_PHASES = ('traversal', 'attributes', 'transforms', 'culling')
+
+DEFAULT_COLORS = {
+    'mesh': (0.7, 0.7, 0.8),
+    'cube': (0.3, 0.5, 0.8),
+    'sphere': (0.8, 0.3, 0.3),
+    'cylinder': (0.3, 0.7, 0.3),
+    'cone': (0.9, 0.7, 0.2),
+    'capsule': (0.8, 0.5, 0.2),
+}
+
+
+def _param_attr(prim, kind, name):
+    """프리미티브 파라미터 속성 반환 (예: Cube.GetSizeAttr)"""
+    schema = dict(PRIM_KINDS)[kind](prim)
+    getter = 'Get' + name.capitalize() + 'Attr'
+    return getattr(schema, getter)()
+
+
+class DrawItem:
+    """프림 하나의 캐시된 렌더링 데이터"""
+    
+    def __init__(self, path, kind):
+        self.path = path            # Sdf.Path
+        self.kind = kind            # 'mesh', 'cube', 'sphere', ...
+        self.world_matrix = None    # glMultMatrixd용 16개 값 (행 우선 = GL 열 우선)
+        self.color = DEFAULT_COLORS[kind]
+        self.params = {}            # 프리미티브 파라미터 (size, radius, height, axis)
+        self.bounds = None          # 월드 AABB ([min], [max]) 또는 None (항상 그림)
+        
+        # 메시 데이터 (버퍼 미지원 시 클라이언트 배열로 렌더링)
+        self.buffers = None
+        self.positions = None
+        self.normals = None
+        
+        # 시간 의존성 (시간 변경 시 갱신 대상)
+        self.xform_varying = False
+        self.geometry_varying = False
+        
+        self.dirty_xform = True
+        self.dirty_geometry = True
+    
+    def draw_mesh(self):
+        """메시 항목 렌더링 (GPU 버퍼 또는 클라이언트 배열)"""
+        if self.buffers:
+            self.buffers.draw()
+        elif self.positions is not None:
+            draw_triangle_arrays(self.positions, self.normals)
+
+
+class SubtreeIndex:
+    """경로 집합의 부모 → 자식 링크 (서브트리 경로를 전체 순회 없이 찾기)"""
+    
+    def __init__(self):
+        self._children = {}     # Sdf.Path -> {자식 Sdf.Path} (추가된 경로와 그 조상만)
+    
+    def add(self, path):
+        child, parent = path, path.GetParentPath()
+        while not parent.isEmpty:
+            siblings = self._children.setdefault(parent, set())
+            if child in siblings:
+                return          # 위쪽 링크는 이미 있음
+            siblings.add(child)
+            child, parent = parent, parent.GetParentPath()
+    
+    def pop_subtree(self, root):
+        """root와 그 아래에 색인된 경로를 색인에서 빼고 반환 (조상 링크는 그대로 둠)"""
+        found = []
+        stack = [root]
+        while stack:
+            path = stack.pop()
+            found.append(path)
+            stack.extend(self._children.pop(path, ()))
+        self._children.get(root.GetParentPath(), set()).discard(root)
+        return found
+    
+    def clear(self):
+        self._children.clear()
+
+
+class DrawCache:
+    """프림 경로 기반 드로우 캐시"""
+    
+    def __init__(self, kinds=None, xform_cache=None, tracker=None,
+                 geometry_cache_bytes=DEFAULT_MAX_BYTES):
+        self.kinds = tuple(kinds) if kinds else tuple(k for k, _ in PRIM_KINDS)
+        self.stage = None
+        self.time_code = Usd.TimeCode.Default()
+        self.items = OrderedDict()  # Sdf.Path -> DrawItem
+        self._index = SubtreeIndex()  # resync 시 서브트리 항목 조회용
+        
+        # 월드 변환은 공유 TransformCache에서 계산
+        self.xform_cache = xform_cache or TransformCache(self.time_code)
+        
+        self.on_changed = None      # 무효화 발생 시 호출 (예: viewport.update)
+        
+        # 변경 알림 (tracker를 주지 않으면 자체 ChangeTracker 사용)
+        self._owns_tracker = tracker is None
+        self.tracker = tracker or ChangeTracker()
+        self.tracker.add_listener(self._on_stage_changed)
+        
+        self._full_resync = True
+        self._pending = StageChanges()  # 다음 sync에서 반영할 변경
+        self._dirty = {}                # Sdf.Path -> DrawItem (재구성 대상)
+        self._garbage = []              # 다음 sync에서 해제할 GPU 버퍼
+        self._use_buffers = None
+        
+        # 시간 변화 항목 목록 (항목 구성이 바뀌면 None으로 두고 다시 계산)
+        self._varying = None
+        self.geometry_cache = GeometryCache(geometry_cache_bytes)  # 변형 메시의 시간별 배열
+        self.prefetcher = None          # TimeSamplePrefetcher (prefetch() 첫 호출 시 생성)
+        # 스테이지를 읽는 스레드(프리페치, 페이로드 워커)와 GUI 스레드 편집의 상호 배제
+        self.stage_lock = threading.Lock()
+        self._samples = None            # 현재 시간의 미리 읽은 값 (FrameSamples)
+        
+        # cull()용 AABB 배열 (항목 구성이 바뀌면 다시 쌓고, 아니면 행 단위로 갱신)
+        self._bounds_dirty = True
+        self._bounds_items = []
+        self._bounds_rows = {}          # Sdf.Path -> 배열 행
+        self._bounds_min = None
+        self._bounds_max = None
+        self._unbounded = None
+        
+        # 통계 (마지막 sync/cull 기준)
+        self.rebuilt_count = 0
+        self.culled_count = 0
+        self.timings = dict.fromkeys(SYNC_PHASES, 0.0)  # 단계별 소요 시간 (초, FrameProfiler 단계명)
+    
+    # === 스테이지/시간 ===
+    
+    def set_stage(self, stage):
+        """스테이지 교체 (기존 항목은 다음 sync에서 해제)"""
+        self._discard_items(list(self.items.keys()))
+        self._bounds_dirty = True
+        self.stage = stage
+        self.xform_cache.clear()
+        self._index.clear()
+        self._full_resync = True
+        self._pending.clear()
+        self._varying = None
+        self.geometry_cache.clear()
+        if self.prefetcher:
+            self.prefetcher.set_stage(stage)
+        
+        if self._owns_tracker:
+            self.tracker.set_stage(stage)
+    
+    def set_time(self, time_code):
+        """현재 시간 설정 (시간 샘플이 있는 항목만 무효화)"""
+        time_code = Usd.TimeCode(time_code)
+        self.xform_cache.set_time(time_code)
+        if time_code == self.time_code:
+            return
+        self.time_code = time_code
+        self._samples = self.prefetcher.take(time_code.GetValue()) if self.prefetcher else None
+        
+        for item in self._varying_items():
+            self._mark_dirty(item, xform=item.xform_varying, geometry=item.geometry_varying)
+    
+    def prefetch(self, times):
+        """다음에 그릴 시간들의 시간 샘플을 백그라운드에서 미리 읽기 (재생 중 매 프레임 호출)"""
+        if not self.stage:
+            return
+        if self.prefetcher is None:
+            self.prefetcher = TimeSamplePrefetcher(self.geometry_cache, read_lock=self.stage_lock)
+            self.prefetcher.set_stage(self.stage)
+            self._varying = None
+        if self._varying is None:
+            varying = self._varying_items()
+            self.prefetcher.set_targets(
+                [item.path for item in varying if item.xform_varying],
+                [item.path for item in varying if item.geometry_varying and item.kind == 'mesh'],
+            )
+        self.prefetcher.request(times)
+    
+    def stop_prefetch(self):
+        """프리페치 스레드 종료"""
+        if self.prefetcher:
+            self.prefetcher.stop()
+    
+    def editing(self):
+        """스테이지 편집/읽기 구간 (with 블록 동안 다른 스레드가 스테이지를 읽지 않음)"""
+        return self.stage_lock
+    
+    def _varying_items(self):
+        if self._varying is None:
+            self._varying = [item for item in self.items.values()
+                             if item.xform_varying or item.geometry_varying]
+        return self._varying
+    
+    # === 변경 알림 ===
+    
+    def _on_stage_changed(self, changes):
+        """ChangeTracker 구독자 (경로만 기록, 실제 갱신은 sync에서)"""
+        self._pending.update(changes)
+        for path in list(changes.info) + changes.resync_roots():
+            self.geometry_cache.invalidate(path)
+        # 현재 시간에 미리 읽어 둔 행렬도 편집 전 값이므로 버림
+        self._samples = None
+        if self.prefetcher:
+            self.prefetcher.invalidate()
+        if self.on_changed:
+            self.on_changed()
+    
+    # === 동기화 ===
+    
+    def sync(self):
+        """무효화된 항목 재구성 (GL 컨텍스트 필요)"""
+        self.rebuilt_count = 0
+        self.timings = dict.fromkeys(SYNC_PHASES, 0.0)
+        
+        if self._use_buffers is None:
+            self._use_buffers = buffers_supported()
+        
+        for buffers in self._garbage:
+            buffers.release()
+        self._garbage = []
+        
+        if not self.stage:
+            return
+        
+        changes = self._pending
+        start = time.perf_counter()
+        if self._full_resync:
+            self._full_resync = False
+            self._collect(self.stage.GetPseudoRoot())
+        else:
+            for path in changes.resync_roots():
+                self._discard_items([p for p in self._index.pop_subtree(path) if p in self.items])
+                prim = self.stage.GetPrimAtPath(path)
+                # 삭제된 서브트리의 행렬은 조회되지 않으므로 현재 서브트리만 무효화
+                subtree = [p.GetPath() for p in Usd.PrimRange(prim, XFORM_TRAVERSAL)] if prim else []
+                self.xform_cache.invalidate(path, subtree)
+                if prim:
+                    self._collect(prim)
+        
+        if changes.xform_order_changed:
+            # 변환 쿼리 구성이 바뀜 (값만 바뀐 경우엔 쿼리를 그대로 재사용)
+            self.xform_cache.clear()
+        for path in changes.xforms:
+            self._invalidate_xforms(path)
+        self.timings['traversal'] += time.perf_counter() - start
+        
+        for path in changes.info:
+            item = self.items.get(path)
+            if item:
+                self._mark_dirty(item, geometry=True)
+        changes.clear()
+        
+        dirty, self._dirty = self._dirty, {}
+        for item in dirty.values():
+            if self.items.get(item.path) is item:
+                self._rebuild(item)
+                self.rebuilt_count += 1
+        
+        if self.rebuilt_count and not self._bounds_dirty:
+            self._patch_bounds(dirty.values())
+    
+    def cull(self, view_proj):
+        """프러스텀과 겹치는 항목 목록 반환 (sync 이후 호출)
+        
+        Args:
+            view_proj: 뷰 * 투영 행렬 (Gf.Matrix4d 또는 4x4 배열, 행 벡터 규약)
+        """
+        start = time.perf_counter()
+        if self._bounds_dirty:
+            self._stack_bounds()
+        
+        if not self._bounds_items:
+            self.culled_count = 0
+            return []
+        
+        visible = aabbs_visible(frustum_planes(view_proj), self._bounds_min, self._bounds_max)
+        visible |= self._unbounded
+        self.culled_count = len(visible) - int(np.count_nonzero(visible))
+        items = self._bounds_items
+        result = [items[i] for i in np.flatnonzero(visible)]
+        self.timings['culling'] += time.perf_counter() - start
+        return result
+    
+    def release(self):
+        """모든 GPU 버퍼 해제 (GL 컨텍스트 필요)"""
+        self._discard_items(list(self.items.keys()))
+        self._index.clear()
+        for buffers in self._garbage:
+            buffers.release()
+        self._garbage = []
+    
+    def __iter__(self):
+        return iter(self.items.values())
+    
+    def __len__(self):
+        return len(self.items)
+    
+    # === 내부 ===
+    
+    def _mark_dirty(self, item, xform=False, geometry=False):
+        item.dirty_xform |= xform
+        item.dirty_geometry |= geometry
+        self._dirty[item.path] = item
+    
+    def _invalidate_xforms(self, path):
+        """path 서브트리의 월드 행렬만 무효화 (항목 전체가 아닌 서브트리 순회)"""
+        prim = self.stage.GetPrimAtPath(path)
+        if not prim:
+            return
+        subtree = [p.GetPath() for p in Usd.PrimRange(prim, TRAVERSAL)]
+        self.xform_cache.invalidate_matrices(subtree)
+        for prim_path in subtree:
+            item = self.items.get(prim_path)
+            if item:
+                self._mark_dirty(item, xform=True)
+    
+    def _collect(self, root):
+        """root 서브트리에서 렌더링 대상 프림 수집"""
+        self._bounds_dirty = True
+        self._varying = None
+        for prim in Usd.PrimRange(root, TRAVERSAL):
+            kind = self._kind_of(prim)
+            if kind:
+                item = self._create_item(prim, kind)
+                self.items[item.path] = item
+                self._index.add(item.path)
+                self._dirty[item.path] = item
+    
+    def _kind_of(self, prim):
+        for kind, schema in PRIM_KINDS:
+            if kind in self.kinds and prim.IsA(schema):
+                return kind
+        return None
+    
+    def _create_item(self, prim, kind):
+        item = DrawItem(prim.GetPath(), kind)
+        
+        # 조상 체인 중 시간 샘플이 있는 변환이 있는지 확인
+        p = prim
+        while p and not p.IsPseudoRoot():
+            xformable = UsdGeom.Xformable(p)
+            if xformable and xformable.TransformMightBeTimeVarying():
+                item.xform_varying = True
+                break
+            p = p.GetParent()
+        
+        gprim = UsdGeom.Gprim(prim)
+        attrs = [gprim.GetDisplayColorAttr()]
+        if kind == 'mesh':
+            attrs.append(UsdGeom.Mesh(prim).GetPointsAttr())
+        else:
+            attrs.extend(_param_attr(prim, kind, name) for name in PRIM_PARAMS[kind])
+        item.geometry_varying = any(a.ValueMightBeTimeVarying() for a in attrs)
+        
+        return item
+    
+    def _discard_items(self, paths):
+        self._bounds_dirty = True
+        self._varying = None
+        for path in paths:
+            item = self.items.pop(path, None)
+            if item and item.buffers:
+                self._garbage.append(item.buffers)
+    
+    def _rebuild(self, item):
+        prim = self.stage.GetPrimAtPath(item.path)
+        if not prim:
+            self._discard_items([item.path])
+            return
+        
+        start = time.perf_counter()
+        samples = self._samples
+        world = samples.matrices.get(item.path) if samples is not None else None
+        if world is None:
+            world = self.xform_cache.get_world_matrix(prim)
+        if item.dirty_xform:
+            item.world_matrix = np.array(world, dtype=np.float64).ravel()
+            item.dirty_xform = False
+        transformed = time.perf_counter()
+        self.timings['transforms'] += transformed - start
+        
+        if item.dirty_geometry:
+            self._rebuild_geometry(prim, item)
+            item.dirty_geometry = False
+        
+        self._update_bounds(prim, item, world)
+        self.timings['attributes'] += time.perf_counter() - transformed
+    
+    def _update_bounds(self, prim, item, world_matrix):
+        """로컬 extent에 월드 행렬을 적용한 AABB 갱신 (이 항목만 읽으므로 공유 캐시 무효화 불필요)"""
+        boundable = UsdGeom.Boundable(prim)
+        attr = boundable.GetExtentAttr()
+        extent = attr.Get(self.time_code) if attr.HasAuthoredValue() else None
+        if not extent or len(extent) != 2:
+            # 작성된 extent가 없으면 points/파라미터로 계산 (BBoxCache와 같은 방식)
+            extent = UsdGeom.Boundable.ComputeExtentFromPlugins(boundable, self.time_code)
+        local = Gf.Range3d(Gf.Vec3d(extent[0]), Gf.Vec3d(extent[1])) if extent else Gf.Range3d()
+        if local.IsEmpty():
+            item.bounds = None
+            return
+        world = Gf.BBox3d(local, world_matrix)
+        aligned = world.ComputeAlignedRange()
+        item.bounds = (tuple(aligned.GetMin()), tuple(aligned.GetMax()))
+    
+    def _stack_bounds(self):
+        """항목 AABB를 (N, 3) 배열로 모음"""
+        self._bounds_dirty = False
+        self._bounds_items = list(self.items.values())
+        self._bounds_rows = {item.path: i for i, item in enumerate(self._bounds_items)}
+        count = len(self._bounds_items)
+        self._bounds_min = np.zeros((count, 3))
+        self._bounds_max = np.zeros((count, 3))
+        self._unbounded = np.zeros(count, dtype=bool)
+        for i, item in enumerate(self._bounds_items):
+            self._write_bounds_row(i, item)
+    
+    def _patch_bounds(self, items):
+        """항목 구성이 그대로일 때 재구성된 항목의 AABB 행만 갱신"""
+        for item in items:
+            row = self._bounds_rows.get(item.path)
+            if row is not None:
+                self._write_bounds_row(row, item)
+    
+    def _write_bounds_row(self, row, item):
+        if item.bounds is None:
+            self._unbounded[row] = True
+        else:
+            self._unbounded[row] = False
+            self._bounds_min[row], self._bounds_max[row] = item.bounds
+    
+    def _rebuild_geometry(self, prim, item):
+        colors = UsdGeom.Gprim(prim).GetDisplayColorAttr().Get(self.time_code)
+        if colors and len(colors) > 0:
+            item.color = (colors[0][0], colors[0][1], colors[0][2])
+        else:
+            item.color = DEFAULT_COLORS[item.kind]
+        
+        if item.kind != 'mesh':
+            for name in PRIM_PARAMS[item.kind]:
+                item.params[name] = _param_attr(prim, item.kind, name).Get(self.time_code)
+            return
+        
+        if item.geometry_varying:
+            arrays = self.geometry_cache.fetch(UsdGeom.Mesh(prim), self.time_code.GetValue())
+        else:
+            arrays = flat_mesh_arrays(UsdGeom.Mesh(prim), self.time_code)
+        item.positions = item.normals = None
+        if arrays is None:
+            if item.buffers:
+                self._garbage.append(item.buffers)
+                item.buffers = None
+            return
+        
+        flat_positions, flat_normals = arrays
+        
+        if not self._use_buffers:
+            item.positions, item.normals = flat_positions, flat_normals
+            return
+        # 버텍스 수가 같으면 (변형 메시의 일반적인 경우) 기존 버퍼에 덮어쓰기
+        if item.buffers and item.buffers.update(flat_positions, flat_normals):
+            return
+        if item.buffers:
+            self._garbage.append(item.buffers)
+        item.buffers = MeshBuffers(flat_positions, flat_normals)
@@ -0,0 +1,328 @@
+"""
+Frame Capture - PBO 비동기 리드백으로 뷰포트 프레임 기록
+=========================================================
+
+paintGL 안에서 glReadPixels를 바로 호출하면 GPU가 그 프레임을 끝낼 때까지
+CPU가 기다리므로 녹화 중 화면 갱신이 느려집니다.
+여기서는 픽셀 버퍼 오브젝트(PBO) 링에 읽기를 예약하고, 몇 프레임 뒤
+전송이 끝난 버퍼만 매핑해 복사한 다음 쓰기 스레드로 넘깁니다.
+Qt 비의존 로직이며 두 Qt 뷰어가 사용합니다.
+
+- capture(): 프레임 k의 읽기를 PBO[k % N]에 예약 (비동기, 바로 반환)
+             같은 PBO에 있던 프레임 k-N은 그 전에 매핑해 큐로 전달
+- 쓰기 스레드: PNG 시퀀스 인코딩 또는 ffmpeg 파이프로 원시 프레임 전달
+- 큐가 가득 차면 렌더링을 막지 않고 그 프레임을 버림 (dropped로 집계)
+
+GL에서 읽은 프레임은 아래쪽 행부터이므로 쓰기 스레드에서 뒤집습니다.
+
+사용법:
+    capture = FrameCapture(open_writer('frames/'))      # PNG 시퀀스
+    capture = FrameCapture(open_writer('turntable.mp4', fps=60))
+    capture.start()
+    ... paintGL에서 capture.capture(width, height) ...
+    capture.stop()                                       # GL 컨텍스트 활성 상태에서
+"""
+
+import ctypes
+import queue
+import shutil
+import struct
+import subprocess
+import threading
+import time
+import zlib
+from pathlib import Path
+
+import numpy as np
+from OpenGL.GL import (
+    GL_MAP_READ_BIT, GL_PIXEL_PACK_BUFFER, GL_RGBA, GL_STREAM_READ,
+    GL_UNSIGNED_BYTE, glBindBuffer, glBufferData, glDeleteBuffers, glGenBuffers,
+    glMapBufferRange, glReadPixels, glUnmapBuffer,
+)
+
+
+# PBO 링 크기 (2 = 한 프레임 여유를 두고 읽기 완료된 버퍼만 매핑)
+DEFAULT_PBO_COUNT = 2
+
+# 쓰기 스레드가 밀릴 때 보관할 최대 프레임 수 (넘으면 버림)
+DEFAULT_QUEUE_FRAMES = 16
+
+VIDEO_EXTENSIONS = ('.mp4', '.mov', '.mkv', '.webm', '.avi')
+RAW_EXTENSIONS = ('.rgba', '.raw')
+
+
+def write_png(path, rgba, level=1):
+    """위쪽 행부터인 (H, W, 4) uint8 배열을 RGBA PNG로 저장"""
+    height, width = rgba.shape[:2]
+    # 행마다 필터 바이트(0 = None)를 붙여 zlib 압축 (압축 중에는 GIL 해제)
+    rows = np.empty((height, width * 4 + 1), dtype=np.uint8)
+    rows[:, 0] = 0
+    rows[:, 1:] = rgba.reshape(height, width * 4)
+    
+    def chunk(tag, data):
+        return (struct.pack('>I', len(data)) + tag + data +
+                struct.pack('>I', zlib.crc32(tag + data) & 0xffffffff))
+    
+    header = struct.pack('>IIBBBBB', width, height, 8, 6, 0, 0, 0)
+    with open(path, 'wb') as f:
+        f.write(b'\x89PNG\r\n\x1a\n')
+        f.write(chunk(b'IHDR', header))
+        f.write(chunk(b'IDAT', zlib.compress(rows.tobytes(), level)))
+        f.write(chunk(b'IEND', b''))
+
+
+class PngSequenceWriter:
+    """프레임을 디렉터리에 frame_000000.png ... 로 저장 (여러 스레드로 병렬 인코딩)"""
+    
+    threads = 2
+    
+    def __init__(self, directory, pattern='frame_{:06d}.png', level=1):
+        self.directory = Path(directory)
+        self.pattern = pattern
+        self.level = level
+    
+    def open(self):
+        self.directory.mkdir(parents=True, exist_ok=True)
+    
+    def write(self, index, frame):
+        write_png(self.directory / self.pattern.format(index), frame[::-1], self.level)
+    
+    def close(self):
+        pass
+    
+    def describe(self):
+        return f"PNG {self.directory}/"
+
+
+class VideoPipeWriter:
+    """원시 RGBA 프레임을 ffmpeg stdin 파이프(또는 .rgba/.raw 파일)로 기록
+    
+    영상 크기는 첫 프레임에서 정해지며, 이후 크기가 다른 프레임(창 크기 변경)은 건너뜁니다.
+    """
+    
+    threads = 1         # 프레임 순서 유지
+    
+    def __init__(self, path, fps=60.0, ffmpeg='ffmpeg'):
+        self.path = Path(path)
+        self.fps = fps
+        self.ffmpeg = ffmpeg
+        self.raw = self.path.suffix.lower() in RAW_EXTENSIONS
+        self.size = None
+        self.skipped = 0
+        self._process = None
+        self._file = None
+    
+    def open(self):
+        if not self.raw and shutil.which(self.ffmpeg) is None:
+            raise OSError(f"ffmpeg를 찾을 수 없습니다: {self.ffmpeg} (.rgba 출력은 ffmpeg 없이 가능)")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+    
+    def _start(self, width, height):
+        self.size = (width, height)
+        if self.raw:
+            self._file = open(self.path, 'wb')
+            return
+        command = [
+            self.ffmpeg, '-loglevel', 'error', '-y',
+            '-f', 'rawvideo', '-pix_fmt', 'rgba', '-s', f'{width}x{height}', '-r', f'{self.fps:g}',
+            '-i', '-', '-an',
+            # 아래쪽 행부터인 GL 프레임을 뒤집고, yuv420p는 짝수 크기만 허용하므로 잘라냄
+            '-vf', 'vflip,crop=trunc(iw/2)*2:trunc(ih/2)*2',
+        ]
+        if self.path.suffix.lower() != '.webm':
+            command += ['-c:v', 'libx264', '-preset', 'veryfast']
+        command += ['-pix_fmt', 'yuv420p', str(self.path)]
+        self._process = subprocess.Popen(command, stdin=subprocess.PIPE)
+        self._file = self._process.stdin
+    
+    def write(self, index, frame):
+        height, width = frame.shape[:2]
+        if self.size is None:
+            self._start(width, height)
+        elif self.size != (width, height):
+            self.skipped += 1
+            return
+        if self.raw:
+            # .rgba는 위쪽 행부터 저장 (ffmpeg -f rawvideo -pix_fmt rgba로 바로 읽기 가능)
+            frame = frame[::-1]
+        self._file.write(np.ascontiguousarray(frame).data)
+    
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self._process is not None:
+            self._process.wait()
+            self._process = None
+    
+    def describe(self):
+        kind = "raw" if self.raw else "ffmpeg"
+        size = f" {self.size[0]}x{self.size[1]}" if self.size else ""
+        return f"{kind} {self.path}{size} @ {self.fps:g} fps"
+
+
+def open_writer(target, fps=60.0):
+    """출력 경로로 쓰기 객체 선택 (영상/원시 확장자면 파이프, 아니면 PNG 디렉터리)"""
+    suffix = Path(target).suffix.lower()
+    if suffix in VIDEO_EXTENSIONS or suffix in RAW_EXTENSIONS:
+        return VideoPipeWriter(target, fps)
+    return PngSequenceWriter(target)
+
+
+class FrameCapture:
+    """PBO 링으로 비동기 리드백한 프레임을 쓰기 스레드에 전달"""
+    
+    def __init__(self, writer, buffers=DEFAULT_PBO_COUNT, queue_frames=DEFAULT_QUEUE_FRAMES):
+        self.writer = writer
+        self.buffer_count = max(2, buffers)
+        self._queue = queue.Queue(maxsize=queue_frames)
+        self._threads = []
+        self._free = []             # 재사용할 프레임 배열 (쓰기 완료 후 반환)
+        self._lock = threading.Lock()
+        
+        # PBO 링 (첫 capture에서 생성, 크기가 바뀌면 다시 생성)
+        self._pbos = []
+        self._pending = []          # 슬롯별 예약된 프레임 번호 (없으면 None)
+        self._size = None
+        self._frame = 0
+        
+        # 통계
+        self.captured = 0           # 읽기 예약한 프레임
+        self.written = 0            # 쓰기 완료
+        self.dropped = 0            # 큐가 가득 차 버린 프레임
+        self.errors = 0
+        self.last_error = None
+        self.capture_seconds = 0.0  # capture() 누적 시간 (GUI 스레드 비용)
+    
+    @property
+    def running(self):
+        return bool(self._threads)
+    
+    def start(self):
+        """쓰기 스레드 시작 (출력을 열 수 없으면 OSError)"""
+        self.writer.open()
+        for i in range(self.writer.threads):
+            thread = threading.Thread(target=self._run, name=f'FrameWriter-{i}', daemon=True)
+            thread.start()
+            self._threads.append(thread)
+    
+    def capture(self, width, height):
+        """현재 바인딩된 프레임버퍼의 읽기를 예약 (paintGL 안, 씬 렌더링 직후 호출)"""
+        start = time.perf_counter()
+        if (width, height) != self._size:
+            self._resize(width, height)
+        
+        slot = self._frame % self.buffer_count
+        if self._pending[slot] is not None:
+            self._collect(slot)
+        
+        glBindBuffer(GL_PIXEL_PACK_BUFFER, self._pbos[slot])
+        glReadPixels(0, 0, width, height, GL_RGBA, GL_UNSIGNED_BYTE, ctypes.c_void_p(0))
+        glBindBuffer(GL_PIXEL_PACK_BUFFER, 0)
+        self._pending[slot] = self._frame
+        
+        self._frame += 1
+        self.captured += 1
+        self.capture_seconds += time.perf_counter() - start
+    
+    def stop(self):
+        """남은 PBO를 모두 비우고 쓰기 스레드 종료 (GL 컨텍스트 활성 상태에서 호출)"""
+        self._flush()
+        self._release_buffers()
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+        self.writer.close()
+    
+    def stats(self):
+        avg = self.capture_seconds / self.captured * 1000.0 if self.captured else 0.0
+        text = (f"녹화 {self.writer.describe()}: 프레임 {self.captured} → 저장 {self.written}, "
+                f"버림 {self.dropped}, 대기 {self._queue.qsize()}, 리드백 {avg:.2f} ms/프레임")
+        if self.errors:
+            text += f", 오류 {self.errors} ({self.last_error})"
+        return text
+    
+    def _resize(self, width, height):
+        # 예약된 프레임은 이전 크기로 먼저 내보냄
+        self._flush()
+        self._release_buffers()
+        self._size = (width, height)
+        self._pbos = [int(pbo) for pbo in np.atleast_1d(glGenBuffers(self.buffer_count))]
+        self._pending = [None] * self.buffer_count
+        nbytes = width * height * 4
+        for pbo in self._pbos:
+            glBindBuffer(GL_PIXEL_PACK_BUFFER, pbo)
+            glBufferData(GL_PIXEL_PACK_BUFFER, nbytes, None, GL_STREAM_READ)
+        glBindBuffer(GL_PIXEL_PACK_BUFFER, 0)
+        with self._lock:
+            self._free = []
+    
+    def _flush(self):
+        """예약된 슬롯을 프레임 순서대로 수거"""
+        if not self._pbos:
+            return
+        slots = [slot for slot, index in enumerate(self._pending) if index is not None]
+        for slot in sorted(slots, key=lambda s: self._pending[s]):
+            self._collect(slot)
+    
+    def _release_buffers(self):
+        if self._pbos:
+            glDeleteBuffers(len(self._pbos), self._pbos)
+        self._pbos = []
+        self._pending = []
+        self._size = None
+    
+    def _collect(self, slot):
+        """슬롯의 PBO를 매핑해 프레임 배열로 복사하고 큐에 전달"""
+        index = self._pending[slot]
+        self._pending[slot] = None
+        width, height = self._size
+        nbytes = width * height * 4
+        
+        with self._lock:
+            frame = self._free.pop() if self._free else None
+        if frame is None:
+            frame = np.empty((height, width, 4), dtype=np.uint8)
+        
+        glBindBuffer(GL_PIXEL_PACK_BUFFER, self._pbos[slot])
+        pointer = glMapBufferRange(GL_PIXEL_PACK_BUFFER, 0, nbytes, GL_MAP_READ_BIT)
+        if pointer:
+            ctypes.memmove(frame.ctypes.data, pointer, nbytes)
+        glUnmapBuffer(GL_PIXEL_PACK_BUFFER)
+        glBindBuffer(GL_PIXEL_PACK_BUFFER, 0)
+        if not pointer:
+            self.errors += 1
+            self.last_error = "PBO 매핑 실패"
+            self._recycle(frame)
+            return
+        
+        try:
+            self._queue.put_nowait((index, frame))
+        except queue.Full:
+            self.dropped += 1
+            self._recycle(frame)
+    
+    def _recycle(self, frame):
+        if self._size is not None and frame.shape[:2] == (self._size[1], self._size[0]):
+            with self._lock:
+                if len(self._free) < self._queue.maxsize:
+                    self._free.append(frame)
+    
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            index, frame = item
+            try:
+                self.writer.write(index, frame)
+            except (OSError, ValueError) as e:
+                with self._lock:
+                    self.errors += 1
+                    self.last_error = str(e)
+            else:
+                with self._lock:
+                    self.written += 1
+            self._recycle(frame)
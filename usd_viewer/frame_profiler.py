@@ -0,0 +1,141 @@
+"""
+Frame Profiler - 프레임 단계별 시간 측정
+========================================
+
+paintGL/render 한 프레임을 단계별로 측정하고
+최근 N 프레임의 FPS와 p50/p95/p99 프레임 시간을 계산합니다.
+--profile-csv 옵션을 주면 프레임마다 한 줄씩 CSV로 기록합니다.
+
+측정 단계:
+    traversal     - 스테이지 순회 / 드로우 항목 수집
+    attributes    - USD 속성 읽기 (points, displayColor, 파라미터 등)
+    transforms    - 월드 변환 계산
+    culling       - 프러스텀 컬링
+    gl_submit     - OpenGL 드로우 콜 제출
+    hydra_render  - UsdImagingGL.Engine.Render
+    readback      - 녹화 중 PBO 리드백 예약/수거 (frame_capture.FrameCapture.capture)
+
+사용 예:
+    profiler.begin_frame()
+    with profiler.phase('gl_submit'):
+        ...
+    profiler.end_frame()
+"""
+
+import csv
+import time
+from collections import deque
+from contextlib import contextmanager
+
+import numpy as np
+
+
+PHASES = ('traversal', 'attributes', 'transforms', 'culling', 'gl_submit', 'hydra_render', 'readback')
+
+
+class FrameProfiler:
+    """프레임 단계별 타이머 (롤링 통계 + CSV 기록)"""
+    
+    def __init__(self, window=120, csv_path=None):
+        self.window = window
+        self.frame_times = deque(maxlen=window)     # begin_frame ~ end_frame (초)
+        self.frame_starts = deque(maxlen=window)    # FPS 계산용 프레임 시작 시각
+        self.frame_index = 0
+        
+        self._frame_start = None
+        self._phases = dict.fromkeys(PHASES, 0.0)
+        self.last_phases = dict(self._phases)
+        self.phase_totals = dict(self._phases)      # reset() 이후 단계별 누적 시간 (초)
+        
+        self._csv_file = None
+        self._csv_writer = None
+        if csv_path:
+            self._csv_file = open(csv_path, 'w', newline='')
+            self._csv_writer = csv.writer(self._csv_file)
+            self._csv_writer.writerow(['frame', 'frame_ms'] + [f'{name}_ms' for name in PHASES])
+    
+    # === 측정 ===
+    
+    def begin_frame(self):
+        self._frame_start = time.perf_counter()
+        self._phases = dict.fromkeys(PHASES, 0.0)
+    
+    @contextmanager
+    def phase(self, name):
+        """with 블록 시간을 name 단계에 누적"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._phases[name] += time.perf_counter() - start
+    
+    def add(self, name, seconds):
+        """다른 곳에서 측정한 시간을 name 단계에 누적 (예: DrawCache.timings)"""
+        self._phases[name] += seconds
+    
+    def add_timings(self, timings):
+        for name, seconds in timings.items():
+            self.add(name, seconds)
+    
+    def end_frame(self):
+        """프레임 종료 (프레임 시간 반환, 초)"""
+        if self._frame_start is None:
+            return 0.0
+        
+        elapsed = time.perf_counter() - self._frame_start
+        self.frame_times.append(elapsed)
+        self.frame_starts.append(self._frame_start)
+        self.last_phases = self._phases
+        self._frame_start = None
+        for name, seconds in self._phases.items():
+            self.phase_totals[name] += seconds
+        
+        if self._csv_writer:
+            self._csv_writer.writerow(
+                [self.frame_index, f"{elapsed * 1000:.3f}"] +
+                [f"{self._phases[name] * 1000:.3f}" for name in PHASES]
+            )
+        self.frame_index += 1
+        return elapsed
+    
+    def reset(self):
+        """롤링 통계와 누적 시간 초기화 (CSV 기록은 유지)"""
+        self.frame_times.clear()
+        self.frame_starts.clear()
+        self.phase_totals = dict.fromkeys(PHASES, 0.0)
+    
+    # === 통계 ===
+    
+    def fps(self):
+        """최근 프레임 시작 간격 기준 FPS"""
+        if len(self.frame_starts) < 2:
+            return 0.0
+        span = self.frame_starts[-1] - self.frame_starts[0]
+        return (len(self.frame_starts) - 1) / span if span > 0 else 0.0
+    
+    def percentiles(self, qs=(50, 95, 99)):
+        """최근 프레임 시간 백분위수 (ms)"""
+        if not self.frame_times:
+            return dict.fromkeys(qs, 0.0)
+        values = np.percentile(np.asarray(self.frame_times) * 1000, qs)
+        return dict(zip(qs, values))
+    
+    def overlay_lines(self):
+        """오버레이/창 제목용 요약 문자열 목록"""
+        p = self.percentiles()
+        lines = [
+            f"FPS {self.fps():.1f}",
+            f"frame p50 {p[50]:.2f} / p95 {p[95]:.2f} / p99 {p[99]:.2f} ms",
+        ]
+        for name in PHASES:
+            seconds = self.last_phases[name]
+            if seconds > 0:
+                lines.append(f"  {name:<12} {seconds * 1000:7.2f} ms")
+        return lines
+    
+    def close(self):
+        """CSV 파일 닫기"""
+        if self._csv_file:
+            self._csv_file.close()
+            self._csv_file = None
+            self._csv_writer = None
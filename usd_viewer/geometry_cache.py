@@ -0,0 +1,173 @@
+"""
+Geometry Cache - 시간 샘플 메시의 LRU 버텍스 캐시
+==================================================
+
+애니메이션/변형 메시를 재생하거나 스크러빙할 때 같은 시간의 포인트를
+다시 읽고 삼각형 분할하지 않도록, (프림 경로, 시간 코드)별로
+업로드 직전의 펼친 버텍스/노멀 배열을 메모리 상한 안에서 보관합니다.
+
+- 토폴로지(faceVertexCounts/Indices)가 시간에 따라 변하지 않으면
+  삼각형 분할 결과를 메시당 한 번만 계산해 모든 시간 샘플이 공유
+- 상한을 넘으면 가장 오래 사용하지 않은 항목부터 제거
+- 렌더링 스레드와 프리페치 스레드가 함께 사용 (내부 잠금)
+"""
+
+import threading
+from collections import OrderedDict
+
+from pxr import Usd
+
+from mesh_utils import (face_normals, flat_vertex_arrays, extract_mesh_arrays,
+                        points_to_array, triangulate)
+
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+_MISSING = object()
+
+
+class GeometryCache:
+    """(경로, 시간) → (positions, normals) 펼친 배열 LRU 캐시"""
+    
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()   # (Sdf.Path, float) -> (positions, normals) 또는 None
+        self._topology = {}             # Sdf.Path -> (triangles, 포인트 수) (정적 토폴로지만)
+        self._lock = threading.Lock()
+        self.nbytes = 0
+        
+        # 통계 (렌더링 스레드 조회 기준)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def __len__(self):
+        return len(self._entries)
+    
+    def contains(self, path, time):
+        with self._lock:
+            return (path, time) in self._entries
+    
+    def fetch(self, usd_mesh, time, count=True):
+        """캐시에서 꺼내거나 읽어서 저장한 (positions, normals) (데이터가 없으면 None)
+        
+        Args:
+            count: 적중 통계에 포함할지 (프리페치 스레드는 False)
+        """
+        path = usd_mesh.GetPath()
+        key = (path, time)
+        with self._lock:
+            arrays = self._entries.get(key, _MISSING)
+            if arrays is not _MISSING:
+                self._entries.move_to_end(key)
+                if count:
+                    self.hits += 1
+                return arrays
+            if count:
+                self.misses += 1
+        
+        arrays = self._read(usd_mesh, time)
+        self._put(key, arrays)
+        return arrays
+    
+    def invalidate(self, path):
+        """path 서브트리의 모든 시간 샘플과 토폴로지 제거 (스테이지 편집 시)"""
+        with self._lock:
+            for key in [k for k in self._entries if k[0].HasPrefix(path)]:
+                self.nbytes -= _entry_bytes(self._entries.pop(key))
+            for topology_path in [p for p in self._topology if p.HasPrefix(path)]:
+                del self._topology[topology_path]
+    
+    def set_max_bytes(self, max_bytes):
+        """메모리 상한 변경 (줄이면 오래된 항목부터 바로 제거)"""
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict()
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._topology.clear()
+            self.nbytes = 0
+    
+    def reset_stats(self):
+        self.hits = self.misses = self.evictions = 0
+    
+    def stats(self):
+        """적중률/메모리 사용량 문자열"""
+        total = self.hits + self.misses
+        rate = self.hits / total if total else 0.0
+        return (f"지오메트리 캐시 적중 {self.hits}/{total} ({rate:.0%}), "
+                f"{len(self._entries)}개 {self.nbytes / 1e6:.1f}/{self.max_bytes / 1e6:.0f} MB, "
+                f"제거 {self.evictions}")
+    
+    # === 내부 ===
+    
+    def _put(self, key, arrays):
+        size = _entry_bytes(arrays)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, _MISSING)
+            if previous is not _MISSING:
+                self.nbytes -= _entry_bytes(previous)
+            self._entries[key] = arrays
+            self.nbytes += size
+            self._evict()
+    
+    def _evict(self):
+        """상한 이하가 될 때까지 LRU 항목 제거 (_lock 보유 상태에서 호출)"""
+        while self.nbytes > self.max_bytes and self._entries:
+            _, evicted = self._entries.popitem(last=False)
+            self.nbytes -= _entry_bytes(evicted)
+            self.evictions += 1
+    
+    def _read(self, usd_mesh, time):
+        """time의 포인트를 읽어 펼친 배열 생성 (정적 토폴로지는 공유)"""
+        time_code = Usd.TimeCode(time)
+        topology = self._static_topology(usd_mesh)
+        if topology is None:
+            arrays = extract_mesh_arrays(usd_mesh, time_code)
+            if arrays is None:
+                return None
+            positions, triangles = arrays
+        else:
+            positions = points_to_array(usd_mesh.GetPointsAttr().Get(time_code))
+            triangles, num_points = topology
+            if len(positions) != num_points:
+                # 포인트 수가 바뀌면 인덱스 범위 검사를 다시 해야 하므로 전체 추출
+                arrays = extract_mesh_arrays(usd_mesh, time_code)
+                if arrays is None:
+                    return None
+                positions, triangles = arrays
+        if len(positions) == 0 or len(triangles) == 0:
+            return None
+        return flat_vertex_arrays(positions, triangles, face_normals(positions, triangles))
+    
+    def _static_topology(self, usd_mesh):
+        """시간에 따라 변하지 않는 토폴로지면 (triangles, 포인트 수), 아니면 None"""
+        path = usd_mesh.GetPath()
+        topology = self._topology.get(path)
+        if topology is not None:
+            return topology
+        
+        counts_attr = usd_mesh.GetFaceVertexCountsAttr()
+        indices_attr = usd_mesh.GetFaceVertexIndicesAttr()
+        if counts_attr.ValueMightBeTimeVarying() or indices_attr.ValueMightBeTimeVarying():
+            return None
+        
+        counts = counts_attr.Get()
+        indices = indices_attr.Get()
+        points = usd_mesh.GetPointsAttr().Get(Usd.TimeCode.EarliestTime())
+        if not counts or not indices or not points:
+            return None
+        topology = (triangulate(counts, indices, num_points=len(points)), len(points))
+        self._topology[path] = topology
+        return topology
+
+
+def _entry_bytes(arrays):
+    if arrays is None or arrays is _MISSING:
+        return 0
+    positions, normals = arrays
+    return positions.nbytes + normals.nbytes
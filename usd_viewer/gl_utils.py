@@ -0,0 +1,134 @@
+"""
+GL Utils - 뷰어 공용 OpenGL 드로우 헬퍼
+=======================================
+
+NumPy 배열을 OpenGL에 그대로 전달하는 렌더링 함수 모음.
+(GLFW 기본 뷰어와 Qt 뷰어 모두 동일한 고정 파이프라인 컨텍스트를 사용)
+
+의존성:
+    pip install PyOpenGL numpy
+"""
+
+import ctypes
+
+import numpy as np
+from OpenGL.GL import *
+
+
+def draw_triangle_arrays(positions, normals):
+    """펼쳐진 삼각형 버텍스/노멀 배열을 한 번의 드로우 콜로 렌더링"""
+    if len(positions) == 0:
+        return
+    glEnableClientState(GL_VERTEX_ARRAY)
+    glEnableClientState(GL_NORMAL_ARRAY)
+    glVertexPointer(3, GL_FLOAT, 0, positions)
+    glNormalPointer(GL_FLOAT, 0, normals)
+    glDrawArrays(GL_TRIANGLES, 0, len(positions))
+    glDisableClientState(GL_NORMAL_ARRAY)
+    glDisableClientState(GL_VERTEX_ARRAY)
+
+
+def buffers_supported():
+    """버퍼 오브젝트(VBO/IBO) 사용 가능 여부 (현재 컨텍스트 기준)"""
+    try:
+        return bool(glGenBuffers) and bool(glBindBuffer) and bool(glBufferData)
+    except Exception:
+        return False
+
+
+class MeshBuffers:
+    """버텍스/노멀(/인덱스)을 GPU 버퍼에 한 번 업로드하고 드로우 콜 한 번으로 렌더링
+    
+    인덱스가 있으면 glDrawElements, 없으면 (삼각형마다 펼친 버텍스) glDrawArrays로
+    그립니다. 이미 연속된 float32/uint32 배열(Vt 배열 뷰, mmap 포함)은 복사 없이
+    glBufferData에 그대로 전달됩니다.
+    """
+    
+    def __init__(self, positions, normals, indices=None):
+        positions = np.ascontiguousarray(positions, dtype=np.float32).reshape(-1, 3)
+        normals = np.ascontiguousarray(normals, dtype=np.float32).reshape(-1, 3)
+        
+        self.vertex_count = len(positions)
+        self.nbytes = positions.nbytes + normals.nbytes
+        
+        self.vbo, self.nbo = glGenBuffers(2)
+        self.ibo = 0
+        
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo)
+        glBufferData(GL_ARRAY_BUFFER, positions.nbytes, positions, GL_STATIC_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, self.nbo)
+        glBufferData(GL_ARRAY_BUFFER, normals.nbytes, normals, GL_STATIC_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        
+        if indices is None:
+            # 펼친 버텍스는 순서대로 그리므로 항등 인덱스 버퍼를 만들지 않음
+            self.index_count = self.vertex_count
+            return
+        
+        indices = np.ascontiguousarray(indices, dtype=np.uint32).reshape(-1)
+        self.index_count = len(indices)
+        self.nbytes += indices.nbytes
+        
+        self.ibo = glGenBuffers(1)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self.ibo)
+        glBufferData(GL_ELEMENT_ARRAY_BUFFER, indices.nbytes, indices, GL_STATIC_DRAW)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+    
+    def update(self, positions, normals):
+        """버텍스/노멀을 glBufferSubData로 덮어쓰기 (버텍스 수가 다르면 False)
+        
+        변형 메시 재생처럼 토폴로지는 같고 포인트만 바뀔 때
+        버퍼를 다시 만들지 않고 내용만 교체합니다.
+        """
+        positions = np.ascontiguousarray(positions, dtype=np.float32).reshape(-1, 3)
+        normals = np.ascontiguousarray(normals, dtype=np.float32).reshape(-1, 3)
+        if len(positions) != self.vertex_count or len(normals) != self.vertex_count:
+            return False
+        
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo)
+        glBufferSubData(GL_ARRAY_BUFFER, 0, positions.nbytes, positions)
+        glBindBuffer(GL_ARRAY_BUFFER, self.nbo)
+        glBufferSubData(GL_ARRAY_BUFFER, 0, normals.nbytes, normals)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        return True
+    
+    def draw(self, mode=GL_TRIANGLES):
+        """버퍼에 저장된 메시를 한 번의 드로우 콜로 렌더링"""
+        if self.index_count == 0:
+            return
+        self.bind()
+        self.draw_bound(mode)
+        self.unbind()
+    
+    def bind(self):
+        """버퍼 바인딩 (같은 메시를 여러 번 그릴 때 한 번만 호출)"""
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_NORMAL_ARRAY)
+        
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo)
+        glVertexPointer(3, GL_FLOAT, 0, ctypes.c_void_p(0))
+        glBindBuffer(GL_ARRAY_BUFFER, self.nbo)
+        glNormalPointer(GL_FLOAT, 0, ctypes.c_void_p(0))
+        if self.ibo:
+            glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self.ibo)
+    
+    def draw_bound(self, mode=GL_TRIANGLES):
+        """bind() 이후 드로우 콜만 수행"""
+        if self.ibo:
+            glDrawElements(mode, self.index_count, GL_UNSIGNED_INT, ctypes.c_void_p(0))
+        else:
+            glDrawArrays(mode, 0, self.vertex_count)
+    
+    def unbind(self):
+        if self.ibo:
+            glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        glDisableClientState(GL_NORMAL_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+    
+    def release(self):
+        """GPU 버퍼 해제 (GL 컨텍스트가 활성 상태여야 함)"""
+        if self.vbo:
+            buffers = [self.vbo, self.nbo] + ([self.ibo] if self.ibo else [])
+            glDeleteBuffers(len(buffers), buffers)
+            self.vbo = self.nbo = self.ibo = 0
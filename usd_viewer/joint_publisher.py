@@ -0,0 +1,130 @@
+"""
+관절 상태 퍼블리셔 (테스트용)
+==============================
+
+시뮬레이터 대신 관절 각도 패킷을 일정 주기로 보냅니다.
+뷰어의 --stream 입력(joint_stream.py)을 시험할 때 사용합니다.
+
+사용법:
+    python joint_publisher.py                                  # Go2 관절 12개 사인파, 1 kHz
+    python joint_publisher.py --usd ../go2.usd --rate 500      # 스테이지의 관절 이름 사용
+    python joint_publisher.py --trajectory walk.csv            # 기록된 궤적을 반복 재생
+    python joint_publisher.py --address unix:///tmp/joints.sock
+
+뷰어:
+    python usd_hydra_viewer.py ../go2.usd --stream udp://127.0.0.1:9870
+"""
+
+import math
+import socket
+import time
+import argparse
+
+import numpy as np
+
+from joint_stream import DEFAULT_ADDRESS, encode_packet, parse_address
+
+
+# --usd/--joints/--trajectory가 없을 때 보낼 관절 (Unitree Go2)
+GO2_JOINTS = [f"{leg}_{part}_joint"
+              for leg in ('FL', 'FR', 'RL', 'RR') for part in ('hip', 'thigh', 'calf')]
+
+
+def joint_names_from_stage(filepath):
+    from pxr import Usd
+    from joint_replay import JointRig
+    
+    stage = Usd.Stage.Open(filepath)
+    if not stage:
+        raise SystemExit(f"USD 파일을 열 수 없습니다: {filepath}")
+    names = JointRig(stage).names
+    if not names:
+        raise SystemExit(f"물리 관절이 없습니다: {filepath}")
+    return names
+
+
+def sine_source(names, amplitude, frequency):
+    """시간(초) → 관절 값 (관절마다 위상이 다른 사인파)"""
+    phases = np.linspace(0.0, math.pi, len(names), endpoint=False)
+    
+    def values(t):
+        return amplitude * np.sin(2.0 * math.pi * frequency * t + phases)
+    return values
+
+
+def trajectory_source(trajectory):
+    """시간(초) → 궤적의 해당 프레임 값 (끝나면 처음부터 반복)"""
+    def values(t):
+        frame = int(t * trajectory.rate) % trajectory.frame_count
+        return trajectory.positions[frame]
+    return values
+
+
+def main():
+    parser = argparse.ArgumentParser(description="관절 상태 패킷 퍼블리셔 (테스트용)")
+    parser.add_argument("--address", default=DEFAULT_ADDRESS,
+                        help=f"보낼 주소 (기본 {DEFAULT_ADDRESS}, unix:///path 가능)")
+    parser.add_argument("--rate", type=float, help="패킷 주기 Hz (기본 1000, 궤적은 궤적 주기)")
+    parser.add_argument("--usd", metavar="PATH", help="관절 이름을 읽을 USD 파일")
+    parser.add_argument("--joints", nargs="+", help="관절 이름 목록")
+    parser.add_argument("--trajectory", metavar="PATH", help="반복 재생할 궤적 (CSV/.npy/.npz)")
+    parser.add_argument("--amplitude", type=float, default=0.4, help="사인파 진폭 (라디안)")
+    parser.add_argument("--frequency", type=float, default=1.0, help="사인파 주파수 (Hz)")
+    parser.add_argument("--duration", type=float, default=0.0, help="보낼 시간 (초, 0이면 무한)")
+    args = parser.parse_args()
+    
+    if args.trajectory:
+        from joint_replay import load_trajectory
+        trajectory = load_trajectory(args.trajectory)
+        names = trajectory.names or args.joints or (
+            joint_names_from_stage(args.usd) if args.usd else GO2_JOINTS)
+        if len(names) != trajectory.positions.shape[1]:
+            raise SystemExit(f"관절 이름 {len(names)}개와 궤적 열 {trajectory.positions.shape[1]}개가 다릅니다")
+        source = trajectory_source(trajectory)
+        rate = args.rate or trajectory.rate
+    else:
+        names = args.joints or (joint_names_from_stage(args.usd) if args.usd else GO2_JOINTS)
+        source = sine_source(names, args.amplitude, args.frequency)
+        rate = args.rate or 1000.0
+    
+    family, address = parse_address(args.address)
+    sock = socket.socket(family, socket.SOCK_DGRAM)
+    print(f"{args.address}로 관절 {len(names)}개를 {rate:g} Hz로 전송 (Ctrl+C로 종료)")
+    
+    period = 1.0 / rate
+    start = time.perf_counter()
+    report_at = start + 1.0
+    seq = sent = failed = 0
+    try:
+        while True:
+            now = time.perf_counter()
+            t = now - start
+            if args.duration and t >= args.duration:
+                break
+            
+            packet = encode_packet(dict(zip(names, source(t))), seq)
+            try:
+                sock.sendto(packet, address)
+                sent += 1
+            except OSError:
+                # 수신 측이 아직 없으면 (Unix 소켓 미생성 등) 계속 시도
+                failed += 1
+            seq += 1
+            
+            if now >= report_at:
+                print(f"  {t:6.1f}s  전송 {sent}  실패 {failed}  ({sent / t:.0f} Hz)")
+                report_at += 1.0
+            
+            # 절대 일정 기준으로 대기 (지연이 누적되지 않도록)
+            delay = start + seq * period - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        sock.close()
+    print(f"전송 {sent}, 실패 {failed}")
+
+
+if __name__ == "__main__":
+    main()
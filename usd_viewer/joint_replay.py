@@ -0,0 +1,377 @@
+"""
+Joint Replay - 기록된 관절 궤적을 링크 변환으로 재생
+====================================================
+
+Go2/G1/H1/B2 같은 관절 로봇 스테이지에 로봇 로그(관절 각도 CSV/NumPy)를
+재생합니다. Qt 비의존 로직이며 두 Qt 뷰어가 사용합니다.
+
+- UsdPhysics 관절(revolute/prismatic/fixed)의 body0/body1과 관절 프레임
+  (localPos/localRot)으로 각 링크의 포즈를 계산 (NumPy로 전체 프레임을 한 번에)
+- 결과는 세션 레이어에 링크별 xformOp:transform 시간 샘플로 기록
+  (Sdf API + Sdf.ChangeBlock으로 알림 한 번, 원본 레이어는 변경하지 않음)
+- 세션 레이어의 startTimeCode/endTimeCode/timeCodesPerSecond를 로그 주기로
+  설정하므로 기존 재생 엔진(Playback)과 프리페치가 그대로 실시간 재생
+
+스트리밍처럼 한 프레임씩 들어오는 경우에는 write_pose()로 기본값만 덮어씁니다.
+
+궤적 파일 형식:
+    CSV  - 첫 행은 관절 이름 (선택적으로 첫 열 time/t/timestamp 초 단위)
+           헤더가 없으면 열 순서 = JointRig.names
+    .npy - (프레임, 관절) 배열, 열 순서 = JointRig.names
+    .npz - positions (필수), names, times (선택)
+각도는 라디안, prismatic 관절은 스테이지 단위 거리입니다.
+"""
+
+import csv
+import time
+from pathlib import Path
+
+import numpy as np
+from pxr import Usd, UsdGeom, UsdPhysics, Sdf, Gf
+
+
+# 시간 열이 없는 로그의 기본 샘플링 주기 (Hz)
+DEFAULT_RATE = 50.0
+
+TIME_COLUMNS = ('time', 't', 'timestamp')
+
+# 링크에 덮어쓰는 변환 속성
+TRANSFORM_ATTR = 'xformOp:transform'
+
+_AXES = {'X': 0, 'Y': 1, 'Z': 2}
+
+
+class JointTrajectory:
+    """관절 이름별 위치 시계열 (positions: 프레임 x 관절, float64)"""
+    
+    def __init__(self, positions, names=None, times=None, rate=None):
+        self.positions = np.asarray(positions, dtype=np.float64)
+        if self.positions.ndim == 1:
+            self.positions = self.positions[:, None]
+        self.names = list(names) if names is not None else None
+        self.times = None if times is None else np.asarray(times, dtype=np.float64)
+        
+        if rate:
+            self.rate = float(rate)
+        elif self.times is not None and len(self.times) > 1:
+            # 타임스탬프 반올림 오차 제거 (500 Hz 로그가 499.999...로 나오지 않도록)
+            self.rate = round(1.0 / float(np.median(np.diff(self.times))), 6)
+        else:
+            self.rate = DEFAULT_RATE
+    
+    @property
+    def frame_count(self):
+        return len(self.positions)
+    
+    @property
+    def duration(self):
+        return (self.frame_count - 1) / self.rate if self.frame_count else 0.0
+    
+    def columns_for(self, joint_names):
+        """joint_names 순서의 (프레임, 관절) 배열과 매칭되지 않은 이름들
+        
+        로그에 없는 관절은 0(기본 자세)으로 둡니다.
+        """
+        frames = self.frame_count
+        if self.names is None:
+            if self.positions.shape[1] != len(joint_names):
+                raise ValueError(
+                    f"관절 이름이 없는 궤적의 열 수({self.positions.shape[1]})가 "
+                    f"관절 수({len(joint_names)})와 다릅니다"
+                )
+            return self.positions, [], []
+        
+        columns = {joint_key(name): i for i, name in enumerate(self.names)}
+        result = np.zeros((frames, len(joint_names)), dtype=np.float64)
+        missing = []
+        used = set()
+        for j, name in enumerate(joint_names):
+            column = columns.get(joint_key(name))
+            if column is None:
+                missing.append(name)
+            else:
+                result[:, j] = self.positions[:, column]
+                used.add(column)
+        unused = [name for i, name in enumerate(self.names) if i not in used]
+        return result, missing, unused
+
+
+def joint_key(name):
+    """CSV 이름과 관절 프림 이름 비교용 ('FL_hip_joint' == 'FL_hip')"""
+    name = name.strip()
+    return name[:-len('_joint')] if name.endswith('_joint') else name
+
+
+def load_trajectory(path, rate=None):
+    """CSV/.npy/.npz 궤적 파일 읽기"""
+    path = Path(path)
+    suffix = path.suffix.lower()
+    
+    if suffix == '.npy':
+        return JointTrajectory(np.load(path), rate=rate)
+    
+    if suffix == '.npz':
+        with np.load(path) as data:
+            names = [str(n) for n in data['names']] if 'names' in data else None
+            times = data['times'] if 'times' in data else None
+            return JointTrajectory(data['positions'], names, times, rate)
+    
+    with open(path, newline='') as f:
+        rows = [row for row in csv.reader(f) if row]
+    if not rows:
+        raise ValueError(f"빈 궤적 파일: {path}")
+    
+    names = None
+    try:
+        float(rows[0][0])
+    except ValueError:
+        names, rows = [name.strip() for name in rows[0]], rows[1:]
+    values = np.array(rows, dtype=np.float64)
+    
+    times = None
+    if names and names[0].lower() in TIME_COLUMNS:
+        times, values, names = values[:, 0], values[:, 1:], names[1:]
+    return JointTrajectory(values, names, times, rate)
+
+
+class _Joint:
+    """JointRig 내부 관절 정보 (행렬은 USD 행 벡터 규약의 4x4 NumPy 배열)"""
+    
+    __slots__ = ('name', 'path', 'kind', 'axis', 'body0', 'body1', 'frame0', 'frame1_inv')
+    
+    def __init__(self, prim, kind):
+        joint = UsdPhysics.Joint(prim)
+        self.name = prim.GetName()
+        self.path = prim.GetPath()
+        self.kind = kind
+        self.axis = _AXES.get(prim.GetAttribute('physics:axis').Get(), 0) if kind != 'fixed' else 0
+        
+        body0 = joint.GetBody0Rel().GetTargets()
+        body1 = joint.GetBody1Rel().GetTargets()
+        self.body0 = body0[0] if body0 else None
+        self.body1 = body1[0] if body1 else None
+        
+        self.frame0 = _joint_frame(joint.GetLocalPos0Attr().Get(), joint.GetLocalRot0Attr().Get())
+        self.frame1_inv = np.linalg.inv(
+            _joint_frame(joint.GetLocalPos1Attr().Get(), joint.GetLocalRot1Attr().Get())
+        )
+    
+    def motion(self, values):
+        """관절 값별 관절 프레임 운동 행렬 (프레임, 4, 4)"""
+        count = len(values)
+        matrices = np.tile(np.eye(4), (count, 1, 1))
+        if self.kind == 'revolute':
+            # Gf 규약 (행 벡터): 축 a 기준 회전은 열 벡터 회전 행렬의 전치
+            c, s = np.cos(values), np.sin(values)
+            i, j = [(1, 2), (2, 0), (0, 1)][self.axis]
+            matrices[:, i, i] = c
+            matrices[:, j, j] = c
+            matrices[:, i, j] = s
+            matrices[:, j, i] = -s
+        elif self.kind == 'prismatic':
+            matrices[:, 3, self.axis] = values
+        return matrices
+
+
+def _joint_frame(position, rotation):
+    matrix = Gf.Matrix4d(1.0)
+    if rotation is not None:
+        matrix.SetRotateOnly(Gf.Quatd(rotation))
+    if position is not None:
+        matrix.SetTranslateOnly(Gf.Vec3d(position))
+    return np.array(matrix, dtype=np.float64)
+
+
+class JointRig:
+    """스테이지의 물리 관절 구조 (관절 값 → 링크 로컬 변환)"""
+    
+    def __init__(self, stage, root=None):
+        self.stage = stage
+        root_prim = stage.GetPrimAtPath(root) if root else stage.GetPseudoRoot()
+        
+        joints = []
+        for prim in Usd.PrimRange(root_prim):
+            if prim.IsA(UsdPhysics.RevoluteJoint):
+                kind = 'revolute'
+            elif prim.IsA(UsdPhysics.PrismaticJoint):
+                kind = 'prismatic'
+            elif prim.IsA(UsdPhysics.FixedJoint):
+                kind = 'fixed'
+            else:
+                continue
+            joint = _Joint(prim, kind)
+            if joint.body1 is not None and stage.GetPrimAtPath(joint.body1):
+                joints.append(joint)
+        
+        self.joints = _parent_first(joints)
+        self.names = [j.name for j in self.joints if j.kind != 'fixed']
+        self.links = [j.body1 for j in self.joints]
+        
+        # 기본 자세의 월드 변환 (구동되지 않는 부모/body0 기준)
+        xform_cache = UsdGeom.XformCache(Usd.TimeCode.Default())
+        self._rest_world = {}
+        for joint in self.joints:
+            for path in (joint.body0, joint.body1, joint.body1.GetParentPath()):
+                if path is not None and path not in self._rest_world:
+                    prim = stage.GetPrimAtPath(path)
+                    self._rest_world[path] = (
+                        np.array(xform_cache.GetLocalToWorldTransform(prim), dtype=np.float64)
+                        if prim else np.eye(4)
+                    )
+    
+    def __len__(self):
+        return len(self.names)
+    
+    def solve(self, positions):
+        """관절 값 (프레임, len(names)) → {링크 경로: 로컬 변환 (프레임, 4, 4)}"""
+        positions = np.atleast_2d(np.asarray(positions, dtype=np.float64))
+        frames = len(positions)
+        columns = {name: i for i, name in enumerate(self.names)}
+        zeros = np.zeros(frames)
+        
+        worlds = {}
+        for joint in self.joints:
+            parent = worlds.get(joint.body0)
+            if parent is None:
+                parent = self._rest_world.get(joint.body0, np.eye(4))
+            column = columns.get(joint.name)
+            values = positions[:, column] if column is not None else zeros
+            # body1_world = inv(F1) * motion(q) * F0 * body0_world (행 벡터 규약)
+            worlds[joint.body1] = joint.frame1_inv @ joint.motion(values) @ joint.frame0 @ parent
+        
+        locals_ = {}
+        for link, world in worlds.items():
+            parent_world = self._parent_world(link.GetParentPath(), worlds)
+            locals_[link] = world @ np.linalg.inv(parent_world)
+        return locals_
+    
+    def _rest_local(self, link):
+        """세션 레이어 기록 전 링크의 로컬 변환 (부모 기준)"""
+        return self._rest_world[link] @ np.linalg.inv(self._rest_world[link.GetParentPath()])
+    
+    def _parent_world(self, path, worlds):
+        """링크 부모 프림의 월드 변환 (구동되는 링크 아래면 그 링크를 따라 움직임)"""
+        if path in worlds:
+            return worlds[path]
+        rest = self._rest_world[path]
+        ancestor = path.GetParentPath()
+        while ancestor != Sdf.Path.absoluteRootPath and not ancestor.isEmpty:
+            if ancestor in worlds:
+                relative = rest @ np.linalg.inv(self._rest_world[ancestor])
+                return relative @ worlds[ancestor]
+            ancestor = ancestor.GetParentPath()
+        return rest
+    
+    # === 세션 레이어 기록 ===
+    
+    def bake(self, trajectory, layer=None, start=0.0):
+        """궤적 전체를 링크 변환 시간 샘플로 기록 (시간 코드 = start + 프레임 번호)
+        
+        Returns:
+            dict (frames, links, missing, unused, seconds)
+        """
+        layer = layer or self.stage.GetSessionLayer()
+        started = time.perf_counter()
+        
+        positions, missing, unused = trajectory.columns_for(self.names)
+        locals_ = self.solve(positions)
+        
+        # 프레임마다 바뀌는 링크는 시간 샘플, 로그 내내 같지만 기본 자세와 다른 링크
+        # (고정된 관절 값, 한 프레임 로그)는 기본값 하나로 기록
+        animated, held = {}, {}
+        for link, matrices in locals_.items():
+            if np.ptp(matrices, axis=0).max() > 1e-9:
+                animated[link] = matrices
+            elif np.abs(matrices[0] - self._rest_local(link)).max() > 1e-9:
+                held[link] = matrices[0]
+        
+        times = [float(start + i) for i in range(trajectory.frame_count)]
+        with Sdf.ChangeBlock():
+            self._clear_specs(layer)
+            for link, matrices in animated.items():
+                attr_path = self._transform_spec(layer, link)
+                for time_code, row in zip(times, matrices.reshape(-1, 16).tolist()):
+                    layer.SetTimeSample(attr_path, time_code, Gf.Matrix4d(*row))
+            for link, matrix in held.items():
+                attr_path = self._transform_spec(layer, link)
+                layer.GetAttributeAtPath(attr_path).default = Gf.Matrix4d(*matrix.ravel().tolist())
+            layer.startTimeCode = times[0] if times else start
+            layer.endTimeCode = times[-1] if times else start
+            layer.timeCodesPerSecond = trajectory.rate
+        
+        return {
+            'frames': trajectory.frame_count,
+            'links': len(animated) + len(held),
+            'missing': missing,
+            'unused': unused,
+            'seconds': time.perf_counter() - started,
+        }
+    
+    def write_pose(self, values, layer=None):
+        """한 프레임의 관절 값(len(names))을 링크 변환 기본값으로 기록 (스트리밍용)"""
+        layer = layer or self.stage.GetSessionLayer()
+        locals_ = self.solve(np.asarray(values, dtype=np.float64)[None, :])
+        with Sdf.ChangeBlock():
+            for link, matrices in locals_.items():
+                attr_path = self._transform_spec(layer, link)
+                layer.GetAttributeAtPath(attr_path).default = Gf.Matrix4d(*matrices[0].ravel().tolist())
+    
+    def clear(self, layer=None):
+        """세션 레이어에 기록한 링크 변환과 시간 범위 제거 (원래 자세로 복귀)"""
+        layer = layer or self.stage.GetSessionLayer()
+        with Sdf.ChangeBlock():
+            self._clear_specs(layer)
+            layer.ClearStartTimeCode()
+            layer.ClearEndTimeCode()
+            layer.ClearTimeCodesPerSecond()
+    
+    def _transform_spec(self, layer, link):
+        """링크의 xformOp:transform 속성 스펙 경로 (op 순서를 이 속성 하나로 덮어씀)"""
+        prim_spec = Sdf.CreatePrimInLayer(layer, link)
+        attr = prim_spec.attributes.get(TRANSFORM_ATTR)
+        if attr is None:
+            attr = Sdf.AttributeSpec(prim_spec, TRANSFORM_ATTR, Sdf.ValueTypeNames.Matrix4d)
+        order = prim_spec.attributes.get(UsdGeom.Tokens.xformOpOrder)
+        if order is None:
+            order = Sdf.AttributeSpec(prim_spec, UsdGeom.Tokens.xformOpOrder,
+                                      Sdf.ValueTypeNames.TokenArray, Sdf.VariabilityUniform)
+            order.default = [TRANSFORM_ATTR]
+        return attr.path
+    
+    def _clear_specs(self, layer):
+        for link in self.links:
+            prim_spec = layer.GetPrimAtPath(link)
+            if prim_spec is None:
+                continue
+            for name in (TRANSFORM_ATTR, UsdGeom.Tokens.xformOpOrder):
+                attr = prim_spec.attributes.get(name)
+                if attr is not None:
+                    prim_spec.RemoveProperty(attr)
+            _remove_inert_specs(layer, prim_spec)
+
+
+def _remove_inert_specs(layer, prim_spec):
+    """비어 있는 over 스펙을 부모 방향으로 제거 (기록 전 세션 레이어로 복원)"""
+    while prim_spec.path != Sdf.Path.absoluteRootPath and prim_spec.IsInert():
+        parent = prim_spec.nameParent or layer.pseudoRoot
+        del parent.nameChildren[prim_spec.name]
+        prim_spec = parent
+
+
+def _parent_first(joints):
+    """body0 링크를 구동하는 관절이 먼저 오도록 정렬"""
+    by_child = {j.body1: j for j in joints}
+    ordered, visited = [], set()
+    
+    def visit(joint):
+        if joint.path in visited:
+            return
+        visited.add(joint.path)
+        parent = by_child.get(joint.body0)
+        if parent is not None:
+            visit(parent)
+        ordered.append(joint)
+    
+    for joint in joints:
+        visit(joint)
+    return ordered
@@ -0,0 +1,255 @@
+"""
+Joint Stream - 로컬 소켓으로 들어오는 관절 상태 실시간 표시
+==========================================================
+
+시뮬레이터나 재생 도구가 UDP/Unix 데이터그램 소켓으로 보내는 관절 각도
+패킷(최대 1 kHz)을 받아 화면 갱신 주기에 맞춰 반영합니다.
+Qt 비의존 로직이며 두 Qt 뷰어가 사용합니다.
+
+- 수신 스레드는 관절별 최신 값만 보관 (패킷을 큐에 쌓지 않음)
+- 뷰어는 화면 갱신마다 poll()로 모인 상태를 꺼내 JointRig.write_pose()로
+  세션 레이어에 한 번의 Sdf.ChangeBlock 편집으로 기록
+- 프레임이 화면에 표시되면 presented()로 "패킷 도착 → 표시" 지연 시간을 집계
+
+패킷 형식 (UTF-8 JSON, 데이터그램 하나에 하나):
+    {"seq": 12, "stamp": 1712345678.123, "joints": {"FL_hip_joint": 0.1, ...}}
+joints는 일부 관절만 담아도 됩니다 (나머지는 마지막 값 유지).
+
+주소 형식:
+    udp://127.0.0.1:9870      (기본 포트 DEFAULT_PORT)
+    udp://:9870, 9870         (호스트 생략 시 127.0.0.1)
+    unix:///tmp/joints.sock
+"""
+
+import json
+import os
+import socket
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+from joint_replay import joint_key
+
+
+DEFAULT_PORT = 9870
+DEFAULT_ADDRESS = f"udp://127.0.0.1:{DEFAULT_PORT}"
+
+# 지연 시간 통계에 사용할 최근 표시 프레임 수
+LATENCY_WINDOW = 600
+
+_MAX_DATAGRAM = 65507
+
+
+def parse_address(text):
+    """'udp://host:port' 또는 'unix:///path' → (소켓 family, 주소)"""
+    text = text.strip()
+    if text.startswith('unix://'):
+        if not hasattr(socket, 'AF_UNIX'):
+            raise ValueError("이 플랫폼은 Unix 소켓을 지원하지 않습니다")
+        return socket.AF_UNIX, text[len('unix://'):]
+    if text.startswith('udp://'):
+        text = text[len('udp://'):]
+    host, colon, port = text.rpartition(':')
+    if not colon and not port.isdigit():
+        # 'host'만 준 경우 기본 포트 ('9870'처럼 숫자만 주면 포트)
+        host, port = port, ''
+    return socket.AF_INET, (host or '127.0.0.1', int(port) if port else DEFAULT_PORT)
+
+
+def encode_packet(joints, seq=0, stamp=None):
+    """{관절 이름: 값} → 데이터그램 바이트"""
+    packet = {
+        'seq': seq,
+        'stamp': time.time() if stamp is None else stamp,
+        'joints': {name: float(value) for name, value in joints.items()},
+    }
+    return json.dumps(packet, separators=(',', ':')).encode('utf-8')
+
+
+def decode_packet(data):
+    """데이터그램 바이트 → {관절 이름: 값} (형식이 틀리면 ValueError)"""
+    try:
+        joints = json.loads(data.decode('utf-8'))['joints']
+        return {str(name): float(value) for name, value in joints.items()}
+    except (UnicodeDecodeError, KeyError, TypeError, AttributeError) as e:
+        raise ValueError(f"잘못된 관절 패킷: {e}") from e
+
+
+class JointBatch:
+    """마지막 poll 이후 모인 관절 상태"""
+    
+    __slots__ = ('joints', 'packets', 'first_arrival', 'last_arrival')
+    
+    def __init__(self, joints, packets, first_arrival, last_arrival):
+        self.joints = joints                # {이름: 최신 값}
+        self.packets = packets              # 합쳐진 패킷 수
+        self.first_arrival = first_arrival  # 가장 오래 기다린 패킷의 도착 시각 (perf_counter)
+        self.last_arrival = last_arrival
+
+
+class JointStreamReceiver:
+    """데이터그램 소켓 수신 스레드 (관절별 최신 값만 보관)"""
+    
+    def __init__(self, address=DEFAULT_ADDRESS):
+        self.address = address
+        self.family, self.sock_address = parse_address(address)
+        self._sock = None
+        self._thread = None
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        
+        self._joints = {}
+        self._packets = 0
+        self._first_arrival = None
+        self._last_arrival = None
+        
+        # 통계 (start 이후 누적)
+        self.received = 0
+        self.malformed = 0
+    
+    def start(self):
+        """소켓을 열고 수신 스레드 시작 (주소 사용 중이면 OSError)"""
+        sock = socket.socket(self.family, socket.SOCK_DGRAM)
+        if self.family == socket.AF_UNIX and os.path.exists(self.sock_address):
+            os.unlink(self.sock_address)
+        sock.bind(self.sock_address)
+        sock.settimeout(0.2)        # stop() 확인 주기
+        self._sock = sock
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name='JointStreamReceiver', daemon=True)
+        self._thread.start()
+    
+    def stop(self):
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+            if self.family == socket.AF_UNIX and os.path.exists(self.sock_address):
+                os.unlink(self.sock_address)
+    
+    @property
+    def running(self):
+        return self._thread is not None
+    
+    def take(self):
+        """마지막 호출 이후 모인 상태 (새 패킷이 없으면 None)"""
+        with self._lock:
+            if not self._packets:
+                return None
+            batch = JointBatch(self._joints, self._packets, self._first_arrival, self._last_arrival)
+            self._joints = {}
+            self._packets = 0
+            self._first_arrival = None
+            return batch
+    
+    def _run(self):
+        sock = self._sock
+        while not self._stopped.is_set():
+            try:
+                data = sock.recv(_MAX_DATAGRAM)
+            except socket.timeout:
+                continue
+            except OSError:
+                return
+            arrival = time.perf_counter()
+            try:
+                joints = decode_packet(data)
+            except ValueError:
+                self.malformed += 1
+                continue
+            
+            with self._lock:
+                self._joints.update(joints)
+                self._packets += 1
+                if self._first_arrival is None:
+                    self._first_arrival = arrival
+                self._last_arrival = arrival
+            self.received += 1
+
+
+class LatencyStats:
+    """최근 표시 프레임들의 지연 시간 (초)"""
+    
+    def __init__(self, window=LATENCY_WINDOW):
+        self.samples = deque(maxlen=window)
+    
+    def add(self, seconds):
+        self.samples.append(seconds)
+    
+    def clear(self):
+        self.samples.clear()
+    
+    def summary(self):
+        if not self.samples:
+            return "지연 -"
+        values = np.array(self.samples) * 1000.0
+        return (f"지연 평균 {values.mean():.1f} / p95 {np.percentile(values, 95):.1f} / "
+                f"최대 {values.max():.1f} ms")
+
+
+class JointStream:
+    """수신한 관절 상태를 JointRig로 스테이지에 반영하고 표시 지연을 집계"""
+    
+    def __init__(self, rig, address=DEFAULT_ADDRESS):
+        self.rig = rig
+        self.receiver = JointStreamReceiver(address)
+        self.values = np.zeros(len(rig.names))
+        self._columns = {joint_key(name): i for i, name in enumerate(rig.names)}
+        self._pending = []          # 반영했지만 아직 표시되지 않은 배치의 첫 도착 시각
+        
+        self.latency = LatencyStats()
+        self.applied = 0            # 스테이지 편집 횟수 (≈ 표시 프레임 수)
+        self.unknown = set()        # 스테이지에 없는 관절 이름
+    
+    @property
+    def address(self):
+        return self.receiver.address
+    
+    def start(self):
+        # 이전에 기록한 궤적 시간 샘플이 있으면 기본값보다 우선하므로 지움
+        self.rig.clear()
+        self.rig.write_pose(self.values)
+        self.receiver.start()
+    
+    def stop(self):
+        self.receiver.stop()
+    
+    def poll(self):
+        """모인 상태를 한 번의 편집으로 반영 (반영했으면 True, 화면 갱신 주기마다 호출)"""
+        batch = self.receiver.take()
+        if batch is None:
+            return False
+        for name, value in batch.joints.items():
+            column = self._columns.get(joint_key(name))
+            if column is None:
+                self.unknown.add(name)
+            else:
+                self.values[column] = value
+        self.rig.write_pose(self.values)
+        self._pending.append(batch.first_arrival)
+        self.applied += 1
+        return True
+    
+    def presented(self, now=None):
+        """반영한 상태가 화면에 표시됨 (버퍼 스왑 직후 호출)"""
+        if not self._pending:
+            return
+        now = time.perf_counter() if now is None else now
+        for arrival in self._pending:
+            self.latency.add(now - arrival)
+        self._pending.clear()
+    
+    def stats(self):
+        receiver = self.receiver
+        text = (f"스트림 {self.address}: 패킷 {receiver.received} → 반영 {self.applied}, "
+                f"{self.latency.summary()}")
+        if receiver.malformed:
+            text += f", 잘못된 패킷 {receiver.malformed}"
+        if self.unknown:
+            text += f", 모르는 관절 {len(self.unknown)}"
+        return text
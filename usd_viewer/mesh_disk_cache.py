@@ -0,0 +1,192 @@
+"""
+Mesh Disk Cache - 삼각형 분할된 메시의 디스크 캐시
+==================================================
+
+기본 뷰어가 USD 파일을 열 때마다 모든 레이어를 합성하고 메시를
+다시 삼각형 분할하지 않도록, 결과를 .npy 파일로 저장해 둡니다.
+
+캐시 항목 (루트 파일 경로 + 추출 옵션별 디렉터리, <경로 해시>-<옵션 해시>):
+    manifest.json   - 버전, 추출 옵션, 사용된 레이어 목록(실제 경로, mtime, 크기), 메시 목록
+    vertices.npy    - 모든 메시 버텍스 (float32, N x 3)
+    faces.npy       - 모든 메시 삼각형 인덱스 (uint32, M x 3, 메시별 로컬 인덱스)
+    normals.npy     - 노멀 (float32, K x 3, 메시별 보간 방식은 manifest에 기록)
+    transforms.npy  - 메시별 4x4 변환 행렬 (float64)
+    colors.npy      - 메시별 색상 (float32, 3)
+
+웜 스타트에서는 manifest의 레이어 mtime/크기만 os.stat으로 확인하고
+(USD 합성 없음) 배열을 mmap으로 엽니다.
+"""
+
+import os
+import json
+import shutil
+import hashlib
+import tempfile
+from pathlib import Path
+from collections import namedtuple
+
+import numpy as np
+
+
+# 저장 형식이나 추출 방식이 바뀌면 올려서 기존 캐시 무효화
+CACHE_VERSION = 2
+
+DEFAULT_CACHE_DIR = Path.home() / '.cache' / 'usd_viewer' / 'meshes'
+
+CachedMesh = namedtuple('CachedMesh',
+                        'name vertices faces normals normal_interpolation color transform')
+
+ARRAYS = ('vertices', 'faces', 'normals', 'transforms', 'colors')
+
+
+def layer_signature(stage):
+    """스테이지가 사용하는 레이어의 (실제 경로, mtime, 크기) 목록
+    
+    디스크에 없는 레이어(익명/메모리)가 있으면 캐시할 수 없으므로 None.
+    """
+    session = stage.GetSessionLayer()
+    layers = []
+    for layer in stage.GetUsedLayers():
+        if layer == session:
+            continue
+        if layer.anonymous or not layer.realPath:
+            return None
+        layers.append(_file_signature(layer.realPath))
+    if any(entry is None for entry in layers):
+        return None
+    return sorted(layers, key=lambda entry: entry['path'])
+
+
+def _file_signature(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return {'path': os.path.abspath(path), 'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size}
+
+
+class MeshDiskCache:
+    """루트 USD 파일 → 삼각형 분할된 메시 배열 캐시"""
+    
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR):
+        self.cache_dir = Path(cache_dir)
+    
+    def entry_dir(self, filepath, options=None):
+        """옵션(--smooth, 스테이지 열기 옵션 등)마다 항목을 따로 두어 서로 덮어쓰지 않음"""
+        options_key = json.dumps(options or {}, sort_keys=True)
+        return self.cache_dir / f"{_path_key(filepath)}-{_hash(options_key)[:8]}"
+    
+    def load(self, filepath, options=None):
+        """캐시가 유효하면 CachedMesh 목록 (배열은 mmap), 아니면 None
+        
+        options는 저장할 때와 같아야 합니다 (예: {'smooth': True}).
+        """
+        entry = self.entry_dir(filepath, options)
+        try:
+            manifest = json.loads((entry / 'manifest.json').read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+        
+        if manifest.get('version') != CACHE_VERSION:
+            return None
+        if manifest.get('root') != os.path.abspath(filepath):
+            return None
+        if manifest.get('options') != (options or {}):
+            return None
+        for layer in manifest.get('layers', []):
+            if _file_signature(layer['path']) != layer:
+                return None
+        
+        try:
+            arrays = {name: np.load(entry / f'{name}.npy', mmap_mode='r') for name in ARRAYS}
+        except (OSError, ValueError):
+            return None
+        
+        meshes = []
+        for i, info in enumerate(manifest['meshes']):
+            v0, v1 = info['vertices']
+            f0, f1 = info['faces']
+            n0, n1 = info['normals']
+            meshes.append(CachedMesh(
+                name=info['name'],
+                vertices=arrays['vertices'][v0:v1],
+                faces=arrays['faces'][f0:f1],
+                normals=arrays['normals'][n0:n1],
+                normal_interpolation=info['normal_interpolation'],
+                color=arrays['colors'][i].tolist(),
+                transform=np.array(arrays['transforms'][i]),
+            ))
+        return meshes
+    
+    def save(self, filepath, stage, meshes, options=None):
+        """CachedMesh 목록 저장 (캐시할 수 없는 스테이지면 False)"""
+        layers = layer_signature(stage)
+        if layers is None or not meshes:
+            return False
+        
+        vertices = [np.asarray(m.vertices, dtype=np.float32).reshape(-1, 3) for m in meshes]
+        faces = [np.asarray(m.faces, dtype=np.uint32).reshape(-1, 3) for m in meshes]
+        normals = [np.asarray(m.normals, dtype=np.float32).reshape(-1, 3) for m in meshes]
+        
+        infos = []
+        v_offset = f_offset = n_offset = 0
+        for mesh, v, f, n in zip(meshes, vertices, faces, normals):
+            infos.append({
+                'name': mesh.name,
+                'vertices': [v_offset, v_offset + len(v)],
+                'faces': [f_offset, f_offset + len(f)],
+                'normals': [n_offset, n_offset + len(n)],
+                'normal_interpolation': mesh.normal_interpolation,
+            })
+            v_offset += len(v)
+            f_offset += len(f)
+            n_offset += len(n)
+        
+        arrays = {
+            'vertices': np.concatenate(vertices),
+            'faces': np.concatenate(faces),
+            'normals': np.concatenate(normals),
+            'transforms': np.array([m.transform for m in meshes], dtype=np.float64),
+            'colors': np.array([m.color for m in meshes], dtype=np.float32),
+        }
+        manifest = {
+            'version': CACHE_VERSION,
+            'root': os.path.abspath(filepath),
+            'options': options or {},
+            'layers': layers,
+            'meshes': infos,
+        }
+        
+        # 임시 디렉터리에 쓴 뒤 교체 (중간에 실패해도 깨진 캐시가 남지 않음)
+        entry = self.entry_dir(filepath, options)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp = Path(tempfile.mkdtemp(prefix=entry.name + '.', dir=self.cache_dir))
+        try:
+            for name, array in arrays.items():
+                np.save(tmp / f'{name}.npy', array)
+            (tmp / 'manifest.json').write_text(json.dumps(manifest), encoding='utf-8')
+            if entry.exists():
+                shutil.rmtree(entry)
+            os.replace(tmp, entry)
+        except OSError:
+            shutil.rmtree(tmp, ignore_errors=True)
+            return False
+        return True
+    
+    def clear(self, filepath=None):
+        """filepath의 모든 옵션 항목(생략 시 전체) 삭제"""
+        if not filepath:
+            shutil.rmtree(self.cache_dir, ignore_errors=True)
+            return
+        key = _path_key(filepath)
+        # 옵션 해시가 없던 이전 형식(<경로 해시>) 항목도 함께 삭제
+        for entry in [self.cache_dir / key, *self.cache_dir.glob(f"{key}-*")]:
+            shutil.rmtree(entry, ignore_errors=True)
+
+
+def _hash(text):
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+def _path_key(filepath):
+    return _hash(os.path.abspath(filepath))[:16]
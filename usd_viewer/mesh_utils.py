@@ -0,0 +1,284 @@
+"""
+Mesh Utils - NumPy 기반 메시 처리 유틸리티
+==========================================
+
+세 뷰어(기본/PySide6/PyQt6)가 공통으로 사용하는 메시 데이터 변환 함수 모음.
+USD Vt 배열은 버퍼 프로토콜로 복사 없이 NumPy 뷰로 읽고 (vt_view),
+삼각형 분할(fan triangulation)과 노멀 계산을 벡터 연산으로 처리합니다.
+반환되는 배열은 Vt 배열을 공유하는 읽기 전용 뷰일 수 있으므로 수정하지 마세요.
+
+의존성:
+    pip install numpy usd-core
+"""
+
+import numpy as np
+
+
+def vt_view(value, dtype, columns=None):
+    """Vt 배열을 NumPy 배열로 노출 (가능하면 복사 없는 뷰)
+    
+    dtype이 같고 버퍼 프로토콜을 지원하면(Vt.Vec3fArray → float32,
+    Vt.IntArray → int32) 원본 메모리를 공유하는 읽기 전용 뷰를 반환하고,
+    다르면(Vt.Vec3dArray → float32 등) 한 번만 변환 복사합니다.
+    """
+    try:
+        array = np.asarray(memoryview(value))
+    except TypeError:
+        # 버퍼 프로토콜 미지원 (구버전 USD, Python 시퀀스)
+        array = np.asarray(value)
+    array = np.ascontiguousarray(array, dtype=dtype)
+    if columns is not None:
+        array = array.reshape(-1, columns)
+    return array
+
+
+def points_to_array(points):
+    """포인트 배열(Vt.Vec3fArray 등)을 연속된 float32 (N, 3) 배열로 변환 (가능하면 뷰)"""
+    if points is None:
+        return np.zeros((0, 3), dtype=np.float32)
+    return vt_view(points, np.float32, 3)
+
+
+def fan_corners(face_vertex_counts, num_indices):
+    """팬 삼각형 분할의 코너 위치 계산
+    
+    Returns:
+        (corners, faces)
+        corners - int64 (M, 3) 삼각형 코너의 faceVertexIndices 내 위치
+        faces   - int64 (M,) 삼각형이 속한 페이스 번호
+    """
+    counts = np.asarray(face_vertex_counts, dtype=np.int64).reshape(-1)
+    
+    # 인덱스 배열 범위를 넘어서는 페이스와 퇴화 페이스는 제외
+    ends = np.cumsum(counts)
+    starts = ends - counts
+    valid = np.flatnonzero((ends <= num_indices) & (counts >= 3))
+    
+    tris_per_face = counts[valid] - 2
+    total = int(tris_per_face.sum())
+    if total == 0:
+        return np.zeros((0, 3), dtype=np.int64), np.zeros(0, dtype=np.int64)
+    
+    # 각 삼각형이 속한 페이스의 시작 위치와 페이스 내 순번
+    face_start = np.repeat(starts[valid], tris_per_face)
+    first_tri = np.cumsum(tris_per_face) - tris_per_face
+    local = np.arange(total) - np.repeat(first_tri, tris_per_face)
+    
+    corners = np.empty((total, 3), dtype=np.int64)
+    corners[:, 0] = face_start
+    corners[:, 1] = face_start + local + 1
+    corners[:, 2] = face_start + local + 2
+    return corners, np.repeat(valid, tris_per_face)
+
+
+def triangulate(face_vertex_counts, face_vertex_indices, num_points=None):
+    """faceVertexCounts/faceVertexIndices를 팬 방식으로 삼각형 분할
+
+    Args:
+        face_vertex_counts: 페이스별 버텍스 수 (Vt.IntArray 또는 시퀀스)
+        face_vertex_indices: 페이스 버텍스 인덱스 (Vt.IntArray 또는 시퀀스)
+        num_points: 지정 시 범위를 벗어난 인덱스를 가진 삼각형 제거
+
+    Returns:
+        uint32 (M, 3) 삼각형 인덱스 배열
+        (이미 삼각형 메시이고 인덱스가 모두 유효하면 Vt 배열의 뷰)
+    """
+    counts = vt_view(face_vertex_counts, np.int32).reshape(-1)
+    indices = vt_view(face_vertex_indices, np.int32).reshape(-1)
+
+    if counts.size == 0 or indices.size == 0:
+        return np.zeros((0, 3), dtype=np.uint32)
+
+    if (counts == 3).all() and counts.size * 3 <= indices.size:
+        # 이미 삼각형 메시인 경우 복사 없이 재배열만 수행
+        triangles = indices[:counts.size * 3].reshape(-1, 3)
+        if num_points is not None:
+            in_range = ((triangles >= 0) & (triangles < num_points)).all(axis=1)
+            if not in_range.all():
+                triangles = triangles[in_range]
+        # 유효한 인덱스는 음수가 아니므로 int32 → uint32 재해석 (복사 없음)
+        return triangles.view(np.uint32)
+    
+    corners, _ = fan_corners(counts, indices.size)
+    if len(corners) == 0:
+        return np.zeros((0, 3), dtype=np.uint32)
+    triangles = indices.astype(np.int64)[corners]
+
+    if num_points is not None:
+        in_range = ((triangles >= 0) & (triangles < num_points)).all(axis=1)
+        if not in_range.all():
+            triangles = triangles[in_range]
+
+    return np.ascontiguousarray(triangles, dtype=np.uint32)
+
+
+def face_normals(positions, triangles):
+    """삼각형별 단위 노멀 계산 (퇴화 삼각형은 +Y)"""
+    if len(triangles) == 0:
+        return np.zeros((0, 3), dtype=np.float32)
+
+    v0 = positions[triangles[:, 0]]
+    v1 = positions[triangles[:, 1]]
+    v2 = positions[triangles[:, 2]]
+
+    normals = np.cross(v1 - v0, v2 - v0)
+    lengths = np.linalg.norm(normals, axis=1)
+
+    degenerate = lengths <= 0
+    lengths[degenerate] = 1.0
+    normals /= lengths[:, None]
+    normals[degenerate] = (0.0, 1.0, 0.0)
+
+    return normals.astype(np.float32, copy=False)
+
+
+def vertex_normals(positions, triangles):
+    """면적 가중 스무스 버텍스 노멀 (N, 3)
+    
+    외적의 길이가 삼각형 면적의 2배이므로 정규화 전 외적을
+    각 코너 버텍스에 누적하면 면적 가중 평균이 됩니다.
+    (np.add.at 대신 성분별 np.bincount로 누적)
+    """
+    count = len(positions)
+    if count == 0 or len(triangles) == 0:
+        return np.tile(np.float32([0.0, 1.0, 0.0]), (count, 1))
+    
+    corners = triangles.reshape(-1).astype(np.intp)
+    v0 = positions[triangles[:, 0]]
+    cross = np.cross(positions[triangles[:, 1]] - v0, positions[triangles[:, 2]] - v0)
+    
+    normals = np.empty((count, 3), dtype=np.float64)
+    for axis in range(3):
+        weights = np.repeat(cross[:, axis], 3)
+        normals[:, axis] = np.bincount(corners, weights=weights, minlength=count)
+    
+    lengths = np.linalg.norm(normals, axis=1)
+    degenerate = lengths <= 0
+    lengths[degenerate] = 1.0
+    normals /= lengths[:, None]
+    normals[degenerate] = (0.0, 1.0, 0.0)
+    
+    return normals.astype(np.float32)
+
+
+def corner_normals(normals, triangles, interpolation='uniform'):
+    """보간 방식별 노멀을 삼각형 코너마다 펼친 (M * 3, 3) 배열로 변환
+    
+    interpolation:
+        uniform      - 삼각형별 (M, 3)
+        vertex       - 버텍스별 (N, 3)
+        faceVarying  - 코너별 (M * 3, 3)
+    """
+    if interpolation == 'vertex':
+        return np.ascontiguousarray(normals[triangles].reshape(-1, 3))
+    if interpolation == 'faceVarying':
+        return np.ascontiguousarray(normals.reshape(-1, 3))
+    return np.ascontiguousarray(np.repeat(normals, 3, axis=0))
+
+
+def flat_vertex_arrays(positions, triangles, normals, interpolation='uniform'):
+    """삼각형마다 버텍스를 펼친 (positions, normals) 반환 (노멀 보간은 corner_normals 참고)"""
+    flat_positions = np.ascontiguousarray(positions[triangles].reshape(-1, 3))
+    return flat_positions, corner_normals(normals, triangles, interpolation)
+
+
+def extract_mesh_arrays(usd_mesh, time_code=None):
+    """UsdGeom.Mesh에서 (positions, triangles) 배열 추출
+
+    Returns:
+        (float32 (N, 3), uint32 (M, 3)) 또는 데이터가 없으면 None
+    """
+    if time_code is None:
+        points = usd_mesh.GetPointsAttr().Get()
+        indices = usd_mesh.GetFaceVertexIndicesAttr().Get()
+        counts = usd_mesh.GetFaceVertexCountsAttr().Get()
+    else:
+        points = usd_mesh.GetPointsAttr().Get(time_code)
+        indices = usd_mesh.GetFaceVertexIndicesAttr().Get(time_code)
+        counts = usd_mesh.GetFaceVertexCountsAttr().Get(time_code)
+
+    if not points or not indices or not counts:
+        return None
+
+    positions = points_to_array(points)
+    triangles = triangulate(counts, indices, num_points=len(positions))
+    return positions, triangles
+
+
+def flat_mesh_arrays(usd_mesh, time_code=None):
+    """플랫 셰이딩용으로 펼친 (positions, normals) 배열 (데이터가 없으면 None)"""
+    arrays = extract_mesh_arrays(usd_mesh, time_code)
+    if arrays is None:
+        return None
+    positions, triangles = arrays
+    return flat_vertex_arrays(positions, triangles, face_normals(positions, triangles))
+
+
+def read_authored_normals(usd_mesh, time_code=None):
+    """저작된 노멀 값 읽기 (primvars:normals 우선, 없으면 normals 속성)
+    
+    Returns:
+        (Vt 노멀 배열, 보간 방식) 또는 저작되지 않았으면 (None, None)
+    """
+    from pxr import Usd, UsdGeom
+    
+    if time_code is None:
+        time_code = Usd.TimeCode.Default()
+    
+    primvar = UsdGeom.PrimvarsAPI(usd_mesh.GetPrim()).GetPrimvar('normals')
+    if primvar and primvar.HasAuthoredValue():
+        values = primvar.ComputeFlattened(time_code)
+        interpolation = primvar.GetInterpolation()
+    else:
+        attr = usd_mesh.GetNormalsAttr()
+        values = attr.Get(time_code) if attr.HasAuthoredValue() else None
+        interpolation = usd_mesh.GetNormalsInterpolation()
+    
+    if not values:
+        return None, None
+    return values, interpolation
+
+
+def map_normals(values, interpolation, face_vertex_counts, face_vertex_indices, num_points):
+    """저작된 노멀을 triangulate 결과에 맞춰 변환 (USD 호출 없음)
+    
+    Returns:
+        (float32 노멀 배열, 'uniform' | 'vertex' | 'faceVarying')
+        개수가 토폴로지와 맞지 않거나 지원하지 않는 보간이면 None
+    """
+    normals = vt_view(values, np.float32, 3)
+    counts = vt_view(face_vertex_counts, np.int32).reshape(-1)
+    indices = vt_view(face_vertex_indices, np.int32).reshape(-1)
+    
+    if interpolation in ('vertex', 'varying'):
+        return (normals, 'vertex') if len(normals) == num_points else None
+    if interpolation not in ('uniform', 'faceVarying'):
+        return None
+    
+    # triangulate와 같은 순서/필터로 삼각형 코너 계산
+    corners, faces = fan_corners(counts, indices.size)
+    keep = ((indices[corners] >= 0) & (indices[corners] < num_points)).all(axis=1)
+    
+    if interpolation == 'uniform':
+        if len(normals) != counts.size:
+            return None
+        return np.ascontiguousarray(normals[faces[keep]]), 'uniform'
+    
+    if len(normals) != indices.size:
+        return None
+    return np.ascontiguousarray(normals[corners[keep]].reshape(-1, 3)), 'faceVarying'
+
+
+def authored_normals(usd_mesh, num_points, time_code=None):
+    """저작된 노멀을 triangulate 결과에 맞춰 반환 (없으면 None, map_normals 참고)"""
+    values, interpolation = read_authored_normals(usd_mesh, time_code)
+    if values is None:
+        return None
+    
+    if time_code is None:
+        counts = usd_mesh.GetFaceVertexCountsAttr().Get()
+        indices = usd_mesh.GetFaceVertexIndicesAttr().Get()
+    else:
+        counts = usd_mesh.GetFaceVertexCountsAttr().Get(time_code)
+        indices = usd_mesh.GetFaceVertexIndicesAttr().Get(time_code)
+    return map_normals(values, interpolation, counts or [], indices or [], num_points)
@@ -0,0 +1,154 @@
+"""
+Payloads - 계층 패널의 페이로드 로드/언로드와 메모리 추정
+=========================================================
+
+Qt 비의존 로직입니다. 두 Qt 뷰어의 SceneHierarchyWidget이 사용합니다.
+
+스레드 규칙:
+    prefetch / estimate  - 스테이지를 읽기만 하므로 워커 스레드에서 실행
+                           (스테이지를 읽는 동안 reading() 구간을 보유해 GUI 스레드의
+                           다른 편집(궤적 기록, 스트림 반영)과 겹치지 않음)
+    load / unload        - 스테이지를 변경하므로 GUI 스레드에서 워커가 없을 때만 실행
+
+비동기 로드는 두 단계로 나뉩니다:
+    1. prefetch (워커) - 서브트리의 페이로드 레이어와 그 의존 레이어를 미리 열어 둠
+                         (파일 읽기/파싱이 대부분의 시간)
+    2. load (GUI)      - stage.Load(path). 레이어가 이미 열려 있어 합성만 수행
+"""
+
+from contextlib import nullcontext
+
+from pxr import Usd, Sdf
+
+
+def format_bytes(num_bytes):
+    """사람이 읽기 쉬운 크기 문자열"""
+    size = float(num_bytes)
+    for unit in ('B', 'KB', 'MB'):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == 'B' else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def payload_asset_paths(prim):
+    """프림에 저작된 페이로드의 절대 에셋 경로 목록 (내부 페이로드 제외)"""
+    paths = []
+    for spec in prim.GetPrimStack():
+        ops = spec.payloadList
+        for payload in (list(ops.explicitItems) + list(ops.prependedItems) +
+                        list(ops.appendedItems)):
+            if payload.assetPath:
+                paths.append(spec.layer.ComputeAbsolutePath(payload.assetPath))
+    return paths
+
+
+def _value_bytes(value):
+    """속성 값의 대략적인 메모리 크기"""
+    try:
+        return memoryview(value).nbytes
+    except TypeError:
+        # 버퍼 프로토콜이 없는 배열(문자열/토큰 등)은 원소당 8바이트로 추정
+        try:
+            return len(value) * 8
+        except TypeError:
+            return 8
+
+
+class PayloadManager:
+    """스테이지 하나의 페이로드 로드 상태와 서브트리별 메모리 추정치"""
+    
+    def __init__(self, stage=None, reading=nullcontext):
+        self.stage = stage
+        self.reading = reading      # 스테이지 읽기 구간 컨텍스트 팩토리 (예: 뷰포트 editing_stage)
+        self.estimates = {}         # Sdf.Path -> (바이트, 프림 수)
+        self._prefetched = {}       # Sdf.Path -> [Sdf.Layer] (load 전까지 레이어 유지)
+    
+    def has_payload(self, path):
+        prim = self.stage.GetPrimAtPath(path) if self.stage else None
+        return bool(prim and prim.HasAuthoredPayloads())
+    
+    def is_loaded(self, path):
+        prim = self.stage.GetPrimAtPath(path) if self.stage else None
+        return bool(prim and prim.IsLoaded())
+    
+    # === 워커 스레드 (읽기 전용) ===
+    
+    def prefetch(self, path):
+        """path 서브트리의 언로드된 페이로드 레이어를 미리 열기
+        
+        Returns:
+            열어 둔 레이어 수
+        """
+        pending = []
+        with self.reading():
+            prim = self.stage.GetPrimAtPath(path)
+            for descendant in Usd.PrimRange(prim, Usd.PrimAllPrimsPredicate) if prim else ():
+                if descendant.HasAuthoredPayloads() and not descendant.IsLoaded():
+                    pending.extend(payload_asset_paths(descendant))
+        
+        # 레이어 열기는 스테이지와 무관하므로 잠금 밖에서 수행
+        layers = []
+        seen = set()
+        while pending:
+            asset_path = pending.pop()
+            if asset_path in seen:
+                continue
+            seen.add(asset_path)
+            layer = Sdf.Layer.FindOrOpen(asset_path)
+            if not layer:
+                continue
+            layers.append(layer)
+            # 서브레이어/레퍼런스/페이로드로 이어지는 레이어도 함께 열기
+            for dependency in layer.GetCompositionAssetDependencies():
+                pending.append(layer.ComputeAbsolutePath(dependency))
+        
+        self._prefetched[Sdf.Path(path)] = layers
+        return len(layers)
+    
+    def estimate(self, path):
+        """path 서브트리의 속성 데이터 크기 추정 (배열 속성 값 크기 × 시간 샘플 수)
+        
+        Returns:
+            (바이트, 프림 수)
+        """
+        total = 0
+        count = 0
+        with self.reading():
+            prim = self.stage.GetPrimAtPath(path)
+            for descendant in Usd.PrimRange(prim) if prim else ():
+                count += 1
+                for attr in descendant.GetAttributes():
+                    if not attr.GetTypeName().isArray or not attr.HasAuthoredValue():
+                        continue
+                    samples = attr.GetNumTimeSamples()
+                    time = Usd.TimeCode.EarliestTime() if samples else Usd.TimeCode.Default()
+                    value = attr.Get(time)
+                    if value is not None:
+                        total += _value_bytes(value) * max(samples, 1)
+        
+        result = (total, count)
+        self.estimates[Sdf.Path(path)] = result
+        return result
+    
+    # === GUI 스레드 (스테이지 변경) ===
+    
+    def load(self, path):
+        """서브트리 페이로드 로드 (prefetch 후 호출하면 합성만 수행)"""
+        path = Sdf.Path(path)
+        self.stage.Load(path)
+        self._prefetched.pop(path, None)
+    
+    def unload(self, path):
+        """서브트리 페이로드 언로드 (해당 서브트리의 추정치 제거)"""
+        path = Sdf.Path(path)
+        self.stage.Unload(path)
+        self._prefetched.pop(path, None)
+        for estimated in [p for p in self.estimates if p.HasPrefix(path)]:
+            del self.estimates[estimated]
+    
+    def total_estimate(self):
+        """겹치지 않는 추정 서브트리들의 합계 (바이트)"""
+        roots = [p for p in self.estimates
+                 if not any(p != other and p.HasPrefix(other) for other in self.estimates)]
+        return sum(self.estimates[p][0] for p in roots)
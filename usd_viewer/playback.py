@@ -0,0 +1,170 @@
+"""
+Playback - 애니메이션 재생 엔진
+================================
+
+Qt 비의존 로직입니다. Qt 뷰어는 타이머 틱마다 tick()을 호출하고
+반환된 시간 코드로 렌더링합니다.
+
+- 스테이지의 startTimeCode/endTimeCode/timeCodesPerSecond를 사용
+- 벽시계 기준으로 시간을 계산하므로 렌더링이 늦으면 중간 프레임을 건너뜀
+  (재생 속도는 항상 실시간, 건너뛴 프레임 수는 dropped로 집계.
+  fps가 화면 갱신 주기보다 높으면 display_stride() 간격은 정상으로 봄)
+- upcoming()으로 다음에 그릴 프레임 시간을 알려 프리페치에 사용
+"""
+
+import math
+import time
+
+
+DEFAULT_FPS = 24.0
+
+# 타이머/프리페치 기준 화면 갱신 주기 (500 Hz 로봇 로그도 이보다 자주 그리지 않음)
+DISPLAY_RATE = 60.0
+
+
+class Playback:
+    """시간 범위 재생 상태 (재생/일시정지/반복, 실시간 페이싱)"""
+    
+    def __init__(self, start=0.0, end=0.0, fps=DEFAULT_FPS, clock=time.perf_counter):
+        self.clock = clock
+        self.loop = True
+        self.playing = False
+        self.set_range(start, end, fps)
+        
+        # 통계 (play 이후 누적)
+        self.presented = 0          # tick에서 새로 보여준 프레임 수
+        self.dropped = 0            # 늦어서 건너뛴 프레임 수
+    
+    def set_range(self, start, end, fps=None):
+        """재생 범위와 초당 시간 코드 설정 (현재 시간은 start로 이동)"""
+        self.start = float(start)
+        self.end = max(float(end), self.start)
+        if fps:
+            self.fps = float(fps)
+        self.time = self.start
+        self._anchor_clock = None   # play/seek 시각 (벽시계)
+        self._anchor_frame = 0      # 그 시각의 프레임 번호
+        self._shown = 0             # 마지막으로 보여준 프레임 (반복으로 감기 전 누적 번호)
+    
+    def set_stage(self, stage):
+        """스테이지의 시간 범위 사용 (시간 샘플이 없으면 0~0)"""
+        if stage and stage.HasAuthoredTimeCodeRange():
+            self.set_range(stage.GetStartTimeCode(), stage.GetEndTimeCode(),
+                           stage.GetTimeCodesPerSecond() or DEFAULT_FPS)
+        else:
+            self.set_range(0.0, 0.0, stage.GetTimeCodesPerSecond() if stage else DEFAULT_FPS)
+        self.pause()
+    
+    @property
+    def frame_count(self):
+        return int(math.floor(self.end - self.start)) + 1
+    
+    @property
+    def frame(self):
+        """현재 프레임 번호 (start 기준 0부터)"""
+        return int(round(self.time - self.start))
+    
+    def is_animated(self):
+        return self.end > self.start
+    
+    def interval_ms(self):
+        """타이머 간격 (프레임 길이의 절반 - 타이머 지터로 프레임 표시가 밀리지 않도록)"""
+        return max(1, int(500.0 / min(self.fps, DISPLAY_RATE)))
+    
+    def display_stride(self):
+        """화면 갱신 한 번에 진행하는 프레임 수 (fps가 DISPLAY_RATE보다 높을 때 1보다 큼)"""
+        return max(1, int(round(self.fps / DISPLAY_RATE)))
+    
+    # === 제어 ===
+    
+    def play(self):
+        if not self.is_animated():
+            return
+        if not self.loop and self.frame >= self.frame_count - 1:
+            self.time = self.start
+        self.playing = True
+        self.presented = 0
+        self.dropped = 0
+        self._reanchor()
+    
+    def pause(self):
+        self.playing = False
+        self._anchor_clock = None
+    
+    def toggle(self):
+        if self.playing:
+            self.pause()
+        else:
+            self.play()
+        return self.playing
+    
+    def seek(self, time_code):
+        """시간 이동 (범위 안으로 제한, 재생 중이면 기준 시각 재설정)"""
+        self.time = min(max(float(time_code), self.start), self.end)
+        if self.playing:
+            self._reanchor()
+        return self.time
+    
+    def step(self, frames=1):
+        """프레임 단위 이동 (반복 모드면 끝에서 처음으로)"""
+        return self.seek(self._frame_time(self.frame + frames))
+    
+    def _reanchor(self):
+        self._anchor_clock = self.clock()
+        self._anchor_frame = self._shown = self.frame
+    
+    def _frame_time(self, frame):
+        count = self.frame_count
+        if self.loop:
+            frame %= count
+        else:
+            frame = min(max(frame, 0), count - 1)
+        return self.start + frame
+    
+    # === 타이머 틱 ===
+    
+    def tick(self):
+        """벽시계에 맞는 프레임으로 이동
+        
+        Returns:
+            시간이 바뀌었으면 새 시간 코드, 아니면 None
+        """
+        if not self.playing:
+            return None
+        
+        elapsed = self.clock() - self._anchor_clock
+        target = self._anchor_frame + int(elapsed * self.fps)
+        advanced = target - self._shown
+        if advanced <= 0:
+            return None
+        
+        self.presented += 1
+        self.dropped += max(0, advanced - self.display_stride())
+        
+        if not self.loop and target >= self.frame_count - 1:
+            self.time = self.end
+            self.pause()
+            return self.time
+        
+        self.time = self._frame_time(target)
+        self._shown = target
+        return self.time
+    
+    def upcoming(self, count):
+        """다음에 보여줄 프레임 시간 count개 (실시간 속도 기준 화면 갱신 간격)"""
+        if not self.is_animated():
+            return []
+        stride = self.display_stride()
+        times = []
+        for i in range(1, count + 1):
+            frame = self.frame + i * stride
+            if not self.loop and frame >= self.frame_count:
+                break
+            times.append(self._frame_time(frame))
+        return times
+    
+    def stats(self):
+        """재생 통계 문자열"""
+        total = self.presented + self.dropped
+        ratio = self.dropped / total if total else 0.0
+        return f"{self.fps:g} fps, 표시 {self.presented} / 건너뜀 {self.dropped} ({ratio:.0%})"
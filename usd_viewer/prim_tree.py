@@ -0,0 +1,124 @@
+"""
+Prim Tree - 지연 로딩 씬 계층 구조 데이터
+==========================================
+
+QAbstractItemModel(canFetchMore/fetchMore)에서 사용하는 Qt 비의존 트리.
+위젯 객체 대신 프림 경로/이름/타입만 보관하며, 자식은 요청될 때
+Usd.Prim.GetChildren()에서 배치 단위로 가져옵니다.
+따라서 계층 패널 표시 시간이 스테이지 전체 크기와 무관합니다.
+"""
+
+from pxr import Usd, Sdf
+
+
+# fetchMore 한 번에 가져올 최대 자식 수
+FETCH_BATCH_SIZE = 256
+
+# 기본 프레디케이트에서 로드 조건만 뺀 것 (언로드된 페이로드 프림도 표시해 로드할 수 있도록)
+CHILD_PREDICATE = Usd.PrimIsActive & Usd.PrimIsDefined & ~Usd.PrimIsAbstract
+
+
+class PrimTreeNode:
+    """계층 트리의 노드 (프림 경로 기반)"""
+    
+    __slots__ = ('path', 'name', 'type_name', 'parent', 'row',
+                 'children', 'pending', 'has_children', 'has_payload')
+    
+    def __init__(self, path, name, type_name, parent=None, row=0, has_children=False,
+                 has_payload=False):
+        self.path = path                  # Sdf.Path
+        self.name = name
+        self.type_name = type_name
+        self.parent = parent
+        self.row = row                    # 부모 children 내 위치
+        self.children = []                # 가져온 자식 노드
+        self.pending = None               # 아직 노드로 만들지 않은 자식 이름 (None = 미조회)
+        self.has_children = has_children
+        self.has_payload = has_payload    # 페이로드가 저작된 프림 (로드/언로드 대상)
+
+
+class PrimTree:
+    """스테이지 계층 구조를 필요한 만큼만 읽는 트리"""
+    
+    def __init__(self, stage=None, batch_size=FETCH_BATCH_SIZE):
+        self.batch_size = batch_size
+        self.set_stage(stage)
+    
+    def set_stage(self, stage):
+        self.stage = stage
+        self.root = PrimTreeNode(Sdf.Path.absoluteRootPath, '', '', has_children=bool(stage))
+        self.nodes = {}     # Sdf.Path -> 이미 가져온 PrimTreeNode
+    
+    def can_fetch_more(self, node):
+        """아직 가져오지 않은 자식이 있는지"""
+        if not self.stage or not node.has_children:
+            return False
+        return node.pending is None or len(node.pending) > 0
+    
+    def next_batch_size(self, node):
+        """다음 fetch_more가 추가할 행 수 (beginInsertRows 용)"""
+        if not self.can_fetch_more(node):
+            return 0
+        
+        if node.pending is None:
+            prim = self.stage.GetPrimAtPath(node.path)
+            node.pending = list(prim.GetFilteredChildrenNames(CHILD_PREDICATE)) if prim else []
+        
+        return min(self.batch_size, len(node.pending))
+    
+    def fetch_more(self, node):
+        """다음 배치의 자식 노드 생성
+        
+        Returns:
+            새로 추가된 행 수 (next_batch_size와 동일)
+        """
+        count = self.next_batch_size(node)
+        if count == 0:
+            return 0
+        
+        prim = self.stage.GetPrimAtPath(node.path)
+        batch = node.pending[:count]
+        node.pending = node.pending[count:]
+        
+        for name in batch:
+            child = prim.GetChild(name)
+            child_node = PrimTreeNode(
+                child.GetPath(), name, str(child.GetTypeName()),
+                parent=node, row=len(node.children),
+                has_children=bool(child.GetFilteredChildrenNames(CHILD_PREDICATE)),
+                has_payload=child.HasAuthoredPayloads(),
+            )
+            node.children.append(child_node)
+            self.nodes[child_node.path] = child_node
+        
+        return count
+    
+    def reset_children(self, node):
+        """노드의 자식을 비우고 다시 조회하도록 표시 (resync, 페이로드 로드/언로드 후)"""
+        prim = self.stage.GetPrimAtPath(node.path) if self.stage else None
+        self._forget(node.children)
+        node.children = []
+        node.pending = None
+        node.has_children = bool(prim and prim.GetFilteredChildrenNames(CHILD_PREDICATE))
+    
+    def update_node(self, node):
+        """노드 자체의 표시 정보(타입, 페이로드 여부) 다시 읽기"""
+        prim = self.stage.GetPrimAtPath(node.path) if self.stage else None
+        if prim:
+            node.type_name = str(prim.GetTypeName())
+            node.has_payload = prim.HasAuthoredPayloads()
+    
+    def find_node(self, path):
+        """이미 가져온 노드 중에서 경로에 해당하는 노드 검색 (없으면 None)"""
+        path = Sdf.Path(path)
+        if path == Sdf.Path.absoluteRootPath:
+            return self.root
+        return self.nodes.get(path)
+    
+    def _forget(self, nodes):
+        """제거되는 노드와 그 자손을 경로 인덱스에서 삭제"""
+        stack = list(nodes)
+        while stack:
+            node = stack.pop()
+            self.nodes.pop(node.path, None)
+            stack.extend(node.children)
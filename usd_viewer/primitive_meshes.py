@@ -0,0 +1,304 @@
+"""
+Primitive Meshes - 암시적 프리미티브 테셀레이션 캐시
+====================================================
+
+Cube/Sphere/Cylinder/Cone/Capsule 지오메트리를 NumPy로 한 번만 생성하고
+(종류, 파라미터, 테셀레이션) 키로 GPU 버퍼를 공유합니다.
+같은 키의 프림들은 버퍼를 한 번만 바인딩하고 변환/색상만 바꿔 그립니다.
+
+Cylinder/Cone/Capsule은 Y축 기준으로 생성한 뒤 USD axis 속성(기본값 Z)에 맞춰
+회전하므로 Hydra 및 BBoxCache 바운드와 방향이 같습니다. (구는 Z축 극점)
+모든 삼각형은 바깥쪽이 앞면(CCW)이 되도록 감습니다.
+"""
+
+from collections import defaultdict
+
+import numpy as np
+from OpenGL.GL import *
+
+from gl_utils import MeshBuffers, buffers_supported
+
+
+# 기본 테셀레이션 (경도 분할, 위도 분할)
+DEFAULT_TESSELLATION = (24, 16)
+
+# 파라미터가 없을 때 사용할 기본값
+DEFAULT_PARAMS = {
+    'cube': {'size': 1.0},
+    'sphere': {'radius': 1.0},
+    'cylinder': {'radius': 1.0, 'height': 2.0, 'axis': 'Z'},
+    'cone': {'radius': 1.0, 'height': 2.0, 'axis': 'Z'},
+    'capsule': {'radius': 0.5, 'height': 2.0, 'axis': 'Z'},
+}
+
+# Y축 기준 지오메트리를 각 axis로 돌리는 회전 (행 벡터용: i행 = i축이 옮겨갈 방향,
+# 행렬식 1이므로 감는 방향 유지)
+AXIS_ROTATIONS = {
+    'X': np.array([[0, -1, 0], [1, 0, 0], [0, 0, 1]], dtype=np.float64),
+    'Y': np.eye(3),
+    'Z': np.array([[1, 0, 0], [0, 0, 1], [0, -1, 0]], dtype=np.float64),
+}
+
+
+# === 지오메트리 생성 (positions, normals, indices) ===
+
+def _grid_indices(rows, cols, offset=0, flip=False):
+    """(rows + 1) x (cols + 1) 버텍스 격자의 삼각형 인덱스 (flip: 감는 방향 반전)"""
+    r, c = np.meshgrid(np.arange(rows), np.arange(cols), indexing='ij')
+    v0 = (r * (cols + 1) + c).ravel() + offset
+    v1 = v0 + cols + 1      # 다음 행
+    v2 = v0 + 1             # 다음 열
+    v3 = v1 + 1
+    if flip:
+        tris = np.stack([v0, v2, v1, v2, v3, v1], axis=1)
+    else:
+        tris = np.stack([v0, v1, v2, v2, v1, v3], axis=1)
+    return tris.reshape(-1, 3)
+
+
+def _ring(slices):
+    angles = 2 * np.pi * np.arange(slices + 1) / slices
+    return np.cos(angles), np.sin(angles)
+
+
+def _disk(radius, y, slices, up, offset):
+    """y 높이의 원판 (삼각형 팬)"""
+    x, z = _ring(slices)
+    positions = np.concatenate([[[0.0, y, 0.0]], np.stack([x * radius, np.full_like(x, y), z * radius], axis=1)])
+    normals = np.tile([0.0, 1.0 if up else -1.0, 0.0], (slices + 2, 1))
+    j = np.arange(slices) + 1
+    center = np.zeros(slices, dtype=np.int64)
+    tris = np.stack([center, j + 1, j] if up else [center, j, j + 1], axis=1)
+    return positions, normals, tris + offset
+
+
+def _merge(parts):
+    positions = np.concatenate([p for p, _, _ in parts])
+    normals = np.concatenate([n for _, n, _ in parts])
+    indices = np.concatenate([i for _, _, i in parts])
+    return positions, normals, indices
+
+
+def cube_mesh(size):
+    half = size / 2
+    corners = np.array([
+        (-1, -1, -1), (1, -1, -1), (1, 1, -1), (-1, 1, -1),
+        (-1, -1, 1), (1, -1, 1), (1, 1, 1), (-1, 1, 1),
+    ], dtype=np.float64) * half
+    faces = [
+        ((0, 1, 2, 3), (0, 0, -1)),  # 뒤
+        ((4, 7, 6, 5), (0, 0, 1)),   # 앞
+        ((0, 3, 7, 4), (-1, 0, 0)),  # 왼쪽
+        ((1, 5, 6, 2), (1, 0, 0)),   # 오른쪽
+        ((0, 4, 5, 1), (0, -1, 0)),  # 아래
+        ((3, 2, 6, 7), (0, 1, 0)),   # 위
+    ]
+    positions = corners[[i for quad, _ in faces for i in quad]]
+    normals = np.repeat([n for _, n in faces], 4, axis=0).astype(np.float64)
+    base = np.arange(6)[:, None] * 4
+    indices = (base + np.array([[0, 2, 1, 0, 3, 2]])).reshape(-1, 3)
+    return positions, normals, indices
+
+
+def sphere_mesh(radius, slices, stacks):
+    lat = np.pi * (-0.5 + np.arange(stacks + 1) / stacks)
+    x, y = _ring(slices)
+    normals = np.stack([
+        np.outer(np.cos(lat), x),
+        np.outer(np.cos(lat), y),
+        np.repeat(np.sin(lat)[:, None], slices + 1, axis=1),
+    ], axis=2).reshape(-1, 3)
+    return normals * radius, normals, _grid_indices(stacks, slices, flip=True)
+
+
+def cylinder_mesh(radius, height, slices):
+    half_h = height / 2
+    x, z = _ring(slices)
+    side_normals = np.stack([x, np.zeros_like(x), z], axis=1)
+    side = np.concatenate([side_normals * radius + [0, -half_h, 0],
+                           side_normals * radius + [0, half_h, 0]])
+    count = len(side)
+    top = _disk(radius, half_h, slices, True, count)
+    bottom = _disk(radius, -half_h, slices, False, count + slices + 2)
+    return _merge([
+        (side, np.concatenate([side_normals, side_normals]), _grid_indices(1, slices)),
+        top, bottom,
+    ])
+
+
+def cone_mesh(radius, height, slices):
+    half_h = height / 2
+    x, z = _ring(slices)
+    base = np.stack([x * radius, np.full_like(x, -half_h), z * radius], axis=1)
+    slope = radius / height if height else 0.0
+    base_normals = np.stack([x, np.full_like(x, slope), z], axis=1)
+    
+    # 꼭짓점은 슬라이스마다 따로 두어 중간 각도의 노멀 사용
+    mid = 2 * np.pi * (np.arange(slices) + 0.5) / slices
+    apex = np.tile([0.0, half_h, 0.0], (slices, 1))
+    apex_normals = np.stack([np.cos(mid), np.full(slices, slope), np.sin(mid)], axis=1)
+    
+    positions = np.concatenate([apex, base])
+    normals = np.concatenate([apex_normals, base_normals])
+    normals /= np.linalg.norm(normals, axis=1)[:, None]
+    j = np.arange(slices)
+    side = np.stack([j, slices + j + 1, slices + j], axis=1)
+    
+    bottom = _disk(radius, -half_h, slices, False, len(positions))
+    return _merge([(positions, normals, side), bottom])
+
+
+def capsule_mesh(radius, height, slices, stacks):
+    half_h = height / 2
+    x, z = _ring(slices)
+    side_normals = np.stack([x, np.zeros_like(x), z], axis=1)
+    parts = [(
+        np.concatenate([side_normals * radius + [0, -half_h, 0],
+                        side_normals * radius + [0, half_h, 0]]),
+        np.concatenate([side_normals, side_normals]),
+        _grid_indices(1, slices),
+    )]
+    offset = len(parts[0][0])
+    
+    # 반구 (위/아래)
+    hemi_stacks = max(stacks // 2, 1)
+    lat = (np.pi / 2) * np.arange(hemi_stacks + 1) / hemi_stacks
+    for sign in (1.0, -1.0):
+        normals = np.stack([
+            np.outer(np.cos(lat), x),
+            np.repeat(sign * np.sin(lat)[:, None], slices + 1, axis=1),
+            np.outer(np.cos(lat), z),
+        ], axis=2).reshape(-1, 3)
+        positions = normals * radius + [0, sign * half_h, 0]
+        parts.append((positions, normals, _grid_indices(hemi_stacks, slices, offset, flip=sign < 0)))
+        offset += len(positions)
+    
+    return _merge(parts)
+
+
+def build_primitive(kind, params, tessellation=DEFAULT_TESSELLATION):
+    """프리미티브 지오메트리 생성
+    
+    Returns:
+        (positions (N, 3) float32, normals (N, 3) float32, indices (M, 3) uint32)
+    """
+    slices, stacks = tessellation
+    p = dict(DEFAULT_PARAMS[kind])
+    p.update({k: v for k, v in params.items() if v})
+    
+    if kind == 'cube':
+        arrays = cube_mesh(p['size'])
+    elif kind == 'sphere':
+        arrays = sphere_mesh(p['radius'], slices, stacks)
+    elif kind == 'cylinder':
+        arrays = cylinder_mesh(p['radius'], p['height'], slices)
+    elif kind == 'cone':
+        arrays = cone_mesh(p['radius'], p['height'], slices)
+    elif kind == 'capsule':
+        arrays = capsule_mesh(p['radius'], p['height'], slices, stacks)
+    else:
+        raise ValueError(f"지원하지 않는 프리미티브: {kind}")
+    
+    positions, normals, indices = arrays
+    if 'axis' in p:
+        rotation = AXIS_ROTATIONS[p['axis']]
+        positions, normals = positions @ rotation, normals @ rotation
+    return (np.ascontiguousarray(positions, dtype=np.float32),
+            np.ascontiguousarray(normals, dtype=np.float32),
+            np.ascontiguousarray(indices, dtype=np.uint32))
+
+
+# === GPU 캐시 ===
+
+def _key_value(value):
+    """캐시 키용 파라미터 값 (숫자는 반올림, axis 같은 토큰은 그대로)"""
+    if isinstance(value, str):
+        return value
+    return round(float(value or 0.0), 6)
+
+
+class ClientArrayMesh:
+    """버퍼 오브젝트 미지원 시 클라이언트 배열로 그리는 대체 메시"""
+    
+    def __init__(self, positions, normals, indices):
+        self.positions = positions
+        self.normals = normals
+        self.indices = indices.reshape(-1)
+        self.nbytes = positions.nbytes + normals.nbytes + indices.nbytes
+    
+    def bind(self):
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_NORMAL_ARRAY)
+        glVertexPointer(3, GL_FLOAT, 0, self.positions)
+        glNormalPointer(GL_FLOAT, 0, self.normals)
+    
+    def draw_bound(self, mode=GL_TRIANGLES):
+        glDrawElements(mode, len(self.indices), GL_UNSIGNED_INT, self.indices)
+    
+    def unbind(self):
+        glDisableClientState(GL_NORMAL_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+    
+    def release(self):
+        pass
+
+
+class PrimitiveCache:
+    """(종류, 파라미터, 테셀레이션) 키로 공유되는 프리미티브 메시 캐시
+    
+    GL 작업을 하므로 GL 컨텍스트가 활성화된 상태에서 사용해야 합니다.
+    """
+    
+    def __init__(self, tessellation=DEFAULT_TESSELLATION):
+        self.tessellation = tuple(tessellation)
+        self.meshes = {}            # key -> MeshBuffers / ClientArrayMesh
+        self._use_buffers = None
+    
+    @staticmethod
+    def make_key(kind, params, tessellation):
+        values = tuple(_key_value(params.get(name)) for name in sorted(params))
+        return kind, values, tessellation
+    
+    def get(self, kind, params):
+        """키에 해당하는 메시 (없으면 생성 후 업로드)"""
+        key = self.make_key(kind, params, self.tessellation)
+        mesh = self.meshes.get(key)
+        if mesh is None:
+            if self._use_buffers is None:
+                self._use_buffers = buffers_supported()
+            arrays = build_primitive(kind, params, self.tessellation)
+            mesh = MeshBuffers(*arrays) if self._use_buffers else ClientArrayMesh(*arrays)
+            self.meshes[key] = mesh
+        return mesh
+    
+    def draw_items(self, items):
+        """DrawItem들을 메시별로 묶어 버퍼 바인딩 한 번에 모두 렌더링"""
+        groups = defaultdict(list)
+        for item in items:
+            groups[self.get(item.kind, item.params)].append(item)
+        
+        for mesh, group in groups.items():
+            mesh.bind()
+            for item in group:
+                glPushMatrix()
+                glMultMatrixd(item.world_matrix)
+                glColor3f(*item.color)
+                mesh.draw_bound()
+                glPopMatrix()
+            mesh.unbind()
+    
+    def set_tessellation(self, tessellation):
+        """테셀레이션 변경 (기존 메시는 해제)"""
+        tessellation = tuple(tessellation)
+        if tessellation != self.tessellation:
+            self.release()
+            self.tessellation = tessellation
+    
+    def release(self):
+        """모든 메시 해제 (GL 컨텍스트 필요)"""
+        for mesh in self.meshes.values():
+            mesh.release()
+        self.meshes.clear()
+    
+    def __len__(self):
+        return len(self.meshes)
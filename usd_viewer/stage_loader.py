@@ -0,0 +1,218 @@
+"""
+Stage Loader - GUI 스레드 밖에서 USD 스테이지 열기
+=================================================
+
+Usd.Stage.Open, 바운딩 박스 계산을
+워커 스레드에서 수행하기 위한 Qt 비의존 로직입니다.
+각 Qt 뷰어는 이 함수를 QThread 안에서 호출하고 결과만 뷰포트에 적용합니다.
+
+취소는 단계 사이에서 확인합니다. (Usd.Stage.Open 자체는 중단할 수 없음)
+계층 구조는 로드 시 수집하지 않고 prim_tree.PrimTree가 필요할 때 읽습니다.
+
+부분 로딩 (StageOpenOptions, 세 뷰어 공통 커맨드라인 옵션):
+    --mask /go2/base            Usd.StagePopulationMask로 지정한 하위 트리만 합성
+    --load-none                 페이로드를 하나도 로드하지 않고 열기 (Usd.Stage.LoadNone)
+    --load /go2/base            LoadNone으로 연 뒤 지정한 하위 트리의 페이로드만 Load()
+    --exclude collisions        이름(또는 '/'가 있으면 경로)이 패턴과 맞는 프림을 세션 레이어에서 비활성화
+"""
+
+import time
+from fnmatch import fnmatchcase
+
+from pxr import Usd, UsdGeom, Sdf
+
+
+class LoadCancelled(Exception):
+    """로드가 취소됨"""
+
+
+class StageOpenOptions:
+    """스테이지 부분 로딩 옵션 (population mask / 페이로드 로드 규칙 / 제외 패턴)"""
+    
+    def __init__(self, mask=(), load_none=False, load_paths=(), exclude=()):
+        self.mask = [str(path) for path in mask]              # 합성할 하위 트리 경로
+        self.load_paths = [str(path) for path in load_paths]  # LoadNone 후 Load()할 경로
+        self.load_none = bool(load_none or self.load_paths)
+        self.exclude = list(exclude)                          # 비활성화할 프림 패턴
+    
+    @classmethod
+    def from_args(cls, args):
+        """add_open_arguments로 추가한 인자에서 생성"""
+        return cls(mask=args.mask or (), load_none=args.load_none,
+                   load_paths=args.load or (), exclude=args.exclude or ())
+    
+    def is_default(self):
+        return not (self.mask or self.load_none or self.exclude)
+    
+    def to_dict(self):
+        """비교/캐시 키용 딕셔너리"""
+        return {
+            'mask': self.mask,
+            'load_none': self.load_none,
+            'load_paths': self.load_paths,
+            'exclude': self.exclude,
+        }
+    
+    def describe(self):
+        """상태 표시용 요약"""
+        if self.is_default():
+            return "전체 로드"
+        parts = []
+        if self.mask:
+            parts.append(f"mask {' '.join(self.mask)}")
+        if self.load_paths:
+            parts.append(f"load {' '.join(self.load_paths)}")
+        elif self.load_none:
+            parts.append("페이로드 없음")
+        if self.exclude:
+            parts.append(f"제외 {' '.join(self.exclude)}")
+        return ", ".join(parts)
+
+
+def add_open_arguments(parser):
+    """부분 로딩 커맨드라인 옵션 추가 (StageOpenOptions.from_args와 짝)"""
+    group = parser.add_argument_group("부분 로딩")
+    group.add_argument("--mask", nargs="+", metavar="PATH",
+                       help="population mask: 지정한 프림 경로의 하위 트리만 합성")
+    group.add_argument("--load-none", action="store_true",
+                       help="페이로드를 로드하지 않고 열기")
+    group.add_argument("--load", nargs="+", metavar="PATH",
+                       help="페이로드 없이 연 뒤 지정한 하위 트리만 로드 (--load-none 포함)")
+    group.add_argument("--exclude", nargs="+", metavar="PATTERN",
+                       help="이름(또는 경로) 패턴과 맞는 프림 비활성화 (예: collisions)")
+
+
+def _matches(prim, patterns):
+    name = prim.GetName()
+    path = str(prim.GetPath())
+    return any(fnmatchcase(path if '/' in pattern else name, pattern) for pattern in patterns)
+
+
+def deactivate_matching(stage, patterns):
+    """패턴과 맞는 프림을 세션 레이어에서 비활성화 (원본 레이어는 수정하지 않음)
+    
+    Returns:
+        비활성화한 프림 수
+    """
+    paths = []
+    prims = iter(Usd.PrimRange(stage.GetPseudoRoot()))
+    for prim in prims:
+        if not prim.IsPseudoRoot() and _matches(prim, patterns):
+            paths.append(prim.GetPath())
+            prims.PruneChildren()
+    
+    layer = stage.GetSessionLayer()
+    with Sdf.ChangeBlock():
+        for path in paths:
+            Sdf.CreatePrimInLayer(layer, path).active = False
+    return len(paths)
+
+
+def open_stage(filepath, options=None):
+    """StageOpenOptions에 따라 스테이지 열기 (실패 시 None)"""
+    options = options or StageOpenOptions()
+    
+    # 제외할 프림이 있으면 페이로드를 로드하기 전에 비활성화해 합성 자체를 건너뜀
+    defer_load = bool(options.exclude) and not options.load_none
+    load = Usd.Stage.LoadNone if options.load_none or defer_load else Usd.Stage.LoadAll
+    
+    if options.mask:
+        mask = Usd.StagePopulationMask()
+        for path in options.mask:
+            mask.Add(Sdf.Path(path))
+        stage = Usd.Stage.OpenMasked(filepath, mask, load)
+    else:
+        stage = Usd.Stage.Open(filepath, load)
+    if not stage:
+        return None
+    
+    if options.exclude:
+        deactivate_matching(stage, options.exclude)
+    
+    if options.load_paths:
+        stage.LoadAndUnload([Sdf.Path(path) for path in options.load_paths], [])
+    elif defer_load:
+        stage.Load()
+    
+    # 새로 로드된 페이로드 안의 프림도 제외
+    if options.exclude and (options.load_paths or defer_load):
+        deactivate_matching(stage, options.exclude)
+    return stage
+
+
+class StageLoadResult:
+    """워커 스레드에서 준비된 스테이지 로드 결과"""
+    
+    def __init__(self, filepath, options=None):
+        self.filepath = filepath
+        self.options = options or StageOpenOptions()
+        self.stage = None
+        self.bbox_min = None       # [x, y, z] 또는 None (빈 씬)
+        self.bbox_max = None
+        self.timings = {}          # 단계별 소요 시간 (초)
+    
+    def format_timings(self):
+        parts = [f"{name} {seconds * 1000:.0f}ms" for name, seconds in self.timings.items()]
+        return ", ".join(parts)
+
+
+def compute_stage_bounds(stage, time_code=None):
+    """스테이지 전체의 월드 바운딩 박스 ([min], [max]) 또는 None"""
+    if time_code is None:
+        time_code = Usd.TimeCode.Default()
+    bbox_cache = UsdGeom.BBoxCache(time_code, [UsdGeom.Tokens.default_])
+    bbox = bbox_cache.ComputeWorldBound(stage.GetPseudoRoot())
+    bbox_range = bbox.ComputeAlignedRange()
+    if bbox_range.IsEmpty():
+        return None
+    
+    min_pt = bbox_range.GetMin()
+    max_pt = bbox_range.GetMax()
+    return [min_pt[0], min_pt[1], min_pt[2]], [max_pt[0], max_pt[1], max_pt[2]]
+
+
+def load_stage_data(filepath, progress=None, is_cancelled=None, options=None):
+    """스테이지 열기 + 바운딩 박스 계산
+    
+    Args:
+        filepath: USD 파일 경로
+        options: StageOpenOptions (None이면 전체 로드)
+        progress: progress(percent, message) 콜백
+        is_cancelled: 취소 여부를 반환하는 콜백
+    
+    Returns:
+        StageLoadResult
+    
+    Raises:
+        LoadCancelled: 취소된 경우
+        RuntimeError: 스테이지를 열 수 없는 경우
+    """
+    def report(percent, message):
+        if progress:
+            progress(percent, message)
+    
+    def check_cancel():
+        if is_cancelled and is_cancelled():
+            raise LoadCancelled()
+    
+    result = StageLoadResult(filepath, options)
+    
+    report(0, f"스테이지 여는 중... ({result.options.describe()})")
+    start = time.perf_counter()
+    stage = open_stage(filepath, result.options)
+    result.timings['open'] = time.perf_counter() - start
+    if not stage:
+        raise RuntimeError(f"스테이지를 열 수 없습니다: {filepath}")
+    result.stage = stage
+    check_cancel()
+    
+    report(50, "바운딩 박스 계산 중...")
+    start = time.perf_counter()
+    bounds = compute_stage_bounds(stage)
+    if bounds:
+        result.bbox_min, result.bbox_max = bounds
+    result.timings['bounds'] = time.perf_counter() - start
+    check_cancel()
+    
+    report(100, "완료")
+    return result
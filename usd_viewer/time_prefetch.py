@@ -0,0 +1,173 @@
+"""
+Time Prefetch - 재생 중 다음 프레임의 시간 샘플 미리 읽기
+=========================================================
+
+DrawCache가 재생 중에 사용하는 백그라운드 스레드.
+Playback.upcoming()이 알려 준 시간들에 대해 시간 변화가 있는 프림의
+월드 행렬을 미리 계산하고, 변형 메시의 펼친 버텍스/노멀 배열은
+GeometryCache(LRU)에 채워 둡니다. 렌더링 스레드는 행렬은 take()로,
+메시는 GeometryCache에서 꺼내 GPU 업로드만 수행합니다.
+
+스테이지를 읽기만 하며, 편집 알림이 오면 invalidate()로 진행 중인 결과를 버립니다.
+UsdStage는 다른 스레드가 쓰는 동안 읽으면 안전하지 않으므로, GUI 스레드의
+스테이지 편집(궤적 기록, 페이로드 로드, 스트림 반영)은 paused() 안에서 수행합니다.
+읽기 잠금은 DrawCache.stage_lock을 받아 다른 읽기 스레드(페이로드 워커)와 공유합니다.
+"""
+
+import threading
+from collections import deque
+from contextlib import contextmanager
+
+from pxr import Usd, UsdGeom
+
+from geometry_cache import GeometryCache
+
+
+# 기본으로 미리 읽을 프레임 수
+PREFETCH_FRAMES = 4
+
+
+class FrameSamples:
+    """한 시간 코드의 미리 읽은 값"""
+    
+    __slots__ = ('time', 'matrices')
+    
+    def __init__(self, time):
+        self.time = time
+        self.matrices = {}      # Sdf.Path -> Gf.Matrix4d (월드)
+
+
+def read_frame_samples(stage, time, xform_paths, mesh_paths, geometry_cache):
+    """time의 월드 행렬 계산, 메시 배열은 geometry_cache에 채움 (워커 스레드)"""
+    samples = FrameSamples(time)
+    time_code = Usd.TimeCode(time)
+    xform_cache = UsdGeom.XformCache(time_code)
+    
+    for path in xform_paths:
+        prim = stage.GetPrimAtPath(path)
+        if prim:
+            samples.matrices[path] = xform_cache.GetLocalToWorldTransform(prim)
+    
+    for path in mesh_paths:
+        if geometry_cache.contains(path, time):
+            continue
+        prim = stage.GetPrimAtPath(path)
+        if prim:
+            geometry_cache.fetch(UsdGeom.Mesh(prim), time, count=False)
+    
+    return samples
+
+
+class TimeSamplePrefetcher:
+    """요청된 시간들의 FrameSamples를 백그라운드 스레드에서 채움"""
+    
+    def __init__(self, geometry_cache=None, max_frames=PREFETCH_FRAMES * 2, read_lock=None):
+        self.max_frames = max_frames
+        self.geometry_cache = geometry_cache if geometry_cache is not None else GeometryCache()
+        self.stage = None
+        self.xform_paths = ()
+        self.mesh_paths = ()
+        
+        self._frames = {}           # time -> FrameSamples
+        self._queue = deque()
+        self._generation = 0        # 무효화될 때마다 증가 (이전 결과 폐기)
+        self._condition = threading.Condition()
+        self._thread = None
+        self._stopped = False
+        # 스테이지를 읽는 동안 보유 (편집과 상호 배제)
+        self._read_lock = read_lock if read_lock is not None else threading.Lock()
+        
+        self.hits = 0
+        self.misses = 0
+    
+    def set_stage(self, stage):
+        with self._condition:
+            self.stage = stage
+            self.xform_paths = self.mesh_paths = ()
+            self._reset()
+    
+    def set_targets(self, xform_paths, mesh_paths):
+        """미리 읽을 대상 (시간 변화가 있는 변환/메시 프림 경로)"""
+        with self._condition:
+            self.xform_paths = tuple(xform_paths)
+            self.mesh_paths = tuple(mesh_paths)
+            self._reset()
+    
+    def invalidate(self):
+        """스테이지 편집 등으로 미리 읽은 값이 무효가 됨"""
+        with self._condition:
+            self._reset()
+    
+    def _reset(self):
+        self._generation += 1
+        self._frames.clear()
+        self._queue.clear()
+    
+    def request(self, times):
+        """times만 남기고 나머지는 버린 뒤 없는 프레임을 순서대로 예약"""
+        with self._condition:
+            if self.stage is None or not (self.xform_paths or self.mesh_paths):
+                return
+            wanted = list(times)[:self.max_frames]
+            for time in [t for t in self._frames if t not in wanted]:
+                del self._frames[time]
+            self._queue = deque(t for t in wanted if t not in self._frames)
+            
+            if self._queue and self._thread is None:
+                self._stopped = False
+                self._thread = threading.Thread(target=self._run, name='TimeSamplePrefetcher',
+                                                daemon=True)
+                self._thread.start()
+            self._condition.notify()
+    
+    def take(self, time):
+        """미리 읽은 프레임 꺼내기 (없으면 None)"""
+        with self._condition:
+            samples = self._frames.pop(time, None)
+            if samples is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return samples
+    
+    @contextmanager
+    def paused(self):
+        """스테이지 편집 구간 (진행 중인 프레임 읽기가 끝날 때까지 기다리고 새 읽기를 막음)
+        
+        블록 안에서 stop()을 호출하면 안 됨 (스레드가 이 잠금을 기다릴 수 있음)
+        """
+        with self._read_lock:
+            yield
+    
+    def stop(self):
+        with self._condition:
+            self._stopped = True
+            self._reset()
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+    
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._queue and not self._stopped:
+                    self._condition.wait()
+                if self._stopped:
+                    return
+                time = self._queue.popleft()
+                generation = self._generation
+                stage, xform_paths, mesh_paths = self.stage, self.xform_paths, self.mesh_paths
+            
+            with self._read_lock:
+                samples = read_frame_samples(stage, time, xform_paths, mesh_paths,
+                                             self.geometry_cache)
+            
+            with self._condition:
+                if generation == self._generation:
+                    self._frames[time] = samples
+    
+    def stats(self):
+        total = self.hits + self.misses
+        rate = self.hits / total if total else 0.0
+        return f"프리페치 적중 {self.hits}/{total} ({rate:.0%}), 대기 {len(self._frames)}프레임"
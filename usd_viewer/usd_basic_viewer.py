@@ -13,12 +13,22 @@ USD Basic Viewer - PyOpenGL 기반 기본 뷰어
 사용법:
     python usd_basic_viewer.py [usd_file_path]
     python usd_basic_viewer.py  # 샘플 큐브 생성
+    python usd_basic_viewer.py --immediate  # VBO 없이 즉시 모드 렌더링
+    python usd_basic_viewer.py --no-cache file.usd  # 메시 디스크 캐시 사용 안 함
+    python usd_basic_viewer.py --smooth file.usd    # 스무스 버텍스 노멀
+    python usd_basic_viewer.py --workers 4 file.usd # 4개 스레드로 메시 추출
+    python usd_basic_viewer.py go2.usd --exclude collisions  # 부분 로딩 (stage_loader 참고)
 """
 
 import sys
 import math
+import time
+import argparse
 import numpy as np
 from pathlib import Path
+from functools import partial
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     import glfw
@@ -31,12 +41,20 @@ except ImportError:
 
 try:
     from pxr import Usd, UsdGeom, Gf
+    from xform_cache import TransformCache
+    from stage_loader import StageOpenOptions, add_open_arguments, open_stage
     USD_AVAILABLE = True
 except ImportError:
     USD_AVAILABLE = False
     print("경고: USD 라이브러리가 없습니다. 샘플 지오메트리만 사용 가능합니다.")
     print("  pip install usd-core")
 
+from frame_profiler import FrameProfiler
+from gl_utils import MeshBuffers, buffers_supported
+from mesh_utils import (points_to_array, triangulate, read_authored_normals, map_normals,
+                        face_normals, vertex_normals, flat_vertex_arrays)
+from mesh_disk_cache import MeshDiskCache, DEFAULT_CACHE_DIR
+
 
 class Camera:
     """마우스로 제어 가능한 Orbit 카메라"""
@@ -96,49 +114,124 @@ class Camera:
         self.distance = max(0.1, min(100.0, self.distance))
 
 
+def _rows(value, dtype):
+    """(K, 3) 연속 배열로 변환 (dtype이 같으면 복사 없음)"""
+    return np.ascontiguousarray(value, dtype=dtype).reshape(-1, 3)
+
+
 class Mesh:
-    """메시 데이터를 저장하고 렌더링하는 클래스"""
+    """메시 데이터를 저장하고 렌더링하는 클래스
+    
+    지오메트리는 타입이 고정된 연속 NumPy 배열로만 보관합니다.
+    (리스트를 대입해도 setter에서 배열로 변환)
+        vertices - float32 (N, 3)
+        faces    - uint32 (M, 3) 삼각형 인덱스
+        normals  - float32 노멀 (normal_interpolation에 따라 모양이 다름)
+                   uniform: (M, 3) 삼각형별 / vertex: (N, 3) 버텍스별 /
+                   faceVarying: (M * 3, 3) 삼각형 코너별
+    USD에서 읽은 배열은 Vt 배열을 공유하는 읽기 전용 뷰일 수 있습니다.
+    """
+    
+    __slots__ = ('name', '_vertices', '_faces', '_normals', 'normal_interpolation',
+                 'color', 'transform', 'buffers', '_bounds')
     
     def __init__(self, name="mesh"):
         self.name = name
-        self.vertices = []      # [[x, y, z], ...]
-        self.normals = []       # [[nx, ny, nz], ...]
-        self.faces = []         # [[v0, v1, v2], ...] 삼각형 인덱스
-        self.color = [0.7, 0.7, 0.8]  # 기본 색상
+        self.vertices = ()
+        self.normals = ()
+        self.normal_interpolation = 'uniform'
+        self.faces = ()
+        self.color = (0.7, 0.7, 0.8)  # 기본 색상
         self.transform = np.eye(4)     # 변환 행렬
-    
-    def compute_normals(self):
-        """페이스 노멀 계산 (플랫 셰이딩용)"""
-        self.normals = []
-        vertices = np.array(self.vertices)
-        
-        for face in self.faces:
-            if len(face) >= 3:
-                v0 = vertices[face[0]]
-                v1 = vertices[face[1]]
-                v2 = vertices[face[2]]
-                
-                edge1 = v1 - v0
-                edge2 = v2 - v0
-                normal = np.cross(edge1, edge2)
-                
-                length = np.linalg.norm(normal)
-                if length > 0:
-                    normal = normal / length
-                else:
-                    normal = np.array([0, 1, 0])
-                
-                self.normals.append(normal)
+        self.buffers = None            # GPU 버퍼 (upload 후 사용)
+    
+    @property
+    def vertices(self):
+        return self._vertices
+    
+    @vertices.setter
+    def vertices(self, value):
+        self._vertices = _rows(value, np.float32)
+        self._bounds = None
+    
+    @property
+    def faces(self):
+        return self._faces
+    
+    @faces.setter
+    def faces(self, value):
+        self._faces = _rows(value, np.uint32)
+    
+    @property
+    def normals(self):
+        return self._normals
+    
+    @normals.setter
+    def normals(self, value):
+        self._normals = _rows(value, np.float32)
+    
+    @property
+    def nbytes(self):
+        """CPU 측 지오메트리 배열 크기 (바이트)"""
+        return self._vertices.nbytes + self._faces.nbytes + self._normals.nbytes
+    
+    def compute_normals(self, smooth=False):
+        """노멀 계산 (모든 삼각형을 한 번에 벡터 연산)
+        
+        smooth=False: 삼각형별 노멀 (플랫 셰이딩)
+        smooth=True: 면적 가중 버텍스 노멀 (스무스 셰이딩)
+        """
+        if smooth:
+            self.normals = vertex_normals(self.vertices, self.faces)
+            self.normal_interpolation = 'vertex'
+        else:
+            self.normals = face_normals(self.vertices, self.faces)
+            self.normal_interpolation = 'uniform'
+    
+    def has_valid_normals(self):
+        """노멀 개수가 보간 방식과 토폴로지에 맞는지"""
+        expected = {
+            'uniform': len(self.faces),
+            'vertex': len(self.vertices),
+            'faceVarying': len(self.faces) * 3,
+        }.get(self.normal_interpolation)
+        return len(self.faces) > 0 and len(self.normals) == expected
     
     def get_bounds(self):
-        """바운딩 박스 반환"""
-        if not self.vertices:
+        """바운딩 박스 반환 (vertices가 바뀔 때까지 캐시)"""
+        if len(self.vertices) == 0:
             return [0, 0, 0], [1, 1, 1]
         
-        vertices = np.array(self.vertices)
-        min_bound = vertices.min(axis=0)
-        max_bound = vertices.max(axis=0)
-        return min_bound.tolist(), max_bound.tolist()
+        if self._bounds is None:
+            min_bound = self.vertices.min(axis=0)
+            max_bound = self.vertices.max(axis=0)
+            self._bounds = (min_bound.tolist(), max_bound.tolist())
+        return self._bounds
+    
+    def upload(self):
+        """버텍스/노멀/인덱스를 GPU 버퍼로 업로드 (GL 컨텍스트 필요)
+        
+        버텍스 노멀이면 버텍스/노멀/인덱스 배열을 복사 없이 그대로 올리고,
+        삼각형별/코너별 노멀이면 삼각형마다 버텍스를 펼쳐서 인덱스 버퍼 없이 저장합니다.
+        """
+        self.release()
+        if not self.has_valid_normals():
+            return False
+        
+        if self.normal_interpolation == 'vertex':
+            self.buffers = MeshBuffers(self.vertices, self.normals, self.faces)
+            return True
+        
+        positions, normals = flat_vertex_arrays(self.vertices, self.faces, self.normals,
+                                                self.normal_interpolation)
+        self.buffers = MeshBuffers(positions, normals)   # 인덱스 없이 glDrawArrays
+        return True
+    
+    def release(self):
+        """GPU 버퍼 해제"""
+        if self.buffers:
+            self.buffers.release()
+            self.buffers = None
     
     def render(self, wireframe=False):
         """OpenGL로 메시 렌더링"""
@@ -152,18 +245,27 @@ class Mesh:
             glPolygonMode(GL_FRONT_AND_BACK, GL_FILL)
             glColor3f(*self.color)
         
-        glBegin(GL_TRIANGLES)
-        for i, face in enumerate(self.faces):
-            if i < len(self.normals):
-                glNormal3fv(self.normals[i])
-            
-            for vertex_idx in face[:3]:  # 삼각형만 처리
-                if vertex_idx < len(self.vertices):
-                    glVertex3fv(self.vertices[vertex_idx])
-        glEnd()
+        if self.buffers:
+            # 리테인드 모드: GPU 버퍼에서 한 번에 드로우
+            self.buffers.draw()
+        else:
+            self.render_immediate()
         
         glPolygonMode(GL_FRONT_AND_BACK, GL_FILL)
         glPopMatrix()
+    
+    def render_immediate(self):
+        """즉시 모드 렌더링 (버퍼 오브젝트가 없는 컨텍스트용 폴백)"""
+        if not self.has_valid_normals():
+            return
+        
+        positions, normals = flat_vertex_arrays(self.vertices, self.faces, self.normals,
+                                                self.normal_interpolation)
+        glBegin(GL_TRIANGLES)
+        for position, normal in zip(positions, normals):
+            glNormal3fv(normal)
+            glVertex3fv(position)
+        glEnd()
 
 
 def create_sample_cube():
@@ -171,24 +273,24 @@ def create_sample_cube():
     mesh = Mesh("sample_cube")
     
     # 큐브 버텍스 (단위 큐브, 중심이 원점)
-    mesh.vertices = [
+    mesh.vertices = np.array([
         [-0.5, -0.5, -0.5], [0.5, -0.5, -0.5],
         [0.5, 0.5, -0.5], [-0.5, 0.5, -0.5],
         [-0.5, -0.5, 0.5], [0.5, -0.5, 0.5],
         [0.5, 0.5, 0.5], [-0.5, 0.5, 0.5]
-    ]
+    ], dtype=np.float32)
     
     # 큐브 페이스 (삼각형으로 분할)
-    mesh.faces = [
+    mesh.faces = np.array([
         [0, 1, 2], [0, 2, 3],  # 뒤
         [4, 6, 5], [4, 7, 6],  # 앞
         [0, 4, 5], [0, 5, 1],  # 아래
         [2, 6, 7], [2, 7, 3],  # 위
         [0, 3, 7], [0, 7, 4],  # 왼쪽
         [1, 5, 6], [1, 6, 2],  # 오른쪽
-    ]
+    ], dtype=np.uint32)
     
-    mesh.color = [0.3, 0.6, 0.9]
+    mesh.color = (0.3, 0.6, 0.9)
     mesh.compute_normals()
     return mesh
 
@@ -196,6 +298,8 @@ def create_sample_cube():
 def create_sample_sphere(radius=1.0, segments=16, rings=12):
     """샘플 구 메시 생성"""
     mesh = Mesh("sample_sphere")
+    vertices = []
+    faces = []
     
     # 버텍스 생성
     for i in range(rings + 1):
@@ -207,7 +311,7 @@ def create_sample_sphere(radius=1.0, segments=16, rings=12):
             y = radius * math.cos(phi)
             z = radius * math.sin(phi) * math.sin(theta)
             
-            mesh.vertices.append([x, y, z])
+            vertices.append([x, y, z])
     
     # 페이스 생성
     for i in range(rings):
@@ -219,16 +323,49 @@ def create_sample_sphere(radius=1.0, segments=16, rings=12):
             v2 = (i + 1) * segments + next_j
             v3 = (i + 1) * segments + j
             
-            mesh.faces.append([v0, v2, v1])
-            mesh.faces.append([v0, v3, v2])
+            faces.append([v0, v2, v1])
+            faces.append([v0, v3, v2])
     
-    mesh.color = [0.9, 0.5, 0.3]
+    mesh.vertices = np.array(vertices, dtype=np.float32)
+    mesh.faces = np.array(faces, dtype=np.uint32)
+    mesh.color = (0.9, 0.5, 0.3)
     mesh.compute_normals()
     return mesh
 
 
-def load_usd_file(filepath):
-    """USD 파일에서 메시 로드"""
+def mesh_from_cached(cached):
+    """MeshDiskCache 항목 → Mesh (배열은 mmap 뷰 그대로 사용)"""
+    mesh = Mesh(cached.name)
+    mesh.vertices = cached.vertices
+    mesh.faces = cached.faces
+    mesh.normals = cached.normals
+    mesh.normal_interpolation = cached.normal_interpolation
+    mesh.color = cached.color
+    mesh.transform = cached.transform
+    return mesh
+
+
+def load_usd_file(filepath, cache=None, smooth=False, workers=1, open_options=None):
+    """USD 파일에서 메시 로드
+    
+    open_options(StageOpenOptions)로 population mask / 페이로드 로드 규칙을 지정합니다.
+    cache(MeshDiskCache)가 유효하면 USD 합성 없이 캐시된 배열을 사용하고,
+    아니면 추출 후 캐시에 저장합니다.
+    smooth=True면 저작된 노멀이 없는 메시에 스무스 버텍스 노멀을 계산합니다.
+    
+    추출은 두 단계로 나뉩니다:
+        1. 속성 읽기 (read_mesh_prim) - 메인 스레드에서 한 번에 순회
+        2. NumPy 처리 (build_mesh) - workers > 1이면 스레드 풀에서 병렬 실행
+    """
+    cache_options = {'smooth': smooth}
+    if open_options is not None and not open_options.is_default():
+        cache_options['open'] = open_options.to_dict()
+    if cache is not None:
+        cached = cache.load(filepath, cache_options)
+        if cached:
+            print(f"메시 캐시 사용: {filepath} ({len(cached)}개 메시)")
+            return [mesh_from_cached(item) for item in cached]
+    
     if not USD_AVAILABLE:
         print("USD 라이브러리가 없어 샘플 지오메트리를 사용합니다.")
         return [create_sample_cube(), create_sample_sphere()]
@@ -236,27 +373,50 @@ def load_usd_file(filepath):
     meshes = []
     
     try:
-        stage = Usd.Stage.Open(filepath)
+        start = time.perf_counter()
+        stage = open_stage(filepath, open_options)
         if not stage:
             print(f"USD 파일을 열 수 없습니다: {filepath}")
             return [create_sample_cube()]
         
-        print(f"USD 파일 로드: {filepath}")
+        description = open_options.describe() if open_options else "전체 로드"
+        print(f"USD 파일 로드: {filepath} ({description}, {(time.perf_counter() - start) * 1000:.0f} ms)")
+        
+        # 부모 체인 변환을 공유하는 월드 변환 캐시
+        xform_cache = TransformCache(Usd.TimeCode.Default())
         
-        # 모든 메시 프림 순회
-        for prim in stage.Traverse():
+        # 1단계: 모든 메시 프림의 속성을 한 번에 읽기
+        start = time.perf_counter()
+        sources = []
+        # instanceable 프림 아래 메시도 인스턴스 프록시로 포함
+        for prim in stage.Traverse(Usd.TraverseInstanceProxies()):
             if prim.IsA(UsdGeom.Mesh):
-                mesh = extract_mesh_from_prim(prim)
-                if mesh:
-                    meshes.append(mesh)
-                    print(f"  메시 발견: {prim.GetPath()}")
+                sources.append(read_mesh_prim(prim, xform_cache))
+                print(f"  메시 발견: {prim.GetPath()}")
+        read_time = time.perf_counter() - start
+        
+        # 2단계: 삼각형 분할/노멀/바운드 계산
+        start = time.perf_counter()
+        build = partial(build_mesh, smooth=smooth)
+        if workers > 1 and len(sources) > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                meshes = list(pool.map(build, sources))
+        else:
+            meshes = [build(source) for source in sources]
+        build_time = time.perf_counter() - start
         
         if not meshes:
             print("메시를 찾을 수 없습니다. 샘플 큐브를 사용합니다.")
             return [create_sample_cube()]
         
         print(f"총 {len(meshes)}개의 메시 로드 완료")
+        print(f"  {xform_cache.format_stats()}")
+        print(f"  속성 읽기 {read_time * 1000:.1f} ms / 처리 {build_time * 1000:.1f} ms "
+              f"(워커 {max(workers, 1)}개)")
         
+        if cache is not None and cache.save(filepath, stage, meshes, cache_options):
+            print(f"  메시 캐시 저장: {cache.entry_dir(filepath, cache_options)}")
+    
     except Exception as e:
         print(f"USD 로드 오류: {e}")
         return [create_sample_cube()]
@@ -264,61 +424,89 @@ def load_usd_file(filepath):
     return meshes
 
 
-def extract_mesh_from_prim(prim):
-    """USD Mesh Prim에서 메시 데이터 추출"""
-    mesh = Mesh(str(prim.GetPath()))
+# 메인 스레드에서 읽은 메시 프림 데이터 (Vt 배열 그대로, 복사 없음)
+MeshSource = namedtuple('MeshSource', 'name points counts indices normals '
+                                      'normal_interpolation transform color')
+
+
+def read_mesh_prim(prim, xform_cache=None):
+    """USD Mesh Prim의 속성 읽기 (USD 호출은 모두 여기서)
     
+    xform_cache를 넘기면 여러 프림이 부모 변환 계산을 공유합니다.
+    """
     usd_mesh = UsdGeom.Mesh(prim)
     
-    # 포인트 (버텍스) 추출
-    points_attr = usd_mesh.GetPointsAttr()
-    if points_attr:
-        points = points_attr.Get()
-        if points:
-            mesh.vertices = [[p[0], p[1], p[2]] for p in points]
-    
-    # 페이스 버텍스 인덱스 추출
-    face_indices_attr = usd_mesh.GetFaceVertexIndicesAttr()
-    face_counts_attr = usd_mesh.GetFaceVertexCountsAttr()
-    
-    if face_indices_attr and face_counts_attr:
-        indices = face_indices_attr.Get()
-        counts = face_counts_attr.Get()
-        
-        if indices and counts:
-            idx = 0
-            for count in counts:
-                face = []
-                for _ in range(count):
-                    if idx < len(indices):
-                        face.append(indices[idx])
-                        idx += 1
-                
-                # 삼각형화 (팬 방식)
-                if len(face) >= 3:
-                    for i in range(1, len(face) - 1):
-                        mesh.faces.append([face[0], face[i], face[i + 1]])
-    
     # 월드 변환 행렬 가져오기
-    xformable = UsdGeom.Xformable(prim)
-    world_transform = xformable.ComputeLocalToWorldTransform(Usd.TimeCode.Default())
-    mesh.transform = np.array(world_transform).T
+    if xform_cache is None:
+        xform_cache = TransformCache(Usd.TimeCode.Default())
+    world_transform = xform_cache.get_world_matrix(prim)
     
     # 색상 추출 시도
+    color = None
     display_color_attr = usd_mesh.GetDisplayColorAttr()
     if display_color_attr:
         colors = display_color_attr.Get()
         if colors and len(colors) > 0:
-            mesh.color = [colors[0][0], colors[0][1], colors[0][2]]
-    
-    mesh.compute_normals()
+            color = (colors[0][0], colors[0][1], colors[0][2])
+    
+    normals, interpolation = read_authored_normals(usd_mesh)
+    return MeshSource(
+        name=str(prim.GetPath()),
+        points=usd_mesh.GetPointsAttr().Get(),
+        counts=usd_mesh.GetFaceVertexCountsAttr().Get(),
+        indices=usd_mesh.GetFaceVertexIndicesAttr().Get(),
+        normals=normals,
+        normal_interpolation=interpolation,
+        transform=np.array(world_transform).T,
+        color=color,
+    )
+
+
+def build_mesh(source, smooth=False):
+    """MeshSource → Mesh (NumPy 연산만 사용하므로 워커 스레드에서 실행 가능)
+    
+    저작된 노멀이 있으면 그대로 사용하고,
+    없으면 smooth에 따라 삼각형별 또는 버텍스별 노멀을 계산합니다.
+    """
+    mesh = Mesh(source.name)
+    mesh.transform = source.transform
+    if source.color is not None:
+        mesh.color = source.color
+    
+    # 포인트/페이스 추출 및 삼각형화 (NumPy 벡터 연산)
+    if not source.points or not source.counts or not source.indices:
+        mesh.compute_normals(smooth)
+        return mesh
+    
+    mesh.vertices = points_to_array(source.points)
+    mesh.faces = triangulate(source.counts, source.indices, num_points=len(mesh.vertices))
+    
+    authored = None
+    if source.normals is not None:
+        authored = map_normals(source.normals, source.normal_interpolation,
+                               source.counts, source.indices, len(mesh.vertices))
+    if authored is not None:
+        mesh.normals, mesh.normal_interpolation = authored
+    else:
+        mesh.compute_normals(smooth)
+    
+    mesh.get_bounds()
     return mesh
 
 
+def extract_mesh_from_prim(prim, xform_cache=None, smooth=False):
+    """USD Mesh Prim에서 메시 데이터 추출 (read_mesh_prim + build_mesh)"""
+    return build_mesh(read_mesh_prim(prim, xform_cache), smooth)
+
+
 class USDBasicViewer:
     """USD 기본 뷰어 메인 클래스"""
     
-    def __init__(self, width=1280, height=720):
+    # 창 제목 통계 갱신 주기 (초)
+    TITLE_UPDATE_INTERVAL = 0.5
+    
+    def __init__(self, width=1280, height=720, use_buffers=True, profile_csv=None, mesh_cache=None,
+                 smooth_normals=False, workers=1, open_options=None):
         self.width = width
         self.height = height
         self.window = None
@@ -329,6 +517,15 @@ class USDBasicViewer:
         self.show_wireframe = False
         self.show_axes = True
         self.show_grid = True
+        self.use_buffers = use_buffers  # VBO/IBO 리테인드 모드 사용
+        self.mesh_cache = mesh_cache    # MeshDiskCache (None이면 매번 USD에서 추출)
+        self.smooth_normals = smooth_normals  # 저작된 노멀이 없을 때 버텍스 노멀 계산
+        self.workers = workers                # 메시 추출 스레드 수
+        self.open_options = open_options      # StageOpenOptions (부분 로딩)
+        
+        # 프레임 프로파일러 (통계는 창 제목에 표시)
+        self.profiler = FrameProfiler(csv_path=profile_csv)
+        self.last_title_update = 0.0
         
         # 조명 설정
         self.light_position = [5.0, 10.0, 5.0, 1.0]
@@ -395,16 +592,38 @@ class USDBasicViewer:
     def load_meshes(self, filepath=None):
         """메시 로드 및 카메라 조정"""
         if filepath and Path(filepath).exists():
-            self.meshes = load_usd_file(filepath)
+            self.meshes = load_usd_file(filepath, self.mesh_cache, self.smooth_normals, self.workers,
+                                        self.open_options)
         else:
             print("샘플 지오메트리를 생성합니다.")
             self.meshes = [create_sample_cube(), create_sample_sphere()]
             # 구를 옆으로 이동
             self.meshes[1].transform[3, 0] = 2.0
         
+        self.upload_meshes()
+        
         # 전체 씬의 바운딩 박스 계산
         self.fit_camera_to_scene()
     
+    def upload_meshes(self):
+        """메시를 GPU 버퍼로 업로드 (지원되지 않으면 즉시 모드 유지)"""
+        if not self.use_buffers:
+            print("렌더링 모드: 즉시 모드 (glBegin/glEnd)")
+            return
+        
+        if not buffers_supported():
+            print("버퍼 오브젝트를 지원하지 않는 컨텍스트입니다. 즉시 모드로 렌더링합니다.")
+            self.use_buffers = False
+            return
+        
+        uploaded = sum(1 for mesh in self.meshes if mesh.upload())
+        print(f"렌더링 모드: VBO/IBO ({uploaded}/{len(self.meshes)}개 메시 업로드)")
+    
+    def release_meshes(self):
+        """모든 메시의 GPU 버퍼 해제"""
+        for mesh in self.meshes:
+            mesh.release()
+    
     def fit_camera_to_scene(self):
         """씬에 맞게 카메라 조정"""
         if not self.meshes:
@@ -487,10 +706,11 @@ class USDBasicViewer:
             self.draw_axes()
         
         # 메시 렌더링
-        for mesh in self.meshes:
-            mesh.render(wireframe=False)
-            if self.show_wireframe:
-                mesh.render(wireframe=True)
+        with self.profiler.phase('gl_submit'):
+            for mesh in self.meshes:
+                mesh.render(wireframe=False)
+                if self.show_wireframe:
+                    mesh.render(wireframe=True)
     
     # === 콜백 함수들 ===
     
@@ -551,6 +771,15 @@ class USDBasicViewer:
         elif key == glfw.KEY_H:
             self.print_help()
     
+    def update_title(self):
+        """FPS / 프레임 시간 백분위수를 창 제목에 표시"""
+        now = time.perf_counter()
+        if now - self.last_title_update < self.TITLE_UPDATE_INTERVAL:
+            return
+        self.last_title_update = now
+        fps_line, frame_line = self.profiler.overlay_lines()[:2]
+        glfw.set_window_title(self.window, f"USD Basic Viewer - {fps_line} | {frame_line}")
+    
     def resize_callback(self, window, width, height):
         self.width = width
         self.height = height
@@ -565,7 +794,7 @@ class USDBasicViewer:
     좌클릭 드래그  : 회전
     우클릭 드래그  : 패닝
     휠             : 줌
-
+  
   키보드:
     W : 와이어프레임 토글
     G : 그리드 토글
@@ -586,21 +815,50 @@ class USDBasicViewer:
         print("H 키로 도움말을 볼 수 있습니다.\n")
         
         while not glfw.window_should_close(self.window):
+            self.profiler.begin_frame()
             self.render()
+            self.profiler.end_frame()
+            self.update_title()
             glfw.swap_buffers(self.window)
             glfw.poll_events()
         
+        self.release_meshes()
+        self.profiler.close()
         glfw.terminate()
         print("\n뷰어 종료")
 
 
+def parse_args(argv=None):
+    """커맨드라인 인자 파싱"""
+    parser = argparse.ArgumentParser(description="USD Basic Viewer - PyOpenGL 기반 기본 뷰어")
+    parser.add_argument("usd_file", nargs="?", help="열 USD 파일 (생략 시 샘플 지오메트리)")
+    parser.add_argument("--immediate", action="store_true",
+                        help="VBO 대신 즉시 모드(glBegin/glEnd)로 렌더링")
+    parser.add_argument("--profile-csv", metavar="PATH",
+                        help="프레임별 단계 시간을 CSV로 기록")
+    parser.add_argument("--smooth", action="store_true",
+                        help="저작된 노멀이 없는 메시에 면적 가중 스무스 노멀 사용")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="메시 삼각형 분할/노멀 계산 스레드 수 (1이면 순차 처리)")
+    parser.add_argument("--cache-dir", metavar="DIR", default=str(DEFAULT_CACHE_DIR),
+                        help="삼각형 분할된 메시 디스크 캐시 위치")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="메시 디스크 캐시를 사용하지 않음 (매번 USD에서 추출)")
+    if USD_AVAILABLE:
+        add_open_arguments(parser)
+    return parser.parse_args(argv)
+
+
 def main():
     """메인 함수"""
-    viewer = USDBasicViewer()
-    
-    filepath = None
-    if len(sys.argv) > 1:
-        filepath = sys.argv[1]
+    args = parse_args()
+    mesh_cache = None if args.no_cache else MeshDiskCache(args.cache_dir)
+    viewer = USDBasicViewer(use_buffers=not args.immediate, profile_csv=args.profile_csv,
+                            mesh_cache=mesh_cache, smooth_normals=args.smooth, workers=args.workers,
+                            open_options=StageOpenOptions.from_args(args) if USD_AVAILABLE else None)
+    
+    filepath = args.usd_file
+    if filepath:
         if not Path(filepath).exists():
             print(f"파일을 찾을 수 없습니다: {filepath}")
             filepath = None
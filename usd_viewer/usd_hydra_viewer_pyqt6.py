@@ -13,6 +13,10 @@ PySide6 DLL 충돌 문제 발생 시 PyQt6 대체 버전
 
 import sys
 import math
+import argparse
+import time
+from collections import deque
+from contextlib import nullcontext
 import numpy as np
 from pathlib import Path
 
@@ -21,11 +25,12 @@ try:
     from PyQt6.QtWidgets import (
         QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
         QToolBar, QStatusBar, QFileDialog, QSlider, QLabel, QComboBox,
-        QCheckBox, QGroupBox, QDockWidget, QTreeWidget, QTreeWidgetItem,
-        QPushButton, QSpinBox, QDoubleSpinBox, QSplitter, QFrame
+        QCheckBox, QGroupBox, QDockWidget, QTreeWidget, QTreeWidgetItem, QTreeView,
+        QPushButton, QSpinBox, QDoubleSpinBox, QSplitter, QFrame, QProgressBar,
+        QInputDialog, QLineEdit, QMenu
     )
-    from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QSize
-    from PyQt6.QtGui import QAction, QIcon, QKeySequence
+    from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QSize, QThread, QAbstractItemModel, QModelIndex
+    from PyQt6.QtGui import QAction, QIcon, QKeySequence, QPainter, QColor, QFont
     from PyQt6.QtOpenGLWidgets import QOpenGLWidget
 except ImportError as e:
     print(f"PyQt6 import 오류: {e}")
@@ -41,10 +46,28 @@ except ImportError:
     print("  pip install PyOpenGL PyOpenGL_accelerate")
     sys.exit(1)
 
+from frame_profiler import FrameProfiler
+from playback import DISPLAY_RATE, Playback
+from frame_capture import FrameCapture, open_writer
+
 # USD 관련 임포트
+USD_AVAILABLE = False
 USD_HYDRA_AVAILABLE = False
 try:
-    from pxr import Usd, UsdGeom, UsdLux, UsdShade, Sdf, Gf, Tf
+    from pxr import Usd, UsdGeom, UsdLux, UsdShade, Sdf, Gf
+    from change_tracker import ChangeTracker
+    from draw_cache import DrawCache
+    from geometry_cache import DEFAULT_MAX_BYTES as DEFAULT_GEOMETRY_CACHE_BYTES
+    from time_prefetch import PREFETCH_FRAMES
+    from primitive_meshes import PrimitiveCache
+    from xform_cache import TransformCache
+    from stage_loader import (LoadCancelled, StageOpenOptions, add_open_arguments,
+                              compute_stage_bounds, load_stage_data)
+    from joint_replay import JointRig, load_trajectory
+    from joint_stream import DEFAULT_ADDRESS as DEFAULT_STREAM_ADDRESS, JointStream
+    from prim_tree import PrimTree
+    from payloads import PayloadManager, format_bytes
+    USD_AVAILABLE = True
     try:
         from pxr import UsdImagingGL
         USD_HYDRA_AVAILABLE = True
@@ -84,6 +107,20 @@ class Camera:
         
         return [self.target[0] + x, self.target[1] + y, self.target[2] + z]
     
+    def get_view_matrix(self):
+        """뷰 행렬 (Gf.Matrix4d)"""
+        return Gf.Matrix4d().SetLookAt(
+            Gf.Vec3d(*self.get_position()),
+            Gf.Vec3d(*self.target),
+            Gf.Vec3d(0, 1, 0)
+        )
+    
+    def get_projection_matrix(self, aspect):
+        """투영 행렬 (Gf.Matrix4d)"""
+        frustum = Gf.Frustum()
+        frustum.SetPerspective(self.fov, aspect, self.near, self.far)
+        return frustum.ComputeProjectionMatrix()
+    
     def rotate(self, dx, dy):
         self.azimuth -= dx * 0.3
         self.elevation += dy * 0.3
@@ -122,10 +159,76 @@ class Camera:
         self.distance = size * 2.0 if size > 0 else 10.0
 
 
+class StageLoadWorker(QThread):
+    """스테이지 열기/바운딩 박스 계산을 수행하는 워커 스레드"""
+    
+    progress = pyqtSignal(int, str)
+    loaded = pyqtSignal(object)
+    failed = pyqtSignal(str)
+    cancelled = pyqtSignal()
+    
+    def __init__(self, filepath, options=None, parent=None):
+        super().__init__(parent)
+        self.filepath = filepath
+        self.options = options      # StageOpenOptions (None이면 전체 로드)
+        self._cancel_requested = False
+    
+    def cancel(self):
+        """취소 요청 (현재 단계가 끝난 뒤 반영)"""
+        self._cancel_requested = True
+    
+    def is_cancelled(self):
+        return self._cancel_requested
+    
+    def run(self):
+        try:
+            result = load_stage_data(self.filepath, self.progress.emit, self.is_cancelled,
+                                     self.options)
+        except LoadCancelled:
+            self.cancelled.emit()
+        except Exception as e:
+            self.failed.emit(str(e))
+        else:
+            if self._cancel_requested:
+                self.cancelled.emit()
+            else:
+                self.loaded.emit(result)
+
+
+class PayloadWorker(QThread):
+    """페이로드 프리페치/메모리 추정을 수행하는 워커 스레드 (스테이지 읽기 전용)"""
+    
+    done = pyqtSignal(object)
+    failed = pyqtSignal(str)
+    
+    def __init__(self, manager, kind, path, parent=None):
+        super().__init__(parent)
+        self.manager = manager      # PayloadManager
+        self.kind = kind            # 'load' (prefetch) | 'estimate'
+        self.path = path
+    
+    def run(self):
+        function = self.manager.prefetch if self.kind == 'load' else self.manager.estimate
+        try:
+            result = function(self.path)
+        except Exception as e:
+            self.failed.emit(str(e))
+        else:
+            self.done.emit(result)
+
+
 class GLViewport(QOpenGLWidget):
     """OpenGL 렌더링 뷰포트"""
     
     sceneLoaded = pyqtSignal(str)
+    stageLoaded = pyqtSignal(object)        # StageLoadResult
+    loadProgress = pyqtSignal(int, str)
+    loadFailed = pyqtSignal(str)
+    firstFrameRendered = pyqtSignal(float)  # 로드 요청 → 첫 프레임까지 걸린 시간 (초)
+    cullingChanged = pyqtSignal(int, int)   # (그린 프림 수, 컬링된 프림 수)
+    timeChanged = pyqtSignal(float)         # 현재 시간 코드
+    playbackChanged = pyqtSignal(bool)      # 재생 중 여부
+    stageChanged = pyqtSignal(object)       # StageChanges (ObjectsChanged 분류 결과)
     
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -133,7 +236,23 @@ class GLViewport(QOpenGLWidget):
         self.camera = Camera()
         self.stage = None
         self.renderer = None
+        
+        # 애니메이션 재생 (스테이지 시간 범위/timeCodesPerSecond 기준 실시간)
         self.time_code = 0.0
+        self.playback = Playback()
+        self.animation_timer = QTimer(self)
+        self.animation_timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.animation_timer.timeout.connect(self.advance_time)
+        
+        # 턴테이블 (T 키, 화면 갱신마다 고정 각도 회전 → 녹화 프레임 간격 일정)
+        self.turntable_period = 12.0    # 한 바퀴 시간 (초)
+        self.turntable_timer = QTimer(self)
+        self.turntable_timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.turntable_timer.setInterval(int(1000 / DISPLAY_RATE))
+        self.turntable_timer.timeout.connect(self.advance_turntable)
+        
+        # 프레임 녹화 (PBO 비동기 리드백, start_recording/stop_recording)
+        self.frame_capture = None
         
         # 렌더링 옵션
         self.draw_mode = 'shaded'
@@ -142,8 +261,23 @@ class GLViewport(QOpenGLWidget):
         self.enable_lighting = True
         self.background_color = (0.18, 0.18, 0.22, 1.0)
         
-        # 메시 캐시
-        self.mesh_cache = []
+        # 프레임 프로파일러 (P 키로 오버레이 토글)
+        self.profiler = FrameProfiler()
+        self.show_profiler = False
+        
+        # 프림별 드로우 캐시 (Fallback 렌더러용) / 월드 변환 캐시
+        self.draw_cache = None
+        self.xform_cache = None
+        self.change_tracker = None  # 스테이지 편집 알림 (드로우 캐시/계층 패널 공유)
+        self.geometry_cache_bytes = None  # 변형 메시 시간 샘플 캐시 상한 (None이면 기본값)
+        self.primitive_cache = None  # (종류, 파라미터) 별 공유 프리미티브 메시
+        
+        # 백그라운드 로드 상태
+        self.load_worker = None
+        self.load_started = None
+        self.first_frame_pending = False
+        
+        self.last_cull_counts = None
         
         self.setMouseTracking(True)
         self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
@@ -167,12 +301,23 @@ class GLViewport(QOpenGLWidget):
         
         # Hydra 렌더러 초기화 시도
         if USD_HYDRA_AVAILABLE:
-            try:
-                self.renderer = UsdImagingGL.Engine()
-                print("Hydra 렌더러 초기화 완료")
-            except Exception as e:
-                print(f"Hydra 초기화 실패: {e}")
-                self.renderer = None
+            self.init_hydra_renderer()
+    
+    def init_hydra_renderer(self):
+        """Hydra 렌더러 초기화"""
+        try:
+            self.renderer = UsdImagingGL.Engine()
+            print("Hydra 렌더러 초기화 완료")
+        except Exception as e:
+            print(f"Hydra 초기화 실패: {e}")
+            self.renderer = None
+    
+    def reset_hydra_renderer(self):
+        """Hydra 엔진 재생성 (엔진은 처음 렌더링한 스테이지로만 채워지므로 스테이지 교체 시 호출)"""
+        self.makeCurrent()
+        self.renderer = None    # 이전 엔진의 GL 리소스는 컨텍스트가 활성일 때 해제
+        self.init_hydra_renderer()
+        self.doneCurrent()
     
     def resizeGL(self, w, h):
         glViewport(0, 0, w, h)
@@ -180,6 +325,7 @@ class GLViewport(QOpenGLWidget):
             self.renderer.SetRenderViewport((0, 0, w, h))
     
     def paintGL(self):
+        self.profiler.begin_frame()
         glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
         
         w, h = self.width(), self.height()
@@ -215,6 +361,44 @@ class GLViewport(QOpenGLWidget):
                 self.render_hydra()
             else:
                 self.render_fallback()
+        
+        # 오버레이 전에 캡처 (녹화에는 씬만 포함)
+        if self.frame_capture is not None:
+            with self.profiler.phase('readback'):
+                self.frame_capture.capture(*self.framebuffer_size())
+        
+        self.profiler.end_frame()
+        if self.show_profiler:
+            self.draw_profiler_overlay()
+        
+        self.report_first_frame()
+    
+    def draw_profiler_overlay(self):
+        """프레임 통계를 QPainter로 뷰포트 좌상단에 표시"""
+        lines = self.profiler.overlay_lines()
+        
+        # QPainter가 바꾸는 고정 파이프라인 상태 보존
+        glPushAttrib(GL_ALL_ATTRIB_BITS)
+        glMatrixMode(GL_PROJECTION)
+        glPushMatrix()
+        glMatrixMode(GL_MODELVIEW)
+        glPushMatrix()
+        
+        painter = QPainter(self)
+        painter.setFont(QFont("monospace", 9))
+        line_height = painter.fontMetrics().height()
+        painter.fillRect(6, 6, 330, line_height * len(lines) + 8, QColor(0, 0, 0, 160))
+        painter.setPen(QColor(230, 230, 230))
+        for i, line in enumerate(lines):
+            painter.drawText(12, 8 + line_height * (i + 1) - 3, line)
+        painter.end()
+        
+        glUseProgram(0)
+        glMatrixMode(GL_PROJECTION)
+        glPopMatrix()
+        glMatrixMode(GL_MODELVIEW)
+        glPopMatrix()
+        glPopAttrib()
     
     def render_hydra(self):
         """Hydra를 통한 USD 렌더링"""
@@ -237,30 +421,21 @@ class GLViewport(QOpenGLWidget):
             params.enableSceneMaterials = True
             
             # 뷰/투영 행렬 계산
-            eye = self.camera.get_position()
-            target = self.camera.target
-            
-            view_matrix = Gf.Matrix4d().SetLookAt(
-                Gf.Vec3d(*eye),
-                Gf.Vec3d(*target),
-                Gf.Vec3d(0, 1, 0)
-            )
-            
-            frustum = Gf.Frustum()
-            frustum.SetPerspective(self.camera.fov, aspect, self.camera.near, self.camera.far)
-            proj_matrix = frustum.ComputeProjectionMatrix()
+            view_matrix = self.camera.get_view_matrix()
+            proj_matrix = self.camera.get_projection_matrix(aspect)
             
             self.renderer.SetRenderViewport((0, 0, w, h))
             self.renderer.SetCameraState(view_matrix, proj_matrix)
-            self.renderer.Render(self.stage.GetPseudoRoot(), params)
-            
+            with self.profiler.phase('hydra_render'):
+                self.renderer.Render(self.stage.GetPseudoRoot(), params)
+        
         except Exception as e:
             print(f"Hydra 렌더링 오류: {e}")
             self.render_fallback()
     
     def render_fallback(self):
-        """OpenGL 직접 렌더링 (Hydra 없이)"""
-        if not self.stage:
+        """OpenGL 직접 렌더링 (Hydra 없이, 프림별 드로우 캐시 사용)"""
+        if not self.stage or self.draw_cache is None:
             return
         
         if self.enable_lighting:
@@ -268,50 +443,45 @@ class GLViewport(QOpenGLWidget):
         else:
             glDisable(GL_LIGHTING)
         
-        for prim in self.stage.Traverse():
-            if prim.IsA(UsdGeom.Mesh):
-                self.render_mesh(prim)
-            elif prim.IsA(UsdGeom.Cube):
-                self.render_cube(prim)
-            elif prim.IsA(UsdGeom.Sphere):
-                self.render_sphere(prim)
-            elif prim.IsA(UsdGeom.Cylinder):
-                self.render_cylinder(prim)
-            elif prim.IsA(UsdGeom.Cone):
-                self.render_cone(prim)
-            elif prim.IsA(UsdGeom.Capsule):
-                self.render_capsule(prim)
-    
-    def apply_transform(self, prim):
-        """프림의 변환 행렬 적용"""
-        xform = UsdGeom.Xformable(prim)
-        world_xform = xform.ComputeLocalToWorldTransform(Usd.TimeCode(self.time_code))
-        glMultMatrixd(list(world_xform.GetArray()))
-    
-    def get_display_color(self, prim, default=(0.7, 0.7, 0.8)):
-        """프림의 표시 색상 가져오기"""
-        gprim = UsdGeom.Gprim(prim)
-        colors = gprim.GetDisplayColorAttr().Get()
-        if colors and len(colors) > 0:
-            return (colors[0][0], colors[0][1], colors[0][2])
-        return default
-    
-    def render_mesh(self, prim):
+        # 시간 변경/스테이지 변경으로 무효화된 항목만 재구성
+        self.draw_cache.set_time(self.time_code)
+        self.draw_cache.sync()
+        visible = self.cull_draw_items()
+        self.profiler.add_timings(self.draw_cache.timings)
+        
+        # 메시는 프림별 버퍼, 프리미티브는 공유 테셀레이션 버퍼로 묶어서 렌더링
+        with self.profiler.phase('gl_submit'):
+            primitives = []
+            for item in visible:
+                if item.kind == 'mesh':
+                    self.render_mesh(item)
+                else:
+                    primitives.append(item)
+            self.primitive_cache.draw_items(primitives)
+    
+    def cull_draw_items(self):
+        """카메라 프러스텀 밖 항목을 제외한 드로우 항목 목록"""
+        w, h = self.width(), self.height()
+        aspect = w / h if h > 0 else 1.0
+        view_proj = self.camera.get_view_matrix() * self.camera.get_projection_matrix(aspect)
+        visible = self.draw_cache.cull(view_proj)
+        
+        counts = (len(visible), self.draw_cache.culled_count)
+        if counts != self.last_cull_counts:
+            self.last_cull_counts = counts
+            self.cullingChanged.emit(*counts)
+        return visible
+    
+    def apply_transform(self, item):
+        """캐시된 월드 변환 행렬 적용"""
+        glMultMatrixd(item.world_matrix)
+    
+    def render_mesh(self, item):
         """메시 프림 렌더링"""
-        mesh = UsdGeom.Mesh(prim)
-        
-        points = mesh.GetPointsAttr().Get(self.time_code)
-        indices = mesh.GetFaceVertexIndicesAttr().Get()
-        counts = mesh.GetFaceVertexCountsAttr().Get()
-        
-        if not points or not indices or not counts:
-            return
-        
         glPushMatrix()
-        self.apply_transform(prim)
+        self.apply_transform(item)
         
-        color = self.get_display_color(prim)
-        glColor3f(*color)
+        glColor3f(*item.color)
         
         if self.draw_mode == 'wireframe':
             glPolygonMode(GL_FRONT_AND_BACK, GL_LINE)
@@ -319,250 +489,11 @@ class GLViewport(QOpenGLWidget):
             glPolygonMode(GL_FRONT_AND_BACK, GL_POINT)
             glPointSize(3)
         
-        glBegin(GL_TRIANGLES)
-        idx = 0
-        for count in counts:
-            if count >= 3:
-                v0 = points[indices[idx]]
-                for i in range(1, count - 1):
-                    v1 = points[indices[idx + i]]
-                    v2 = points[indices[idx + i + 1]]
-                    
-                    # 노멀 계산
-                    e1 = [v1[j] - v0[j] for j in range(3)]
-                    e2 = [v2[j] - v0[j] for j in range(3)]
-                    n = [
-                        e1[1]*e2[2] - e1[2]*e2[1],
-                        e1[2]*e2[0] - e1[0]*e2[2],
-                        e1[0]*e2[1] - e1[1]*e2[0]
-                    ]
-                    length = math.sqrt(sum(x*x for x in n))
-                    if length > 0:
-                        n = [x/length for x in n]
-                    else:
-                        n = [0, 1, 0]
-                    
-                    glNormal3f(*n)
-                    glVertex3f(v0[0], v0[1], v0[2])
-                    glVertex3f(v1[0], v1[1], v1[2])
-                    glVertex3f(v2[0], v2[1], v2[2])
-            idx += count
-        glEnd()
+        item.draw_mesh()
         
         glPolygonMode(GL_FRONT_AND_BACK, GL_FILL)
         glPopMatrix()
     
-    def render_cube(self, prim):
-        """큐브 프림 렌더링"""
-        cube = UsdGeom.Cube(prim)
-        size = cube.GetSizeAttr().Get() or 1.0
-        
-        glPushMatrix()
-        self.apply_transform(prim)
-        
-        color = self.get_display_color(prim, (0.3, 0.5, 0.8))
-        glColor3f(*color)
-        
-        half = size / 2
-        
-        vertices = [
-            (-half, -half, -half), (half, -half, -half),
-            (half, half, -half), (-half, half, -half),
-            (-half, -half, half), (half, -half, half),
-            (half, half, half), (-half, half, half)
-        ]
-        
-        faces = [
-            (0, 1, 2, 3, (0, 0, -1)),  # 뒤
-            (4, 7, 6, 5, (0, 0, 1)),   # 앞
-            (0, 3, 7, 4, (-1, 0, 0)),  # 왼쪽
-            (1, 5, 6, 2, (1, 0, 0)),   # 오른쪽
-            (0, 4, 5, 1, (0, -1, 0)),  # 아래
-            (3, 2, 6, 7, (0, 1, 0)),   # 위
-        ]
-        
-        glBegin(GL_QUADS)
-        for f in faces:
-            glNormal3f(*f[4])
-            for i in range(4):
-                glVertex3f(*vertices[f[i]])
-        glEnd()
-        
-        glPopMatrix()
-    
-    def render_sphere(self, prim):
-        """구 프림 렌더링"""
-        sphere = UsdGeom.Sphere(prim)
-        radius = sphere.GetRadiusAttr().Get() or 1.0
-        
-        glPushMatrix()
-        self.apply_transform(prim)
-        
-        color = self.get_display_color(prim, (0.8, 0.3, 0.3))
-        glColor3f(*color)
-        
-        slices, stacks = 24, 16
-        
-        for i in range(stacks):
-            lat0 = math.pi * (-0.5 + float(i) / stacks)
-            z0 = radius * math.sin(lat0)
-            zr0 = radius * math.cos(lat0)
-            
-            lat1 = math.pi * (-0.5 + float(i + 1) / stacks)
-            z1 = radius * math.sin(lat1)
-            zr1 = radius * math.cos(lat1)
-            
-            glBegin(GL_QUAD_STRIP)
-            for j in range(slices + 1):
-                lng = 2 * math.pi * float(j) / slices
-                x = math.cos(lng)
-                y = math.sin(lng)
-                
-                glNormal3f(x * zr0 / radius, y * zr0 / radius, z0 / radius)
-                glVertex3f(x * zr0, y * zr0, z0)
-                
-                glNormal3f(x * zr1 / radius, y * zr1 / radius, z1 / radius)
-                glVertex3f(x * zr1, y * zr1, z1)
-            glEnd()
-        
-        glPopMatrix()
-    
-    def render_cylinder(self, prim):
-        """실린더 프림 렌더링"""
-        cylinder = UsdGeom.Cylinder(prim)
-        radius = cylinder.GetRadiusAttr().Get() or 1.0
-        height = cylinder.GetHeightAttr().Get() or 2.0
-        
-        glPushMatrix()
-        self.apply_transform(prim)
-        
-        color = self.get_display_color(prim, (0.3, 0.7, 0.3))
-        glColor3f(*color)
-        
-        slices = 24
-        half_h = height / 2
-        
-        # 옆면
-        glBegin(GL_QUAD_STRIP)
-        for i in range(slices + 1):
-            angle = 2 * math.pi * i / slices
-            x = math.cos(angle)
-            z = math.sin(angle)
-            
-            glNormal3f(x, 0, z)
-            glVertex3f(x * radius, -half_h, z * radius)
-            glVertex3f(x * radius, half_h, z * radius)
-        glEnd()
-        
-        # 윗면
-        glBegin(GL_TRIANGLE_FAN)
-        glNormal3f(0, 1, 0)
-        glVertex3f(0, half_h, 0)
-        for i in range(slices + 1):
-            angle = 2 * math.pi * i / slices
-            glVertex3f(radius * math.cos(angle), half_h, radius * math.sin(angle))
-        glEnd()
-        
-        # 아랫면
-        glBegin(GL_TRIANGLE_FAN)
-        glNormal3f(0, -1, 0)
-        glVertex3f(0, -half_h, 0)
-        for i in range(slices, -1, -1):
-            angle = 2 * math.pi * i / slices
-            glVertex3f(radius * math.cos(angle), -half_h, radius * math.sin(angle))
-        glEnd()
-        
-        glPopMatrix()
-    
-    def render_cone(self, prim):
-        """콘 프림 렌더링"""
-        cone = UsdGeom.Cone(prim)
-        radius = cone.GetRadiusAttr().Get() or 1.0
-        height = cone.GetHeightAttr().Get() or 2.0
-        
-        glPushMatrix()
-        self.apply_transform(prim)
-        
-        color = self.get_display_color(prim, (0.9, 0.7, 0.2))
-        glColor3f(*color)
-        
-        slices = 24
-        half_h = height / 2
-        
-        # 옆면
-        glBegin(GL_TRIANGLE_FAN)
-        glVertex3f(0, half_h, 0)
-        for i in range(slices + 1):
-            angle = 2 * math.pi * i / slices
-            x = math.cos(angle)
-            z = math.sin(angle)
-            glNormal3f(x, radius / height, z)
-            glVertex3f(x * radius, -half_h, z * radius)
-        glEnd()
-        
-        # 바닥면
-        glBegin(GL_TRIANGLE_FAN)
-        glNormal3f(0, -1, 0)
-        glVertex3f(0, -half_h, 0)
-        for i in range(slices, -1, -1):
-            angle = 2 * math.pi * i / slices
-            glVertex3f(radius * math.cos(angle), -half_h, radius * math.sin(angle))
-        glEnd()
-        
-        glPopMatrix()
-    
-    def render_capsule(self, prim):
-        """캡슐 프림 렌더링 (간소화: 실린더로 대체)"""
-        capsule = UsdGeom.Capsule(prim)
-        radius = capsule.GetRadiusAttr().Get() or 0.5
-        height = capsule.GetHeightAttr().Get() or 2.0
-        
-        glPushMatrix()
-        self.apply_transform(prim)
-        
-        color = self.get_display_color(prim, (0.8, 0.5, 0.2))
-        glColor3f(*color)
-        
-        slices = 24
-        half_h = height / 2
-        
-        # 실린더 부분
-        glBegin(GL_QUAD_STRIP)
-        for i in range(slices + 1):
-            angle = 2 * math.pi * i / slices
-            x = math.cos(angle)
-            z = math.sin(angle)
-            glNormal3f(x, 0, z)
-            glVertex3f(x * radius, -half_h, z * radius)
-            glVertex3f(x * radius, half_h, z * radius)
-        glEnd()
-        
-        # 반구 (위/아래) - 간소화
-        for sign in [1, -1]:
-            for lat_i in range(8):
-                lat0 = (math.pi / 2) * lat_i / 8
-                lat1 = (math.pi / 2) * (lat_i + 1) / 8
-                
-                y0 = sign * (half_h + radius * math.sin(lat0))
-                r0 = radius * math.cos(lat0)
-                y1 = sign * (half_h + radius * math.sin(lat1))
-                r1 = radius * math.cos(lat1)
-                
-                glBegin(GL_QUAD_STRIP)
-                for j in range(slices + 1):
-                    angle = 2 * math.pi * j / slices
-                    x = math.cos(angle)
-                    z = math.sin(angle)
-                    
-                    glNormal3f(x * r0 / radius, sign * math.sin(lat0), z * r0 / radius)
-                    glVertex3f(x * r0, y0, z * r0)
-                    
-                    glNormal3f(x * r1 / radius, sign * math.sin(lat1), z * r1 / radius)
-                    glVertex3f(x * r1, y1, z * r1)
-                glEnd()
-        
-        glPopMatrix()
-    
     def draw_grid(self, size=10, divisions=20):
         """그리드 렌더링"""
         glDisable(GL_LIGHTING)
@@ -606,52 +537,119 @@ class GLViewport(QOpenGLWidget):
         if self.enable_lighting:
             glEnable(GL_LIGHTING)
     
-    def load_stage(self, filepath):
-        """USD 스테이지 로드"""
-        try:
-            from pxr import Usd, UsdGeom
-        except ImportError:
+    def load_stage(self, filepath, options=None):
+        """USD 스테이지 로드 (동기, GUI 스레드에서 실행, options: StageOpenOptions)"""
+        if not USD_AVAILABLE:
             print("USD 라이브러리가 필요합니다.")
             return False
         
+        self.load_started = time.perf_counter()
         try:
-            self.stage = Usd.Stage.Open(filepath)
-            if not self.stage:
-                print(f"스테이지를 열 수 없습니다: {filepath}")
-                return False
-            
-            print(f"USD 로드 성공: {filepath}")
-            
-            # 바운딩 박스 계산
-            bbox_cache = UsdGeom.BBoxCache(
-                Usd.TimeCode.Default(),
-                [UsdGeom.Tokens.default_]
-            )
-            
-            root = self.stage.GetPseudoRoot()
-            bbox = bbox_cache.ComputeWorldBound(root)
-            bbox_range = bbox.ComputeAlignedRange()
-            
-            if not bbox_range.IsEmpty():
-                min_pt = bbox_range.GetMin()
-                max_pt = bbox_range.GetMax()
-                self.camera.frame_bounds(
-                    [min_pt[0], min_pt[1], min_pt[2]],
-                    [max_pt[0], max_pt[1], max_pt[2]]
-                )
-            
-            if self.renderer:
-                self.renderer.SetRenderViewport((0, 0, self.width(), self.height()))
-            
-            self.sceneLoaded.emit(filepath)
-            self.update()
-            return True
-            
+            result = load_stage_data(filepath, options=options)
         except Exception as e:
             print(f"USD 로드 오류: {e}")
             import traceback
             traceback.print_exc()
             return False
+        
+        self.apply_load_result(result)
+        return True
+    
+    def load_stage_async(self, filepath, options=None):
+        """USD 스테이지를 워커 스레드에서 로드 (완료 시 stageLoaded 발생, options: StageOpenOptions)"""
+        if not USD_AVAILABLE:
+            print("USD 라이브러리가 필요합니다.")
+            return False
+        
+        self.cancel_loading()
+        
+        self.load_started = time.perf_counter()
+        worker = StageLoadWorker(filepath, options, self)
+        worker.progress.connect(self.loadProgress)
+        worker.loaded.connect(self.on_worker_loaded)
+        worker.failed.connect(self.on_worker_failed)
+        worker.cancelled.connect(self.on_worker_cancelled)
+        worker.finished.connect(worker.deleteLater)
+        self.load_worker = worker
+        worker.start()
+        return True
+    
+    def cancel_loading(self):
+        """진행 중인 백그라운드 로드 취소"""
+        if self.load_worker:
+            self.load_worker.cancel()
+            self.load_worker = None
+    
+    def wait_for_loading(self):
+        """종료 전 워커 스레드 정리"""
+        worker = self.load_worker
+        self.cancel_loading()
+        if worker:
+            worker.wait()
+    
+    def on_worker_loaded(self, result):
+        # 취소 후 새 로드가 시작된 경우 이전 워커 결과는 무시
+        if self.sender() is not self.load_worker:
+            return
+        self.load_worker = None
+        self.apply_load_result(result)
+    
+    def on_worker_failed(self, message):
+        if self.sender() is not self.load_worker:
+            return
+        self.load_worker = None
+        print(f"USD 로드 오류: {message}")
+        self.loadFailed.emit(message)
+    
+    def on_worker_cancelled(self):
+        print("USD 로드 취소됨")
+    
+    def apply_load_result(self, result):
+        """워커에서 준비된 결과를 뷰포트에 적용 (GUI 스레드)"""
+        self.set_stage(result.stage)
+        print(f"USD 로드 성공: {result.filepath} ({result.format_timings()})")
+        
+        if result.bbox_min is not None:
+            self.camera.frame_bounds(result.bbox_min, result.bbox_max)
+        
+        if self.renderer:
+            self.renderer.SetRenderViewport((0, 0, self.width(), self.height()))
+        
+        self.first_frame_pending = self.load_started is not None
+        self.stageLoaded.emit(result)
+        self.sceneLoaded.emit(result.filepath)
+        self.update()
+    
+    def report_first_frame(self):
+        """로드 후 첫 프레임 렌더링 시간 보고"""
+        if not self.first_frame_pending:
+            return
+        self.first_frame_pending = False
+        elapsed = time.perf_counter() - self.load_started
+        self.load_started = None
+        print(f"첫 프레임까지: {elapsed:.3f}s")
+        self.firstFrameRendered.emit(elapsed)
+    
+    def set_stage(self, stage):
+        """표시할 스테이지 교체 (드로우 캐시와 Hydra 엔진도 함께 교체)"""
+        if self.renderer is not None and stage is not None and stage is not self.stage:
+            self.reset_hydra_renderer()
+        self.stage = stage
+        
+        if self.draw_cache is None:
+            self.xform_cache = TransformCache()
+            self.change_tracker = ChangeTracker()
+            self.change_tracker.add_listener(self.stageChanged.emit)
+            self.draw_cache = DrawCache(
+                xform_cache=self.xform_cache, tracker=self.change_tracker,
+                geometry_cache_bytes=self.geometry_cache_bytes or DEFAULT_GEOMETRY_CACHE_BYTES,
+            )
+            self.draw_cache.on_changed = self.update
+            self.primitive_cache = PrimitiveCache()
+        self.change_tracker.set_stage(stage)
+        self.draw_cache.set_stage(stage)
+        
+        self.reset_time_range()
     
     def create_sample_stage(self):
         """샘플 스테이지 생성"""
@@ -660,7 +658,7 @@ class GLViewport(QOpenGLWidget):
         except ImportError:
             return
         
-        self.stage = Usd.Stage.CreateInMemory()
+        self.set_stage(Usd.Stage.CreateInMemory())
         
         # 큐브
         cube = UsdGeom.Cube.Define(self.stage, '/World/Cube')
@@ -696,6 +694,71 @@ class GLViewport(QOpenGLWidget):
         self.sceneLoaded.emit("Sample Scene")
         self.update()
     
+    # === 재생 ===
+    
+    def set_geometry_cache_bytes(self, max_bytes):
+        """변형 메시 시간 샘플 캐시 상한 변경 (이미 만든 드로우 캐시에도 적용)"""
+        self.geometry_cache_bytes = max_bytes
+        if self.draw_cache is not None:
+            self.draw_cache.geometry_cache.set_max_bytes(max_bytes)
+    
+    def editing_stage(self):
+        """GUI 스레드의 스테이지 편집 구간 (프리페치 스레드의 읽기와 겹치지 않게 함)"""
+        if self.draw_cache is None:
+            return nullcontext()
+        return self.draw_cache.editing()
+    
+    def reset_time_range(self):
+        """스테이지 시간 범위를 다시 읽고 처음으로 이동 (궤적 재생 로드 등)"""
+        self.animation_timer.stop()
+        if self.draw_cache is not None:
+            self.draw_cache.stop_prefetch()
+        self.playback.set_stage(self.stage)
+        self.set_time(self.playback.time)
+        self.playbackChanged.emit(False)
+    
+    def set_time(self, time_code):
+        """현재 시간 설정 (타임라인/재생)"""
+        self.time_code = float(time_code)
+        self.timeChanged.emit(self.time_code)
+        self.update()
+    
+    def toggle_playback(self):
+        playing = self.playback.toggle()
+        if playing:
+            self.prefetch_frames()
+            self.animation_timer.start(self.playback.interval_ms())
+        else:
+            self.animation_timer.stop()
+        self.playbackChanged.emit(playing)
+    
+    def stop_playback(self):
+        self.playback.pause()
+        self.animation_timer.stop()
+        if self.draw_cache is not None:
+            self.draw_cache.stop_prefetch()
+    
+    def seek(self, time_code):
+        self.set_time(self.playback.seek(time_code))
+    
+    def step_time(self, frames):
+        self.set_time(self.playback.step(frames))
+    
+    def advance_time(self):
+        """재생 타이머 틱 - 벽시계에 맞는 프레임으로 이동 (렌더링이 늦으면 프레임 건너뜀)"""
+        time_code = self.playback.tick()
+        if not self.playback.playing:
+            self.animation_timer.stop()
+            self.playbackChanged.emit(False)
+        if time_code is not None:
+            self.set_time(time_code)
+            self.prefetch_frames()
+    
+    def prefetch_frames(self):
+        """Fallback 렌더러가 다음 프레임의 변환/포인트를 미리 읽도록 요청 (Hydra는 자체 처리)"""
+        if self.draw_cache is not None and not (self.renderer and USD_HYDRA_AVAILABLE):
+            self.draw_cache.prefetch(self.playback.upcoming(PREFETCH_FRAMES))
+    
     # 마우스 이벤트
     def mousePressEvent(self, event):
         self.camera.last_pos = event.position()
@@ -736,19 +799,9 @@ class GLViewport(QOpenGLWidget):
         if key == Qt.Key.Key_F:
             if self.stage:
                 try:
-                    bbox_cache = UsdGeom.BBoxCache(
-                        Usd.TimeCode.Default(),
-                        [UsdGeom.Tokens.default_]
-                    )
-                    bbox = bbox_cache.ComputeWorldBound(self.stage.GetPseudoRoot())
-                    bbox_range = bbox.ComputeAlignedRange()
-                    if not bbox_range.IsEmpty():
-                        min_pt = bbox_range.GetMin()
-                        max_pt = bbox_range.GetMax()
-                        self.camera.frame_bounds(
-                            [min_pt[0], min_pt[1], min_pt[2]],
-                            [max_pt[0], max_pt[1], max_pt[2]]
-                        )
+                    bounds = compute_stage_bounds(self.stage)
+                    if bounds:
+                        self.camera.frame_bounds(*bounds)
                 except:
                     pass
             self.update()
@@ -772,54 +825,334 @@ class GLViewport(QOpenGLWidget):
             self.enable_lighting = not self.enable_lighting
             print(f"Lighting: {'ON' if self.enable_lighting else 'OFF'}")
             self.update()
+        
+        elif key == Qt.Key.Key_S:
+            self.print_cache_stats()
+        
+        elif key == Qt.Key.Key_P:
+            self.show_profiler = not self.show_profiler
+            self.update()
+        
+        elif key == Qt.Key.Key_Space:
+            self.toggle_playback()
+        
+        elif key == Qt.Key.Key_Left:
+            self.step_time(-1)
+        
+        elif key == Qt.Key.Key_Right:
+            self.step_time(1)
+        
+        elif key == Qt.Key.Key_Home:
+            self.seek(self.playback.start)
+        
+        elif key == Qt.Key.Key_T:
+            self.toggle_turntable()
+    
+    def framebuffer_size(self):
+        """디바이스 픽셀 단위 프레임버퍼 크기 (HiDPI 배율 반영)"""
+        ratio = self.devicePixelRatioF()
+        return int(self.width() * ratio), int(self.height() * ratio)
+    
+    def toggle_turntable(self):
+        if self.turntable_timer.isActive():
+            self.turntable_timer.stop()
+        else:
+            self.turntable_timer.start()
+    
+    def advance_turntable(self):
+        self.camera.azimuth += 360.0 / (self.turntable_period * DISPLAY_RATE)
+        self.update()
+    
+    def start_recording(self, target, fps=DISPLAY_RATE):
+        """그려지는 프레임을 target(PNG 디렉터리 또는 영상 파일)에 기록 (열 수 없으면 OSError)"""
+        self.stop_recording()
+        capture = FrameCapture(open_writer(target, fps))
+        capture.start()
+        self.frame_capture = capture
+        self.update()
+    
+    def stop_recording(self):
+        """남은 프레임을 내보내고 녹화 종료 (마지막 통계 반환, 녹화 중이 아니면 None)"""
+        capture = self.frame_capture
+        if capture is None:
+            return None
+        self.frame_capture = None
+        # PBO 수거/해제에 GL 컨텍스트 필요
+        self.makeCurrent()
+        capture.stop()
+        self.doneCurrent()
+        return capture.stats()
+    
+    def print_cache_stats(self):
+        """드로우/변환 캐시 통계 출력"""
+        if self.draw_cache is None:
+            return
+        print(f"드로우 캐시: 항목 {len(self.draw_cache)}, "
+              f"마지막 재구성 {self.draw_cache.rebuilt_count}, "
+              f"컬링 {self.draw_cache.culled_count}")
+        print(f"프리미티브 메시: {len(self.primitive_cache)}")
+        print(self.xform_cache.format_stats())
+        print(self.draw_cache.geometry_cache.stats())
+
+
+class PrimTreeModel(QAbstractItemModel):
+    """PrimTree 기반 지연 로딩 계층 구조 모델 (경로만 보관)"""
+    
+    HEADERS = ("Prim", "Type", "Memory")
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.prim_tree = None
+        self.payloads = None        # PayloadManager (Memory 열 표시용)
+    
+    def set_stage(self, stage, payloads=None):
+        self.beginResetModel()
+        self.prim_tree = PrimTree(stage) if stage else None
+        self.payloads = payloads
+        self.endResetModel()
+    
+    def index_for_node(self, node, column=0):
+        if node is None or node is self.prim_tree.root:
+            return QModelIndex()
+        return self.createIndex(node.row, column, node)
+    
+    def refresh_node(self, node):
+        """페이로드 로드/언로드 후 노드의 자식을 다시 조회하도록 초기화"""
+        index = self.index_for_node(node)
+        if node.children:
+            self.beginRemoveRows(index, 0, len(node.children) - 1)
+            self.prim_tree.reset_children(node)
+            self.endRemoveRows()
+        else:
+            self.prim_tree.reset_children(node)
+        self.update_row(node)
+    
+    def update_row(self, node):
+        """노드 행 표시 갱신 (Memory 열)"""
+        if node is not None and node is not self.prim_tree.root:
+            self.dataChanged.emit(self.index_for_node(node),
+                                  self.index_for_node(node, len(self.HEADERS) - 1))
+    
+    def memory_text(self, node):
+        if self.payloads is None:
+            return ""
+        estimate = self.payloads.estimates.get(node.path)
+        if estimate is not None:
+            return format_bytes(estimate[0])
+        if node.has_payload and not self.payloads.is_loaded(node.path):
+            return "unloaded"
+        return ""
+    
+    def node_from_index(self, index):
+        if index.isValid():
+            return index.internalPointer()
+        return self.prim_tree.root if self.prim_tree else None
+    
+    def index(self, row, column, parent=QModelIndex()):
+        node = self.node_from_index(parent)
+        if node is None or not (0 <= row < len(node.children)):
+            return QModelIndex()
+        return self.createIndex(row, column, node.children[row])
+    
+    def parent(self, index=QModelIndex()):
+        if not index.isValid():
+            return QModelIndex()
+        parent_node = index.internalPointer().parent
+        if parent_node is None or parent_node is self.prim_tree.root:
+            return QModelIndex()
+        return self.createIndex(parent_node.row, 0, parent_node)
+    
+    def rowCount(self, parent=QModelIndex()):
+        if parent.column() > 0:
+            return 0
+        node = self.node_from_index(parent)
+        return len(node.children) if node else 0
+    
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.HEADERS)
+    
+    def hasChildren(self, parent=QModelIndex()):
+        node = self.node_from_index(parent)
+        return bool(node and node.has_children)
+    
+    def canFetchMore(self, parent):
+        node = self.node_from_index(parent)
+        return bool(node and self.prim_tree.can_fetch_more(node))
+    
+    def fetchMore(self, parent):
+        node = self.node_from_index(parent)
+        count = self.prim_tree.next_batch_size(node) if node else 0
+        if count == 0:
+            return
+        first = len(node.children)
+        self.beginInsertRows(parent, first, first + count - 1)
+        self.prim_tree.fetch_more(node)
+        self.endInsertRows()
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        node = index.internalPointer()
+        if role == Qt.ItemDataRole.DisplayRole:
+            if index.column() == 0:
+                return node.name
+            if index.column() == 1:
+                return node.type_name
+            return self.memory_text(node)
+        if role == Qt.ItemDataRole.ToolTipRole and index.column() == 2 and self.payloads:
+            estimate = self.payloads.estimates.get(node.path)
+            if estimate is not None:
+                return f"{estimate[1]} prims, {format_bytes(estimate[0])} (추정)"
+        if role == Qt.ItemDataRole.UserRole:
+            return str(node.path)
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
 
 
 class SceneHierarchyWidget(QDockWidget):
     """씬 계층 구조 패널"""
     
     primSelected = pyqtSignal(str)
+    payloadsChanged = pyqtSignal(str)       # 페이로드 작업 결과 메시지
+    
+    # 스테이지 로드 시 자동으로 펼칠 깊이 (나머지는 펼칠 때 fetchMore)
+    EXPAND_DEPTH = 1
     
     def __init__(self, parent=None):
         super().__init__("Scene Hierarchy", parent)
         
-        self.tree = QTreeWidget()
-        self.tree.setHeaderLabels(["Prim", "Type"])
-        self.tree.itemClicked.connect(self.on_item_clicked)
+        self.model = PrimTreeModel(self)
+        self.tree = QTreeView()
+        self.tree.setModel(self.model)
+        self.tree.setUniformRowHeights(True)
+        self.tree.clicked.connect(self.on_index_clicked)
+        self.tree.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self.tree.customContextMenuRequested.connect(self.show_context_menu)
+        
+        # 페이로드 작업 큐: 워커는 한 번에 하나, 스테이지 변경(Load/Unload)은
+        # 워커가 없을 때 GUI 스레드에서만 수행
+        self.payloads = None
+        self.jobs = deque()
+        self.worker = None
+        self.editing_stage = nullcontext    # 스테이지 편집 구간 (메인 윈도우가 뷰포트 것으로 교체)
         
         self.setWidget(self.tree)
     
     def update_hierarchy(self, stage):
-        self.tree.clear()
-        
-        if not stage:
+        """계층 구조 업데이트 (상위 레벨만 읽음)"""
+        self.jobs.clear()
+        self.payloads = PayloadManager(stage, self.editing_stage) if stage else None
+        self.model.set_stage(stage, self.payloads)
+        self.expand_levels(QModelIndex(), self.EXPAND_DEPTH)
+    
+    def expand_levels(self, parent, depth):
+        if self.model.canFetchMore(parent):
+            self.model.fetchMore(parent)
+        if depth <= 0:
             return
-        
-        def add_children(parent_item, prim):
-            for child in prim.GetChildren():
-                item = QTreeWidgetItem([
-                    child.GetName(),
-                    child.GetTypeName()
-                ])
-                parent_item.addChild(item)
-                item.setData(0, Qt.ItemDataRole.UserRole, str(child.GetPath()))
-                add_children(item, child)
-        
-        root = stage.GetPseudoRoot()
-        for child in root.GetChildren():
-            item = QTreeWidgetItem([
-                child.GetName(),
-                child.GetTypeName()
-            ])
-            self.tree.addTopLevelItem(item)
-            item.setData(0, Qt.ItemDataRole.UserRole, str(child.GetPath()))
-            add_children(item, child)
-        
-        self.tree.expandAll()
-    
-    def on_item_clicked(self, item, column):
-        path = item.data(0, Qt.ItemDataRole.UserRole)
+        for row in range(self.model.rowCount(parent)):
+            index = self.model.index(row, 0, parent)
+            self.tree.expand(index)
+            self.expand_levels(index, depth - 1)
+    
+    def on_index_clicked(self, index):
+        path = self.model.data(index, Qt.ItemDataRole.UserRole)
         if path:
             self.primSelected.emit(path)
+    
+    def show_context_menu(self, pos):
+        """프림 우클릭 메뉴 (페이로드 로드/언로드/메모리 추정)"""
+        index = self.tree.indexAt(pos)
+        path = self.model.data(index, Qt.ItemDataRole.UserRole) if index.isValid() else None
+        if not path or self.payloads is None:
+            return
+        
+        menu = QMenu(self)
+        menu.addAction("Load Payloads", lambda: self.queue_job('load', path))
+        menu.addAction("Unload Payloads", lambda: self.queue_job('unload', path))
+        menu.addSeparator()
+        menu.addAction("Estimate Memory", lambda: self.queue_job('estimate', path))
+        menu.exec(self.tree.viewport().mapToGlobal(pos))
+    
+    def queue_job(self, kind, path):
+        self.jobs.append((kind, path))
+        self.start_next_job()
+    
+    def start_next_job(self):
+        while self.jobs and self.worker is None:
+            kind, path = self.jobs.popleft()
+            if kind == 'unload':
+                with self.editing_stage():
+                    self.payloads.unload(path)
+                self.payloadsChanged.emit(f"언로드됨: {path}")
+                continue
+            
+            self.worker = PayloadWorker(self.payloads, kind, path, self)
+            self.worker.done.connect(self.on_job_done)
+            self.worker.failed.connect(self.on_job_failed)
+            self.worker.start()
+            self.payloadsChanged.emit(f"{'로드' if kind == 'load' else '메모리 추정'} 중: {path}")
+    
+    def finish_worker(self):
+        worker, self.worker = self.worker, None
+        worker.wait()
+        worker.deleteLater()
+        return worker
+    
+    def on_job_done(self, result):
+        worker = self.finish_worker()
+        # 작업 중 다른 스테이지가 열렸으면 결과 무시
+        if worker.manager is self.payloads:
+            if worker.kind == 'load':
+                with self.editing_stage():
+                    self.payloads.load(worker.path)
+                self.jobs.appendleft(('estimate', worker.path))
+                self.payloadsChanged.emit(f"로드됨: {worker.path} (레이어 {result}개)")
+            else:
+                self.model.update_row(self.model.prim_tree.find_node(worker.path))
+                self.payloadsChanged.emit(
+                    f"{worker.path}: {result[1]} prims, {format_bytes(result[0])} (추정)")
+        self.start_next_job()
+    
+    def on_job_failed(self, message):
+        self.finish_worker()
+        self.payloadsChanged.emit(f"페이로드 작업 실패: {message}")
+        self.start_next_job()
+    
+    def apply_changes(self, changes):
+        """스테이지 변경 알림으로 영향받은 행만 갱신 (전체 재구성 없음)"""
+        tree = self.model.prim_tree
+        if tree is None:
+            return
+        for path in changes.resync_roots():
+            node = tree.find_node(path)
+            if node is not None and tree.stage.GetPrimAtPath(path):
+                tree.update_node(node)
+                self.refresh_path(path)
+            else:
+                # 프림 추가/삭제 - 부모의 자식 목록만 다시 조회
+                self.refresh_path(path.GetParentPath())
+        for path in changes.info:
+            node = tree.find_node(path)
+            if node is not None:
+                self.model.update_row(node)
+    
+    def refresh_path(self, path):
+        """이미 가져온 노드면 자식을 다시 조회 (펼쳐져 있으면 바로 채움)"""
+        node = self.model.prim_tree.find_node(path)
+        if node is None:
+            return
+        self.model.refresh_node(node)
+        self.expand_levels(self.model.index_for_node(node), 0)
+    
+    def wait_for_jobs(self):
+        self.jobs.clear()
+        if self.worker is not None:
+            self.worker.wait()
 
 
 class PropertiesWidget(QDockWidget):
@@ -831,6 +1164,7 @@ class PropertiesWidget(QDockWidget):
         widget = QWidget()
         layout = QVBoxLayout(widget)
         
+        self.prim_path = None   # 표시 중인 프림 (편집 알림 시 갱신)
         self.info_label = QLabel("선택된 프림 없음")
         self.info_label.setWordWrap(True)
         layout.addWidget(self.info_label)
@@ -846,6 +1180,7 @@ class PropertiesWidget(QDockWidget):
         if not prim:
             return
         
+        self.prim_path = prim_path
         info = f"Path: {prim_path}\n"
         info += f"Type: {prim.GetTypeName()}\n"
         info += f"Valid: {prim.IsValid()}\n"
@@ -872,9 +1207,33 @@ class USDViewer(QMainWindow):
         self.setWindowTitle("USD Viewer (PyQt6)")
         self.setMinimumSize(1280, 720)
         
+        # 현재 파일과 부분 로딩 옵션 (File 메뉴 / 커맨드라인)
+        self.current_file = None
+        self.open_options = StageOpenOptions() if USD_AVAILABLE else None
+        
+        # 관절 궤적 재생 (커맨드라인 궤적은 스테이지 로드 후 적용)
+        self.joint_rig = None
+        self.pending_trajectory = None
+        
+        # 관절 상태 스트리밍 (화면 갱신 주기로 수신 상태를 모아 반영)
+        self.joint_stream = None
+        self.pending_stream = None
+        self.stream_timer = QTimer(self)
+        self.stream_timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.stream_timer.setInterval(int(1000 / DISPLAY_RATE))
+        self.stream_timer.timeout.connect(self.poll_joint_stream)
+        self.stream_stats_at = 0.0
+        
+        # 프레임 녹화 (커맨드라인 녹화는 스테이지 로드 후 시작)
+        self.record_target = "capture"
+        self.record_fps = DISPLAY_RATE
+        self.pending_recording = None
+        self.record_stats_at = 0.0
+        
         self.setup_ui()
         self.setup_menu()
         self.setup_toolbar()
+        self.setup_playback_bar()
         
         self.viewport.create_sample_stage()
         self.hierarchy.update_hierarchy(self.viewport.stage)
@@ -884,13 +1243,43 @@ class USDViewer(QMainWindow):
         self.setCentralWidget(self.viewport)
         
         self.hierarchy = SceneHierarchyWidget(self)
+        self.hierarchy.editing_stage = self.viewport.editing_stage
         self.addDockWidget(Qt.DockWidgetArea.LeftDockWidgetArea, self.hierarchy)
         
         self.properties = PropertiesWidget(self)
         self.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, self.properties)
         
         self.hierarchy.primSelected.connect(self.on_prim_selected)
+        self.hierarchy.payloadsChanged.connect(self.on_payloads_changed)
+        self.viewport.stageChanged.connect(self.on_stage_changed)
         self.viewport.sceneLoaded.connect(self.on_scene_loaded)
+        self.viewport.stageLoaded.connect(self.on_stage_loaded)
+        self.viewport.loadProgress.connect(self.on_load_progress)
+        self.viewport.loadFailed.connect(self.on_load_failed)
+        self.viewport.firstFrameRendered.connect(self.on_first_frame)
+        self.viewport.cullingChanged.connect(self.on_culling_changed)
+        
+        # 로드 진행 표시 (상태바)
+        self.load_progress = QProgressBar()
+        self.load_progress.setRange(0, 100)
+        self.load_progress.setMaximumWidth(200)
+        self.load_progress.hide()
+        self.statusBar().addPermanentWidget(self.load_progress)
+        
+        self.cancel_load_button = QPushButton("Cancel")
+        self.cancel_load_button.clicked.connect(self.cancel_loading)
+        self.cancel_load_button.hide()
+        self.statusBar().addPermanentWidget(self.cancel_load_button)
+        
+        # 프러스텀 컬링 카운터
+        self.cull_label = QLabel()
+        self.statusBar().addPermanentWidget(self.cull_label)
+        
+        self.stream_label = QLabel()
+        self.statusBar().addPermanentWidget(self.stream_label)
+        self.record_label = QLabel()
+        self.statusBar().addPermanentWidget(self.record_label)
+        self.viewport.frameSwapped.connect(self.on_frame_swapped)
         
         self.statusBar().showMessage("준비")
     
@@ -904,6 +1293,58 @@ class USDViewer(QMainWindow):
         open_action.triggered.connect(self.open_file)
         file_menu.addAction(open_action)
         
+        reload_action = QAction("Reload", self)
+        reload_action.setShortcut(QKeySequence.StandardKey.Refresh)
+        reload_action.triggered.connect(self.reload_file)
+        file_menu.addAction(reload_action)
+        
+        file_menu.addSeparator()
+        
+        # 부분 로딩 옵션 (다음 열기/Reload부터 적용)
+        self.payloads_action = QAction("Load Payloads", self)
+        self.payloads_action.setCheckable(True)
+        self.payloads_action.setChecked(True)
+        self.payloads_action.toggled.connect(self.on_payloads_toggled)
+        file_menu.addAction(self.payloads_action)
+        
+        mask_action = QAction("Population Mask...", self)
+        mask_action.triggered.connect(self.edit_population_mask)
+        file_menu.addAction(mask_action)
+        
+        exclude_action = QAction("Exclude Prims...", self)
+        exclude_action.triggered.connect(self.edit_exclude_patterns)
+        file_menu.addAction(exclude_action)
+        
+        file_menu.addSeparator()
+        
+        # 관절 궤적 재생 (세션 레이어에 기록, 원본 파일은 변경하지 않음)
+        trajectory_action = QAction("Load Joint Trajectory...", self)
+        trajectory_action.triggered.connect(self.open_trajectory)
+        file_menu.addAction(trajectory_action)
+        
+        clear_trajectory_action = QAction("Clear Joint Trajectory", self)
+        clear_trajectory_action.triggered.connect(self.clear_trajectory)
+        file_menu.addAction(clear_trajectory_action)
+        
+        stream_action = QAction("Connect Joint Stream...", self)
+        stream_action.triggered.connect(self.ask_joint_stream)
+        file_menu.addAction(stream_action)
+        
+        disconnect_stream_action = QAction("Disconnect Joint Stream", self)
+        disconnect_stream_action.triggered.connect(self.disconnect_joint_stream)
+        file_menu.addAction(disconnect_stream_action)
+        
+        file_menu.addSeparator()
+        
+        # 화면 프레임 녹화 (PNG 시퀀스 또는 ffmpeg 영상)
+        record_action = QAction("Record Frames...", self)
+        record_action.triggered.connect(self.ask_recording)
+        file_menu.addAction(record_action)
+        
+        stop_record_action = QAction("Stop Recording", self)
+        stop_record_action.triggered.connect(self.stop_recording)
+        file_menu.addAction(stop_record_action)
+        
         file_menu.addSeparator()
         
         exit_action = QAction("Exit", self)
@@ -918,6 +1359,10 @@ class USDViewer(QMainWindow):
             type('', (), {'key': lambda: Qt.Key.Key_F})()
         ))
         view_menu.addAction(frame_action)
+        
+        turntable_action = QAction("Toggle Turntable (T)", self)
+        turntable_action.triggered.connect(self.viewport.toggle_turntable)
+        view_menu.addAction(turntable_action)
     
     def setup_toolbar(self):
         toolbar = QToolBar("Main Toolbar")
@@ -955,6 +1400,33 @@ class USDViewer(QMainWindow):
         )
         toolbar.addWidget(self.axes_check)
     
+    def setup_playback_bar(self):
+        """재생 툴바 (재생/일시정지, 타임라인, 반복)"""
+        toolbar = QToolBar("Playback")
+        toolbar.setMovable(False)
+        self.addToolBar(Qt.ToolBarArea.BottomToolBarArea, toolbar)
+        
+        self.play_button = QPushButton("Play")
+        self.play_button.clicked.connect(self.viewport.toggle_playback)
+        toolbar.addWidget(self.play_button)
+        
+        self.time_slider = QSlider(Qt.Orientation.Horizontal)
+        self.time_slider.valueChanged.connect(self.on_time_slider_changed)
+        toolbar.addWidget(self.time_slider)
+        
+        self.time_label = QLabel()
+        self.time_label.setMinimumWidth(90)
+        toolbar.addWidget(self.time_label)
+        
+        self.loop_check = QCheckBox("Loop")
+        self.loop_check.setChecked(True)
+        self.loop_check.toggled.connect(self.on_loop_toggled)
+        toolbar.addWidget(self.loop_check)
+        
+        self.viewport.timeChanged.connect(self.on_time_changed)
+        self.viewport.playbackChanged.connect(self.on_playback_changed)
+        self.on_time_changed(self.viewport.time_code)
+    
     def open_file(self):
         filepath, _ = QFileDialog.getOpenFileName(
             self, "Open USD File", "",
@@ -962,8 +1434,290 @@ class USDViewer(QMainWindow):
         )
         
         if filepath:
-            if self.viewport.load_stage(filepath):
-                self.hierarchy.update_hierarchy(self.viewport.stage)
+            self.load_file(filepath)
+    
+    def load_file(self, filepath):
+        """백그라운드 로드 시작 (완료 시 on_stage_loaded)"""
+        self.current_file = filepath
+        if self.viewport.load_stage_async(filepath, self.open_options):
+            self.statusBar().showMessage(f"로드 중: {filepath}")
+            self.load_progress.setValue(0)
+            self.load_progress.show()
+            self.cancel_load_button.show()
+    
+    def reload_file(self):
+        """현재 파일을 현재 부분 로딩 옵션으로 다시 열기"""
+        if self.current_file:
+            self.load_file(self.current_file)
+    
+    def open_trajectory(self):
+        """관절 궤적 파일 선택 다이얼로그"""
+        filepath, _ = QFileDialog.getOpenFileName(
+            self, "Open Joint Trajectory", "",
+            "Joint Trajectories (*.csv *.npy *.npz);;All Files (*)"
+        )
+        if filepath:
+            self.load_trajectory_file(filepath)
+    
+    def current_joint_rig(self):
+        """현재 스테이지의 JointRig (물리 관절이 없으면 None)"""
+        stage = self.viewport.stage
+        if stage is None:
+            return None
+        if self.joint_rig is None or self.joint_rig.stage is not stage:
+            self.joint_rig = JointRig(stage)
+        if not len(self.joint_rig):
+            self.statusBar().showMessage("스테이지에 물리 관절이 없습니다")
+            return None
+        return self.joint_rig
+    
+    def load_trajectory_file(self, filepath, rate=None):
+        """궤적을 현재 스테이지의 관절에 매핑해 세션 레이어에 기록하고 재생 범위 갱신"""
+        self.disconnect_joint_stream()
+        rig = self.current_joint_rig()
+        if rig is None:
+            return
+        
+        try:
+            trajectory = load_trajectory(filepath, rate)
+            with self.viewport.editing_stage():
+                result = rig.bake(trajectory)
+        except (OSError, ValueError, KeyError) as e:
+            self.statusBar().showMessage(f"궤적 재생 실패: {e}")
+            return
+        
+        self.viewport.reset_time_range()
+        message = (f"궤적: {result['frames']}프레임 @ {trajectory.rate:g} Hz "
+                   f"({trajectory.duration:.1f}s), 링크 {result['links']}개, "
+                   f"기록 {result['seconds']:.2f}s")
+        if result['missing']:
+            message += f" | 로그에 없는 관절 {len(result['missing'])}개"
+        if result['unused']:
+            message += f" | 매칭 안 된 열: {', '.join(result['unused'][:5])}"
+        self.statusBar().showMessage(message)
+    
+    def clear_trajectory(self):
+        """세션 레이어의 궤적을 지우고 기본 자세로 복귀"""
+        if self.joint_rig is None or self.joint_rig.stage is not self.viewport.stage:
+            return
+        self.viewport.stop_playback()
+        with self.viewport.editing_stage():
+            self.joint_rig.clear()
+        self.viewport.reset_time_range()
+        self.statusBar().showMessage("궤적 제거됨")
+    
+    def ask_joint_stream(self):
+        address = self.joint_stream.address if self.joint_stream else DEFAULT_STREAM_ADDRESS
+        text, ok = QInputDialog.getText(
+            self, "Joint Stream", "수신 주소 (udp://host:port 또는 unix:///path):", QLineEdit.EchoMode.Normal, address
+        )
+        if ok and text.strip():
+            self.connect_joint_stream(text.strip())
+    
+    def connect_joint_stream(self, address):
+        """소켓에서 관절 상태를 받아 화면 갱신마다 세션 레이어에 반영"""
+        self.disconnect_joint_stream()
+        rig = self.current_joint_rig()
+        if rig is None:
+            return
+        
+        self.viewport.stop_playback()
+        stream = JointStream(rig, address)
+        try:
+            with self.viewport.editing_stage():
+                stream.start()
+        except (OSError, ValueError) as e:
+            self.statusBar().showMessage(f"스트림 연결 실패: {e}")
+            return
+        self.joint_stream = stream
+        # 궤적을 지웠으므로 재생 범위도 원래대로
+        self.viewport.reset_time_range()
+        self.stream_timer.start()
+        self.statusBar().showMessage(f"관절 스트림 수신 중: {address} (관절 {len(rig)}개)")
+    
+    def disconnect_joint_stream(self):
+        if self.joint_stream is None:
+            return
+        self.stream_timer.stop()
+        self.joint_stream.stop()
+        self.statusBar().showMessage(self.joint_stream.stats())
+        self.joint_stream = None
+        self.stream_label.clear()
+    
+    def poll_joint_stream(self):
+        """화면 갱신 주기 타이머 - 그동안 받은 패킷을 한 번의 편집으로 반영"""
+        stream = self.joint_stream
+        with self.viewport.editing_stage():
+            updated = stream.poll()
+        if updated:
+            self.viewport.update()
+        now = time.perf_counter()
+        if now - self.stream_stats_at >= 0.5:
+            self.stream_stats_at = now
+            self.stream_label.setText(stream.stats())
+    
+    def on_frame_swapped(self):
+        if self.joint_stream is not None:
+            self.joint_stream.presented()
+        capture = self.viewport.frame_capture
+        if capture is not None:
+            now = time.perf_counter()
+            if now - self.record_stats_at >= 0.5:
+                self.record_stats_at = now
+                self.record_label.setText(capture.stats())
+    
+    def ask_recording(self):
+        text, ok = QInputDialog.getText(
+            self, "Record Frames", "출력 경로 (디렉터리: PNG 시퀀스, .mp4/.mov/.mkv/.webm: ffmpeg, .rgba: 원시):",
+            QLineEdit.EchoMode.Normal, self.record_target
+        )
+        if ok and text.strip():
+            self.start_recording(text.strip())
+    
+    def start_recording(self, target):
+        """화면에 그려지는 프레임 녹화 시작 (T 키 턴테이블과 함께 사용)"""
+        try:
+            self.viewport.start_recording(target, self.record_fps)
+        except OSError as e:
+            self.statusBar().showMessage(f"녹화 시작 실패: {e}")
+            return
+        self.record_target = target
+        self.statusBar().showMessage(f"녹화 중: {self.viewport.frame_capture.writer.describe()}")
+    
+    def stop_recording(self):
+        stats = self.viewport.stop_recording()
+        if stats:
+            self.statusBar().showMessage(stats)
+        self.record_label.clear()
+    
+    def set_open_options(self, options):
+        """부분 로딩 옵션 변경 (메뉴 상태 동기화)"""
+        self.open_options = options
+        self.payloads_action.setChecked(not options.load_none)
+        self.statusBar().showMessage(f"로딩 옵션: {options.describe()} (Reload로 적용)")
+    
+    def _update_open_options(self, **changes):
+        values = self.open_options.to_dict()
+        values.update(changes)
+        self.set_open_options(StageOpenOptions(**values))
+    
+    def _ask_paths(self, title, label, current):
+        """공백/쉼표로 구분된 목록 입력 (취소 시 None)"""
+        text, ok = QInputDialog.getText(self, title, label, QLineEdit.EchoMode.Normal, " ".join(current))
+        if not ok:
+            return None
+        return text.replace(",", " ").split()
+    
+    def on_payloads_toggled(self, checked):
+        if checked == (not self.open_options.load_none):
+            return
+        # 페이로드를 다시 켜면 선택 로드 경로는 의미가 없으므로 비움
+        self._update_open_options(load_none=not checked,
+                                  load_paths=[] if checked else self.open_options.load_paths)
+    
+    def edit_population_mask(self):
+        paths = self._ask_paths("Population Mask", "합성할 프림 경로 (비우면 전체):",
+                                self.open_options.mask)
+        if paths is not None:
+            self._update_open_options(mask=paths)
+    
+    def edit_exclude_patterns(self):
+        patterns = self._ask_paths("Exclude Prims", "비활성화할 프림 이름/경로 패턴 (예: collisions):",
+                                   self.open_options.exclude)
+        if patterns is not None:
+            self._update_open_options(exclude=patterns)
+    
+    def cancel_loading(self):
+        self.viewport.cancel_loading()
+        self.hide_load_progress()
+        self.statusBar().showMessage("로드 취소됨")
+    
+    def hide_load_progress(self):
+        self.load_progress.hide()
+        self.cancel_load_button.hide()
+    
+    def on_load_progress(self, percent, message):
+        self.load_progress.setValue(percent)
+        self.statusBar().showMessage(message)
+    
+    def on_load_failed(self, message):
+        self.hide_load_progress()
+        self.statusBar().showMessage(f"로드 실패: {message}")
+    
+    def on_stage_loaded(self, result):
+        """로드된 스테이지로 계층 구조 패널 갱신"""
+        self.hide_load_progress()
+        self.disconnect_joint_stream()
+        self.hierarchy.update_hierarchy(result.stage)
+        if not result.options.is_default():
+            self.statusBar().showMessage(f"{self.statusBar().currentMessage()} [{result.options.describe()}]")
+        if self.pending_trajectory:
+            filepath, rate = self.pending_trajectory
+            self.pending_trajectory = None
+            self.load_trajectory_file(filepath, rate)
+        if self.pending_stream:
+            self.connect_joint_stream(self.pending_stream)
+            self.pending_stream = None
+        if self.pending_recording:
+            self.start_recording(self.pending_recording)
+            self.pending_recording = None
+    
+    def on_culling_changed(self, drawn, culled):
+        self.cull_label.setText(f"그리기 {drawn} / 컬링 {culled}")
+    
+    def on_first_frame(self, elapsed):
+        self.statusBar().showMessage(f"{self.statusBar().currentMessage()} (첫 프레임 {elapsed:.2f}s)")
+    
+    def on_stage_changed(self, changes):
+        """스테이지 편집 알림 - 계층/속성 패널의 영향받은 부분만 갱신 (리로드 없음)"""
+        self.hierarchy.apply_changes(changes)
+        prim_path = self.properties.prim_path
+        if prim_path and changes.affects(prim_path):
+            self.properties.show_prim_properties(self.viewport.stage, prim_path)
+    
+    def on_payloads_changed(self, message):
+        """계층 패널의 페이로드 작업 결과 표시 (로드/언로드는 드로우 캐시가 알림으로 반영)"""
+        total = self.hierarchy.payloads.total_estimate() if self.hierarchy.payloads else 0
+        self.statusBar().showMessage(f"{message} | 추정 메모리 {format_bytes(total)}")
+        self.viewport.update()
+    
+    def on_time_slider_changed(self, frame):
+        playback = self.viewport.playback
+        if frame != playback.frame:
+            self.viewport.seek(playback.start + frame)
+    
+    def on_loop_toggled(self, checked):
+        self.viewport.playback.loop = checked
+    
+    def on_time_changed(self, time_code):
+        """타임라인 표시 갱신 (범위는 스테이지가 바뀔 때마다 다시 설정)"""
+        playback = self.viewport.playback
+        self.time_slider.blockSignals(True)
+        self.time_slider.setRange(0, playback.frame_count - 1)
+        self.time_slider.setValue(playback.frame)
+        self.time_slider.blockSignals(False)
+        self.time_slider.setEnabled(playback.is_animated())
+        self.play_button.setEnabled(playback.is_animated())
+        self.time_label.setText(f"{time_code:g} / {playback.end:g}")
+    
+    def on_playback_changed(self, playing):
+        self.play_button.setText("Pause" if playing else "Play")
+        playback = self.viewport.playback
+        if not playing and playback.presented:
+            stats = playback.stats()
+            cache = self.viewport.draw_cache
+            if cache is not None and cache.prefetcher:
+                stats += f", {cache.prefetcher.stats()}, {cache.geometry_cache.stats()}"
+            self.statusBar().showMessage(f"재생 정지: {stats}")
+    
+    def closeEvent(self, event):
+        self.stop_recording()
+        self.disconnect_joint_stream()
+        self.viewport.stop_playback()
+        self.viewport.wait_for_loading()
+        self.hierarchy.wait_for_jobs()
+        self.viewport.profiler.close()
+        super().closeEvent(event)
     
     def on_scene_loaded(self, name):
         self.statusBar().showMessage(f"로드됨: {name}")
@@ -983,17 +1737,62 @@ class USDViewer(QMainWindow):
         self.viewport.update()
 
 
+def parse_args(argv=None):
+    """커맨드라인 인자 파싱 (Qt 인자는 그대로 통과)"""
+    parser = argparse.ArgumentParser(description="USD Hydra Viewer")
+    parser.add_argument("usd_file", nargs="?", help="열 USD 파일")
+    parser.add_argument("--profile-csv", metavar="PATH",
+                        help="프레임별 단계 시간을 CSV로 기록")
+    parser.add_argument("--geometry-cache-mb", type=int, metavar="MB",
+                        help="변형 메시 시간 샘플 캐시 메모리 상한 (기본 256)")
+    parser.add_argument("--trajectory", metavar="PATH",
+                        help="로드 후 재생할 관절 궤적 (CSV/.npy/.npz)")
+    parser.add_argument("--trajectory-rate", type=float, metavar="HZ",
+                        help="궤적 샘플링 주기 (시간 열이 없을 때, 기본 50)")
+    parser.add_argument("--stream", metavar="ADDRESS", nargs="?", const="udp://127.0.0.1:9870",
+                        help="로드 후 관절 상태 수신 (udp://host:port 또는 unix:///path)")
+    parser.add_argument("--record", metavar="PATH",
+                        help="로드 후 화면 프레임 녹화 (디렉터리: PNG 시퀀스, .mp4 등: ffmpeg, .rgba: 원시)")
+    parser.add_argument("--record-fps", type=float, default=DISPLAY_RATE, metavar="FPS",
+                        help=f"녹화 영상 프레임레이트 (기본 {DISPLAY_RATE})")
+    parser.add_argument("--turntable", type=float, nargs="?", const=12.0, metavar="SECONDS",
+                        help="시작 시 턴테이블 회전 (한 바퀴 시간, 기본 12초)")
+    if USD_AVAILABLE:
+        add_open_arguments(parser)
+    return parser.parse_known_args(argv)
+
+
 def main():
-    app = QApplication(sys.argv)
+    args, qt_args = parse_args()
+    app = QApplication(sys.argv[:1] + qt_args)
     app.setStyle('Fusion')
     
     viewer = USDViewer()
     
-    if len(sys.argv) > 1:
-        filepath = sys.argv[1]
+    if args.profile_csv:
+        viewer.viewport.profiler = FrameProfiler(csv_path=args.profile_csv)
+        print(f"프레임 통계 기록: {args.profile_csv}")
+    if args.geometry_cache_mb:
+        viewer.viewport.set_geometry_cache_bytes(args.geometry_cache_mb * 1024 * 1024)
+    viewer.record_fps = args.record_fps
+    if args.turntable:
+        viewer.viewport.turntable_period = args.turntable
+        viewer.viewport.toggle_turntable()
+    
+    if USD_AVAILABLE:
+        viewer.set_open_options(StageOpenOptions.from_args(args))
+    
+    if args.usd_file:
+        filepath = args.usd_file
         if Path(filepath).exists():
-            viewer.viewport.load_stage(filepath)
-            viewer.hierarchy.update_hierarchy(viewer.viewport.stage)
+            viewer.pending_trajectory = (
+                (args.trajectory, args.trajectory_rate) if args.trajectory else None
+            )
+            viewer.pending_stream = args.stream
+            viewer.pending_recording = args.record
+            viewer.load_file(filepath)
+    if args.record and not viewer.pending_recording:
+        viewer.start_recording(args.record)
     
     viewer.show()
     
@@ -1003,13 +1802,16 @@ def main():
   마우스 좌클릭 드래그: 회전
   마우스 우클릭 드래그: 패닝
   마우스 휠: 줌
-  
+
 단축키:
   F: 씬에 맞게 프레임
   G: 그리드 토글
   A: 좌표축 토글
   W: 드로우 모드 순환
   L: 조명 토글
+  S: 캐시 통계 출력
+  P: 프레임 통계 오버레이 토글
+  T: 턴테이블 토글 (File > Record Frames...로 녹화)
 ==========================
 """)
     
@@ -0,0 +1,101 @@
+"""
+Transform Cache - 프레임 단위 월드 변환 캐시
+============================================
+
+UsdGeom.XformCache를 감싸서 한 시간 코드 안에서 부모 체인
+(예: Go2 base → hip → thigh → calf) 변환을 한 번만 계산하도록 합니다.
+시간이 바뀌면 자동으로 비워지며, 적중/미스 통계를 제공합니다.
+"""
+
+from pxr import Usd, UsdGeom, Gf
+
+
+class TransformCache:
+    """UsdGeom.XformCache 기반 월드 변환 캐시 (적중 통계 포함)"""
+    
+    def __init__(self, time_code=None):
+        self.time_code = Usd.TimeCode.Default() if time_code is None else Usd.TimeCode(time_code)
+        self._xform_cache = UsdGeom.XformCache(self.time_code)
+        self._matrices = {}  # Sdf.Path -> Gf.Matrix4d
+        
+        self.hits = 0
+        self.misses = 0
+    
+    def set_time(self, time_code):
+        """시간 코드 변경 (변경된 경우에만 캐시 비움)"""
+        time_code = Usd.TimeCode(time_code)
+        if time_code == self.time_code:
+            return False
+        self.time_code = time_code
+        self._xform_cache.SetTime(time_code)
+        self._matrices.clear()
+        return True
+    
+    def clear(self):
+        """캐시 전체 비움 (스테이지 교체 등)"""
+        self._xform_cache.Clear()
+        self._matrices.clear()
+    
+    def invalidate(self, path, subtree=None):
+        """path 서브트리의 변환 무효화 (resync 시)
+        
+        Args:
+            subtree: path 아래의 현재 프림 경로 목록 (주면 캐시 전체를 훑지 않음).
+                삭제된 프림의 행렬은 조회되지 않고, 같은 경로에 프림이 다시 생기면
+                그 resync에서 지워지므로 현재 서브트리만 지워도 충분합니다.
+        """
+        # XformCache는 부분 무효화를 지원하지 않으므로 내부 캐시는 통째로 비움
+        self._xform_cache.Clear()
+        if subtree is None:
+            subtree = [p for p in self._matrices if p.HasPrefix(path)]
+        for p in subtree:
+            self._matrices.pop(p, None)
+    
+    def invalidate_matrices(self, paths):
+        """주어진 프림들의 월드 행렬만 제거 (xformOp 값 편집 시, paths는 편집된 서브트리)
+        
+        값만 바뀐 경우 XformCache의 변환 쿼리는 그대로 유효하므로 비우지 않습니다.
+        """
+        for path in paths:
+            self._matrices.pop(path, None)
+    
+    def get_world_matrix(self, prim):
+        """프림의 로컬→월드 변환 행렬 (Gf.Matrix4d)"""
+        path = prim.GetPath()
+        matrix = self._matrices.get(path)
+        if matrix is not None:
+            self.hits += 1
+            return matrix
+        
+        self.misses += 1
+        if prim.IsPseudoRoot():
+            matrix = Gf.Matrix4d(1.0)
+        else:
+            # 부모의 월드 행렬도 캐시를 통해 얻으므로 형제 링크끼리 체인을 공유
+            local, resets_stack = self._xform_cache.GetLocalTransformation(prim)
+            if resets_stack:
+                matrix = local
+            else:
+                matrix = local * self.get_world_matrix(prim.GetParent())
+        
+        self._matrices[path] = matrix
+        return matrix
+    
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+    
+    def stats(self):
+        """적중/미스 통계 딕셔너리"""
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+            'cached': len(self._matrices),
+        }
+    
+    def format_stats(self):
+        s = self.stats()
+        return (f"변환 캐시: 적중 {s['hits']} / 미스 {s['misses']} "
+                f"({s['hit_rate'] * 100:.1f}%), 항목 {s['cached']}")